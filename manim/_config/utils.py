@@ -289,6 +289,7 @@ class ManimConfig(MutableMapping):
         "pixel_width",
         "plugins",
         "preview",
+        "profile_frames",
         "progress_bar",
         "quality",
         "save_as_gif",
@@ -577,6 +578,7 @@ class ManimConfig(MutableMapping):
             "save_pngs",
             "save_as_gif",
             "save_sections",
+            "profile_frames",
             "preview",
             "show_in_file_browser",
             "log_to_file",
@@ -747,6 +749,7 @@ class ManimConfig(MutableMapping):
             "save_pngs",
             "save_as_gif",
             "save_sections",
+            "profile_frames",
             "write_all",
             "disable_caching",
             "format",
@@ -986,6 +989,15 @@ class ManimConfig(MutableMapping):
     def save_sections(self, value: bool) -> None:
         self._set_boolean("save_sections", value)
 
+    @property
+    def profile_frames(self) -> bool:
+        """Whether to measure the time spent rendering each frame, see :attr:`.Scene.profiler`."""
+        return self._d["profile_frames"]
+
+    @profile_frames.setter
+    def profile_frames(self, value: bool) -> None:
+        self._set_boolean("profile_frames", value)
+
     @property
     def enable_wireframe(self) -> bool:
         """Whether to enable wireframe debugging mode in opengl."""
@@ -163,4 +163,6 @@ class TracedPath(VMobject, metaclass=ConvertToOpenGL):
             self.time += dt
             if self.time - 1 > self.dissipating_time:
                 nppcc = self.n_points_per_curve
-                self.set_points(self.points[nppcc:])
+                # A view, so that the next points are appended to the same
+                # buffer instead of copying the whole path.
+                self.points = self.get_points()[nppcc:]
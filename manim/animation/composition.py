@@ -100,8 +100,8 @@ class AnimationGroup(Animation):
     def finish(self) -> None:
         for anim in self.animations:
             anim.finish()
-        self.anims_begun[:] = True
-        self.anims_finished[:] = True
+        self._num_begun = self._num_finished = len(self.animations)
+        self._active_indices.clear()
         if self.suspend_mobject_updating:
             self.group.resume_updating()
 
@@ -113,10 +113,22 @@ class AnimationGroup(Animation):
             anim.clean_up_from_scene(scene)
 
     def update_mobjects(self, dt: float) -> None:
-        for anim in self.anims_with_timings["anim"][
-            self.anims_begun & ~self.anims_finished
-        ]:
-            anim.update_mobjects(dt)
+        for index in sorted(self._active_indices):
+            self.animations[index].update_mobjects(dt)
+
+    @property
+    def anims_begun(self) -> np.ndarray:
+        """Which animations have begun at the time of the last interpolation."""
+        begun = np.zeros(len(self.animations), dtype=bool)
+        begun[self._start_order[: self._num_begun]] = True
+        return begun
+
+    @property
+    def anims_finished(self) -> np.ndarray:
+        """Which animations have finished at the time of the last interpolation."""
+        finished = np.zeros(len(self.animations), dtype=bool)
+        finished[self._end_order[: self._num_finished]] = True
+        return finished
 
     def init_run_time(self, run_time) -> float:
         """Calculates the run time of the animation, if different from ``run_time``.
@@ -147,15 +159,25 @@ class AnimationGroup(Animation):
         num_animations = run_times.shape[0]
         dtype = [("anim", "O"), ("start", "f8"), ("end", "f8")]
         self.anims_with_timings = np.zeros(num_animations, dtype=dtype)
-        self.anims_begun = np.zeros(num_animations, dtype=bool)
-        self.anims_finished = np.zeros(num_animations, dtype=bool)
-        if num_animations == 0:
-            return
+        if num_animations > 0:
+            lags = run_times[:-1] * self.lag_ratio
+            self.anims_with_timings["anim"] = self.animations
+            self.anims_with_timings["start"][1:] = np.add.accumulate(lags)
+            self.anims_with_timings["end"] = (
+                self.anims_with_timings["start"] + run_times
+            )
 
-        lags = run_times[:-1] * self.lag_ratio
-        self.anims_with_timings["anim"] = self.animations
-        self.anims_with_timings["start"][1:] = np.add.accumulate(lags)
-        self.anims_with_timings["end"] = self.anims_with_timings["start"] + run_times
+        # The animations sorted by start and by end time: at any time, those
+        # which have begun and those which have finished are a prefix of
+        # these orders. The animations in between are kept in a set, so that
+        # interpolating does not go through all of them.
+        self._start_order = np.argsort(self.anims_with_timings["start"], kind="stable")
+        self._sorted_starts = self.anims_with_timings["start"][self._start_order]
+        self._end_order = np.argsort(self.anims_with_timings["end"], kind="stable")
+        self._sorted_ends = self.anims_with_timings["end"][self._end_order]
+        self._num_begun = 0
+        self._num_finished = 0
+        self._active_indices: set[int] = set()
 
     def interpolate(self, alpha: float) -> None:
         # Note, if the run_time of AnimationGroup has been
@@ -166,13 +188,21 @@ class AnimationGroup(Animation):
         anim_group_time = self.rate_func(alpha) * self.max_end_time
         time_goes_back = anim_group_time < self.anim_group_time
 
-        # Only update ongoing animations
-        awt = self.anims_with_timings
-        new_begun = anim_group_time >= awt["start"]
-        new_finished = anim_group_time > awt["end"]
-        to_update = awt[
-            (self.anims_begun | new_begun) & (~self.anims_finished | ~new_finished)
-        ]
+        # Only update ongoing animations, and those which have begun or
+        # finished since the last interpolation, once more.
+        num_begun = np.searchsorted(self._sorted_starts, anim_group_time, "right")
+        num_finished = np.searchsorted(self._sorted_ends, anim_group_time, "left")
+        active = self._active_indices
+        active.update(self._start_order[self._num_begun : num_begun].tolist())
+        active.update(self._end_order[num_finished : self._num_finished].tolist())
+        indices = np.fromiter(sorted(active), dtype=int, count=len(active))
+        active.difference_update(
+            self._end_order[self._num_finished : num_finished].tolist()
+        )
+        active.difference_update(
+            self._start_order[num_begun : self._num_begun].tolist()
+        )
+        to_update = self.anims_with_timings[indices]
 
         run_times = to_update["end"] - to_update["start"]
         with_zero_run_time = run_times == 0
@@ -187,8 +217,8 @@ class AnimationGroup(Animation):
             anim_to_update.interpolate(sub_alpha)
 
         self.anim_group_time = anim_group_time
-        self.anims_begun = new_begun
-        self.anims_finished = new_finished
+        self._num_begun = num_begun
+        self._num_finished = num_finished
 
 
 class Succession(AnimationGroup):
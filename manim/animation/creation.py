@@ -85,7 +85,7 @@ if TYPE_CHECKING:
     from manim.mobject.text.text_mobject import Text
     from manim.scene.scene import Scene
 
-from manim.constants import RIGHT, TAU
+from manim.constants import RIGHT, TAU, RendererType
 from manim.mobject.opengl.opengl_surface import OpenGLSurface
 from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
 from manim.utils.color import ManimColor
@@ -95,7 +95,11 @@ from ..animation.animation import Animation
 from ..animation.composition import Succession
 from ..mobject.mobject import Group, Mobject
 from ..mobject.types.vectorized_mobject import VMobject
-from ..utils.bezier import integer_interpolate
+from ..utils.bezier import (
+    _integer_interpolate_arrays,
+    integer_interpolate,
+    partial_bezier_curves,
+)
 from ..utils.rate_functions import double_smooth, linear
 
 
@@ -121,8 +125,29 @@ class ShowPartial(Animation):
         pointwise = getattr(mobject, "pointwise_become_partial", None)
         if not callable(pointwise):
             raise NotImplementedError("This animation is not defined for this Mobject.")
+        self._partial_curves: _PartialCurves | None = None
+        self._partial_family: list[Mobject] | None = None
         super().__init__(mobject, **kwargs)
 
+    def begin(self) -> None:
+        self._partial_curves = self._partial_family = None
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        partial = _PartialCurves.get_for(self, 1, ShowPartial)
+        if partial is None:
+            super().interpolate_mobject(alpha)
+            return
+        num_members = len(partial.members)
+        bounds = np.array(
+            [
+                self._get_bounds(self.get_sub_alpha(alpha, i, num_members))
+                for i in range(num_members)
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+        partial.become_partial(range(num_members), bounds[:, 0], bounds[:, 1])
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -247,6 +272,8 @@ class DrawBorderThenFill(Animation):
         self.draw_border_animation_config = draw_border_animation_config
         self.fill_animation_config = fill_animation_config
         self.outline = self.get_outline()
+        self._partial_curves: _PartialCurves | None = None
+        self._partial_family: list[Mobject] | None = None
 
     def _typecheck_input(self, vmobject: VMobject | OpenGLVMobject) -> None:
         if not isinstance(vmobject, (VMobject, OpenGLVMobject)):
@@ -256,6 +283,7 @@ class DrawBorderThenFill(Animation):
 
     def begin(self) -> None:
         self.outline = self.get_outline()
+        self._partial_curves = self._partial_family = None
         super().begin()
 
     def get_outline(self) -> Mobject:
@@ -275,6 +303,27 @@ class DrawBorderThenFill(Animation):
     def get_all_mobjects(self) -> Sequence[Mobject]:
         return [*super().get_all_mobjects(), self.outline]
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        partial = _PartialCurves.get_for(self, 2, DrawBorderThenFill)
+        if partial is None:
+            super().interpolate_mobject(alpha)
+            return
+        # Draw the borders of all submobjects in that phase at once.
+        families = list(self.get_all_families_zipped())
+        drawn = []
+        upper = []
+        for i, (submobject, starting_submobject, outline) in enumerate(families):
+            sub_alpha = self.get_sub_alpha(alpha, i, len(families))
+            index, subalpha = integer_interpolate(0, 2, sub_alpha)
+            if index == 0:
+                drawn.append(i)
+                upper.append(subalpha)
+            else:
+                submobject.interpolate(outline, starting_submobject, subalpha)
+        partial.become_partial(drawn, 0, np.array(upper, dtype=float))
+        for i in drawn:
+            families[i][0].match_style(families[i][2])
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -493,6 +542,119 @@ class SpiralIn(Animation):
             shape.set_stroke(opacity=new_stroke_opacity)
 
 
+class _PartialCurves:
+    """The curves of the submobjects with points of a :class:`ShowPartial` or
+    :class:`DrawBorderThenFill`, packed into one array so that the portions
+    of all of them can be computed at once.
+
+    Replaces :meth:`.VMobject.pointwise_become_partial` for the members of
+    the family of the animated mobject, with the corresponding submobjects
+    of another mobject of the animation as the sources.
+    """
+
+    __slots__ = ("members", "curves", "num_curves", "offsets")
+
+    def __init__(self, members: list[VMobject], sources: list[VMobject]) -> None:
+        nppc = members[0].n_points_per_curve
+        self.members = members
+        self.curves = np.concatenate(
+            [source.get_points() for source in sources]
+        ).reshape(-1, nppc, members[0].dim)
+        self.num_curves = np.array(
+            [len(source.get_points()) // nppc for source in sources]
+        )
+        self.offsets = np.cumsum(self.num_curves) - self.num_curves
+
+    @classmethod
+    def get_for(
+        cls, animation: ShowPartial | DrawBorderThenFill, source_index: int, base: type
+    ) -> _PartialCurves | None:
+        """Return the packed curves of the animation, with the mobjects at
+        ``source_index`` in its zipped families as sources, or ``None`` if the
+        submobjects have to be interpolated one by one.
+
+        The curves are packed when first needed after :meth:`.Animation.begin`,
+        and again only if the family of the animated mobject changes.
+        """
+        if config.renderer != RendererType.CAIRO:
+            return None
+        family = animation.mobject._get_family()
+        if family is animation._partial_family:
+            return animation._partial_curves
+        animation._partial_family = family
+        animation._partial_curves = None
+        animation_class = type(animation)
+        if not (
+            animation_class.interpolate_submobject is base.interpolate_submobject
+            and animation_class.get_all_families_zipped
+            is Animation.get_all_families_zipped
+        ):
+            return None
+        families = list(animation.get_all_families_zipped())
+        if not families:
+            return None
+        members = [mobs[0] for mobs in families]
+        sources = [mobs[source_index] for mobs in families]
+        nppc = members[0].n_points_per_curve
+        for member, source in zip(members, sources):
+            if not (
+                isinstance(member, VMobject)
+                and isinstance(source, VMobject)
+                and type(member).pointwise_become_partial
+                is VMobject.pointwise_become_partial
+                and member.n_points_per_curve == source.n_points_per_curve == nppc
+                and len(source.get_points()) % nppc == 0
+            ):
+                return None
+        animation._partial_curves = cls(members, sources)
+        return animation._partial_curves
+
+    def become_partial(
+        self,
+        indices: Iterable[int],
+        lower: float | np.ndarray,
+        upper: float | np.ndarray,
+    ) -> None:
+        """Set the members at ``indices`` to the portions of their sources
+        between ``lower`` and ``upper``, like
+        :meth:`.VMobject.pointwise_become_partial` does.
+        """
+        indices = np.fromiter(indices, dtype=int)
+        if not len(indices):
+            return
+        num_curves = self.num_curves[indices]
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), indices.shape)
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), indices.shape)
+        lower_index, lower_residue = _integer_interpolate_arrays(num_curves, lower)
+        upper_index, upper_residue = _integer_interpolate_arrays(num_curves, upper)
+        lengths = np.where(
+            num_curves > 0, np.maximum(upper_index - lower_index + 1, 0), 0
+        )
+        starts = np.cumsum(lengths) - lengths
+        curve_indices = np.repeat(
+            self.offsets[indices] + lower_index - starts, lengths
+        ) + np.arange(lengths.sum())
+        curves = self.curves[curve_indices]
+
+        # The first curve of each portion starts at the lower residue, and
+        # its last curve ends at the upper residue.
+        single = lengths == 1
+        several = lengths > 1
+        first = starts[single | several]
+        last = (starts + lengths - 1)[several]
+        ends = np.where(single, upper_residue, 1)[single | several]
+        curves[np.concatenate([first, last])] = partial_bezier_curves(
+            curves[np.concatenate([first, last])],
+            np.concatenate([lower_residue[single | several], np.zeros(len(last))]),
+            np.concatenate([ends, upper_residue[several]]),
+        )
+
+        points = curves.reshape(-1, curves.shape[-1])
+        nppc = curves.shape[1]
+        for i, start, length in zip(indices, starts * nppc, lengths * nppc):
+            self.members[i].points = points[start : start + length]
+
+
 class ShowIncreasingSubsets(Animation):
     """Show one submobject at a time, leaving all previous ones displayed on screen.
 
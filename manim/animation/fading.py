@@ -88,8 +88,12 @@ class _Fade(Transform):
         faded_mobject = self.mobject.copy()
         faded_mobject.fade(1)
         direction_modifier = -1 if fadeIn and not self.point_target else 1
-        faded_mobject.shift(self.shift_vector * direction_modifier)
-        faded_mobject.scale(self.scale_factor)
+        # Leaving the points untouched lets Transform only interpolate the
+        # colors of the submobjects.
+        if np.any(self.shift_vector):
+            faded_mobject.shift(self.shift_vector * direction_modifier)
+        if self.scale_factor != 1:
+            faded_mobject.scale(self.scale_factor)
         return faded_mobject
 
 
@@ -539,7 +539,8 @@ class Wiggle(Animation):
         starting_submobject: Mobject,
         alpha: float,
     ) -> None:
-        submobject.points[:, :] = starting_submobject.points
+        submobject.points[:, :] = starting_submobject.get_points()
+        submobject.refresh_bounding_box()
         submobject.scale(
             interpolate(1, self.scale_value, there_and_back(alpha)),
             about_point=self.get_scale_about_point(),
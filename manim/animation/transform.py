@@ -27,6 +27,7 @@ __all__ = [
 ]
 
 import inspect
+import itertools as it
 import types
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any, Callable
@@ -45,10 +46,14 @@ from ..constants import (
     RendererType,
 )
 from ..mobject.mobject import Group, Mobject
+from ..mobject.types.vectorized_mobject import PackedVGroup, VMobject
+from ..utils.bezier import interpolate
 from ..utils.paths import path_along_arc, path_along_circles
 from ..utils.rate_functions import smooth, squish_rate_func
 
 if TYPE_CHECKING:
+    from manim.typing import Point3D_Array
+
     from ..scene.scene import Scene
 
 
@@ -139,6 +144,9 @@ class Transform(Animation):
         self.path_arc_axis: np.ndarray = path_arc_axis
         self.path_arc_centers: np.ndarray = path_arc_centers
         self.path_arc: float = path_arc
+        self._packed_families: _PackedFamilies | None = None
+        self._packed_family: list[Mobject] | None = None
+        self._style_only_submobjects: set[int] = set()
 
         # path_func is a property a few lines below so it doesn't need to be set in any case
         if path_func is not None:
@@ -149,6 +157,9 @@ class Transform(Animation):
                 self.path_arc_centers,
                 self.path_arc_axis,
             )
+            # With one center per point, the path depends on the submobject.
+            self._pointwise_path_func = np.shape(self.path_arc_centers) == (3,)
+            self._path_func_keeps_still_points = False
 
         self.replace_mobject_with_target_in_scene: bool = (
             replace_mobject_with_target_in_scene
@@ -169,6 +180,8 @@ class Transform(Animation):
             arc_angle=self._path_arc,
             axis=self.path_arc_axis,
         )
+        self._pointwise_path_func = True
+        self._path_func_keeps_still_points = True
 
     @property
     def path_func(
@@ -189,6 +202,8 @@ class Transform(Animation):
     ) -> None:
         if path_func is not None:
             self._path_func = path_func
+            self._pointwise_path_func = False
+            self._path_func_keeps_still_points = False
 
     def begin(self) -> None:
         # Use a copy of target_mobject for the align_data
@@ -202,7 +217,77 @@ class Transform(Animation):
             self.mobject.align_data_and_family(self.target_copy)
         else:
             self.mobject.align_data(self.target_copy)
+        # The starting mobject only exists after beginning, which already
+        # interpolates all submobjects once.
+        self._packed_families = self._packed_family = None
+        self._style_only_submobjects = set()
         super().begin()
+        self._style_only_submobjects = self._get_style_only_submobjects()
+        self._packed_families = self._packed_family = None
+
+    def _get_style_only_submobjects(self) -> set[int]:
+        """Return the ids of the submobjects whose points are the same in the
+        starting mobject and the target, so that only their style has to be
+        interpolated.
+        """
+        # Updaters of the mobject could move points which are not reset.
+        if not (
+            config.renderer == RendererType.CAIRO
+            and self._path_func_keeps_still_points
+            and self.suspend_mobject_updating
+        ):
+            return set()
+        return {
+            id(mob)
+            for mob, start, target in zip(
+                self.mobject.family_members_with_points(),
+                self.starting_mobject.family_members_with_points(),
+                self.target_copy.family_members_with_points(),
+            )
+            if type(mob).interpolate is Mobject.interpolate
+            # The updaters of the starting mobject and the target are called
+            # during the animation, and could move their points.
+            and not any(
+                getattr(member, "updaters", None) for member in (mob, start, target)
+            )
+            and _have_same_points(mob, start)
+            and _have_same_points(start, target)
+        }
+
+    def create_starting_mobject(self) -> Mobject | _FamilyState:
+        if self._can_use_family_state():
+            # The submobjects are only read by Mobject.interpolate, which does
+            # not need a copy of the whole mobject.
+            return _FamilyState(self.mobject)
+        return super().create_starting_mobject()
+
+    def _can_use_family_state(self) -> bool:
+        """Return whether a :class:`_FamilyState` of :attr:`mobject` can be
+        used as the starting mobject instead of a copy.
+        """
+        animation_class = type(self)
+        if not (
+            config.renderer == RendererType.CAIRO
+            # Overrides may use the starting mobject like any other mobject.
+            and animation_class.create_starting_mobject
+            is Transform.create_starting_mobject
+            and animation_class.interpolate is Transform.interpolate
+            and animation_class.interpolate_mobject is Transform.interpolate_mobject
+            and animation_class.interpolate_submobject
+            is Transform.interpolate_submobject
+            and animation_class.get_all_families_zipped
+            is Transform.get_all_families_zipped
+            and not isinstance(self.mobject, PackedVGroup)
+            # The updaters of a copy would be called during the animation.
+            and not self.mobject.has_family_updaters()
+        ):
+            return False
+        return all(
+            isinstance(mob, VMobject)
+            and type(mob).interpolate is VMobject.interpolate
+            and type(mob).interpolate_color is VMobject.interpolate_color
+            for mob in self.mobject.family_members_with_points()
+        )
 
     def create_target(self) -> Mobject:
         # Has no meaningful effect here, but may be useful
@@ -232,6 +317,138 @@ class Transform(Animation):
             return zip(*(mob.get_family() for mob in mobs))
         return zip(*(mob.family_members_with_points() for mob in mobs))
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        if (
+            config.renderer == RendererType.CAIRO
+            and isinstance(self.mobject, PackedVGroup)
+            and self.lag_ratio == 0
+            and type(self).interpolate_submobject is Transform.interpolate_submobject
+        ):
+            # Without lag, all submobjects share the same progress.
+            self.mobject.interpolate_family(
+                self.starting_mobject,
+                self.target_copy,
+                self.get_sub_alpha(alpha, 0, 1),
+                self.path_func,
+            )
+            return
+        packed = self._get_packed_families()
+        if packed is not None:
+            self._interpolate_packed_families(packed, self.get_sub_alpha(alpha, 0, 1))
+            return
+        super().interpolate_mobject(alpha)
+
+    def _get_packed_families(self) -> _PackedFamilies | None:
+        """Return the points and colors of the families of the starting and
+        the target mobject packed into contiguous arrays, or ``None`` if the
+        submobjects have to be interpolated one by one.
+
+        They are packed once per animation, and again whenever the family of
+        :attr:`mobject` changed.
+        """
+        if config.renderer != RendererType.CAIRO:
+            return None
+        family = self.mobject._get_family()
+        if family is self._packed_family:
+            return self._packed_families
+        self._packed_family = family
+        self._packed_families = None
+        if not (
+            self.lag_ratio == 0
+            and self._pointwise_path_func
+            and type(self).interpolate_submobject is Transform.interpolate_submobject
+            and type(self).get_all_families_zipped is Transform.get_all_families_zipped
+        ):
+            return None
+        zipped = list(self.get_all_families_zipped())
+        if not zipped or not all(
+            isinstance(start, (VMobject, _VMobjectState))
+            and isinstance(target, VMobject)
+            and isinstance(mob, VMobject)
+            and type(mob).interpolate is VMobject.interpolate
+            and type(mob).interpolate_color is VMobject.interpolate_color
+            for mob, start, target in zipped
+        ):
+            return None
+        members, starts, targets = zip(*zipped)
+        arrays = {}
+        for name in _PackedFamilies.array_names:
+            start_arrays = [np.asarray(getattr(mob, name)) for mob in starts]
+            target_arrays = [np.asarray(getattr(mob, name)) for mob in targets]
+            if any(
+                start.shape != target.shape or start.ndim != 2
+                for start, target in zip(start_arrays, target_arrays)
+            ):
+                return None
+            # Like the scalars below, arrays which do not change are left as
+            # they are.
+            if name == "_points":
+                changed = [
+                    id(mob) not in self._style_only_submobjects for mob in members
+                ]
+            else:
+                changed = [
+                    not np.array_equal(start, target)
+                    for start, target in zip(start_arrays, target_arrays)
+                ]
+            if not any(changed):
+                continue
+            changed_members = list(it.compress(members, changed))
+            start_arrays = list(it.compress(start_arrays, changed))
+            target_arrays = list(it.compress(target_arrays, changed))
+            lengths = [len(array) for array in start_arrays]
+            arrays[name] = (
+                changed_members,
+                np.concatenate(start_arrays, dtype=float),
+                np.concatenate(target_arrays, dtype=float),
+                np.cumsum([0, *lengths]),
+            )
+        scalars = {}
+        for name in _PackedFamilies.scalar_names:
+            try:
+                start_values = np.array([getattr(mob, name) for mob in starts], float)
+                target_values = np.array([getattr(mob, name) for mob in targets], float)
+            except (TypeError, ValueError):
+                return None
+            if start_values.shape != target_values.shape:
+                return None
+            # Values which do not change are not set on every frame.
+            if not np.array_equal(start_values, target_values):
+                scalars[name] = (start_values, target_values)
+
+        packed = _PackedFamilies()
+        packed.members = members
+        packed.arrays = arrays
+        packed.scalars = scalars
+        self._packed_families = packed
+        return packed
+
+    def _interpolate_packed_families(
+        self, packed: _PackedFamilies, alpha: float
+    ) -> None:
+        """Interpolate all submobjects at once, like :meth:`.Mobject.interpolate`
+        does for each of them.
+        """
+        for name, (members, start, target, bounds) in packed.arrays.items():
+            if name == "_points":
+                values = self.path_func(start, target, alpha)
+            elif alpha == 1.0:
+                values = target.copy()
+            else:
+                values = interpolate(start, target, alpha)
+            for mob, begin, end in zip(members, bounds, bounds[1:]):
+                if name == "_points":
+                    mob.points = values[begin:end]
+                else:
+                    setattr(mob, name, values[begin:end])
+        for name, (start, target) in packed.scalars.items():
+            values = target if alpha == 1.0 else interpolate(start, target, alpha)
+            for mob, value in zip(packed.members, values):
+                if isinstance(value, np.ndarray):
+                    setattr(mob, name, value.copy())
+                else:
+                    setattr(mob, name, float(value))
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -239,7 +456,88 @@ class Transform(Animation):
         target_copy: Mobject,
         alpha: float,
     ) -> Transform:
-        submobject.interpolate(starting_submobject, target_copy, alpha, self.path_func)
+        if id(submobject) in self._style_only_submobjects:
+            submobject.interpolate_color(starting_submobject, target_copy, alpha)
+        else:
+            submobject.interpolate(
+                starting_submobject, target_copy, alpha, self.path_func
+            )
+        return self
+
+
+def _have_same_points(
+    mobject: Mobject | _VMobjectState, other: Mobject | _VMobjectState
+) -> bool:
+    points = mobject.get_points()
+    other_points = other.get_points()
+    return points is other_points or np.array_equal(points, other_points)
+
+
+class _PackedFamilies:
+    """The arrays interpolated by a :class:`Transform`, see
+    :meth:`Transform._get_packed_families`.
+    """
+
+    __slots__ = ("members", "arrays", "scalars")
+
+    array_names = ("_points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+    scalar_names = (
+        "stroke_width",
+        "background_stroke_width",
+        "sheen_direction",
+        "sheen_factor",
+    )
+
+
+class _VMobjectState:
+    """The points and style of a :class:`.VMobject`, as read by
+    :meth:`.Mobject.interpolate`.
+
+    The points are shared with the mobject, just like copies of the mobject
+    share them, see :attr:`.Mobject.points`.
+    """
+
+    __slots__ = (
+        "_points",
+        *_PackedFamilies.array_names[1:],
+        *_PackedFamilies.scalar_names,
+    )
+
+    def __init__(self, vmobject: VMobject) -> None:
+        points = vmobject.get_points()
+        if points.flags.writeable:
+            vmobject._points_shared = True
+            points = points.view()
+            points.flags.writeable = False
+        self._points = points
+        for name in self.__slots__[1:]:
+            value = getattr(vmobject, name)
+            if isinstance(value, np.ndarray):
+                value = value.copy()
+            setattr(self, name, value)
+
+    def get_points(self) -> Point3D_Array:
+        return self._points
+
+    def get_num_points(self) -> int:
+        return len(self._points)
+
+
+class _FamilyState:
+    """The state of the submobjects with points of a mobject, which
+    :class:`Transform` uses as its starting mobject instead of a copy
+    when possible.
+    """
+
+    def __init__(self, mobject: Mobject) -> None:
+        self.members = [
+            _VMobjectState(mob) for mob in mobject.family_members_with_points()
+        ]
+
+    def family_members_with_points(self) -> list[_VMobjectState]:
+        return self.members
+
+    def update(self, dt: float = 0, recursive: bool = True) -> _FamilyState:
         return self
 
 
@@ -21,6 +21,7 @@ import numpy as np
 
 from manim.constants import DEGREES, RIGHT
 from manim.mobject.mobject import Mobject
+from manim.mobject.value_tracker import record_value_trackers
 from manim.opengl import OpenGLMobject
 from manim.utils.space_ops import normalize
 
@@ -60,7 +61,9 @@ def f_always(method: Callable[[Mobject], None], *arg_generators, **kwargs) -> Mo
     return mobject
 
 
-def always_redraw(func: Callable[[], Mobject]) -> Mobject:
+def always_redraw(
+    func: Callable[[], Mobject], memoize: bool = False, cache_size: int = 64
+) -> Mobject:
     """Redraw the mobject constructed by a function every frame.
 
     This function returns a mobject with an attached updater that
@@ -72,6 +75,19 @@ def always_redraw(func: Callable[[], Mobject]) -> Mobject:
     func
         A function without (required) input arguments that returns
         a mobject.
+    memoize
+        If ``True``, the :class:`~.ValueTracker` instances whose values ``func``
+        reads are recorded, and the mobject is only redrawn once one of these
+        values changed. The results for the last ``cache_size`` combinations of
+        values are kept, so that values which occur again (for instance when
+        a tracker moves back and forth) reuse the mobject drawn for them. This
+        requires ``func`` to depend on nothing but these values; if it reads no
+        value tracker at all, the mobject is redrawn every frame.
+
+        Mobjects created from the same (La)TeX string reuse their parsed SVG
+        anyway, as does :class:`~.Text` with ``use_svg_cache=True``.
+    cache_size
+        The number of results kept if ``memoize`` is ``True``.
 
     Examples
     --------
@@ -100,8 +116,41 @@ def always_redraw(func: Callable[[], Mobject]) -> Mobject:
                 self.add(ax, sine, point, tangent)
                 self.play(alpha.animate.set_value(1), rate_func=linear, run_time=2)
     """
-    mob = func()
-    mob.add_updater(lambda _: mob.become(func()))
+    if not memoize:
+        mob = func()
+        mob.add_updater(lambda _: mob.become(func()))
+        return mob
+
+    def draw() -> tuple[Mobject, tuple]:
+        with record_value_trackers() as trackers:
+            result = func()
+        return result, get_key(trackers)
+
+    def get_key(trackers) -> tuple:
+        return tuple((tracker, tracker.get_value()) for tracker in trackers)
+
+    mob, key = draw()
+    results = {key: mob.copy()}
+
+    def redraw(mob: Mobject) -> None:
+        nonlocal key
+        if not key:
+            result, key = draw()
+        else:
+            new_key = get_key(tracker for tracker, _ in key)
+            if new_key == key:
+                return
+            result = results.get(new_key)
+            if result is None:
+                result, new_key = draw()
+            key = new_key
+        if key not in results:
+            if len(results) >= cache_size:
+                del results[next(iter(results))]
+            results[key] = result
+        mob.become(result)
+
+    mob.add_updater(redraw)
     return mob
 
 
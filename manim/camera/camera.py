@@ -22,11 +22,12 @@ from ..constants import *
 from ..mobject.mobject import Mobject
 from ..mobject.types.image_mobject import AbstractImageMobject
 from ..mobject.types.point_cloud_mobject import PMobject
-from ..mobject.types.vectorized_mobject import VMobject
+from ..mobject.types.vectorized_mobject import PackedVGroup, VMobject
 from ..utils.color import ManimColor, ParsableManimColor, color_to_int_rgba
 from ..utils.family import extract_mobject_family_members
 from ..utils.images import get_full_raster_image_path
 from ..utils.iterables import list_difference_update
+from ..utils.profiler import FrameProfiler, measure
 from ..utils.space_ops import angle_of_vector
 
 LINE_JOIN_MAP = {
@@ -67,6 +68,9 @@ class Camera:
         to be set.
     """
 
+    #: Measures the time spent per display function, see :attr:`.Scene.profiler`.
+    profiler: FrameProfiler | None = None
+
     def __init__(
         self,
         background_image: str | None = None,
@@ -193,6 +197,7 @@ class Camera:
             When mobject is not an instance of a class that can be rendered.
         """
         self.display_funcs = {
+            PackedVGroup: self.display_multiple_packed_vgroups,
             VMobject: self.display_multiple_vectorized_mobjects,
             PMobject: self.display_multiple_point_cloud_mobjects,
             AbstractImageMobject: self.display_multiple_image_mobjects,
@@ -523,9 +528,69 @@ class Camera:
         # VMobject], [PMobject, PMobject], and [VMobject].  This must be done
         # without altering their order.  it.groupby computes exactly this
         # partition while at the same time preserving order.
+        mobjects = list(mobjects)
+        packed_vgroups = [
+            mob
+            for mob in extract_mobject_family_members(mobjects)
+            if isinstance(mob, PackedVGroup)
+        ]
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        if packed_vgroups:
+            mobjects = self.gather_packed_vgroups(mobjects, packed_vgroups)
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
-            self.display_funcs[group_type](list(group), self.pixel_array)
+            func = self.display_funcs[group_type]
+            with measure(self.profiler, "capture_mobjects", func.__name__):
+                func(list(group), self.pixel_array)
+
+    def gather_packed_vgroups(
+        self, mobjects: list[Mobject], packed_vgroups: list[PackedVGroup]
+    ) -> list[Mobject]:
+        """Replace the members of each :class:`~.PackedVGroup` in a list of
+        mobjects to display with the group itself, so that it is displayed in
+        one pass.
+
+        This only happens when the members with points appear in the list as
+        one run, in the order of their packed arrays.
+
+        Parameters
+        ----------
+        mobjects
+            The mobjects to display, as returned by :meth:`get_mobjects_to_display`.
+        packed_vgroups
+            The packed groups in the families of the displayed mobjects.
+
+        Returns
+        -------
+        list
+            The mobjects to display.
+        """
+        indices = {id(mob): i for i, mob in enumerate(mobjects)}
+        runs = {}
+        for packed_vgroup in packed_vgroups:
+            members = [
+                mob for mob in packed_vgroup.get_packed_members() if mob.has_points()
+            ]
+            start = indices.get(id(members[0])) if members else None
+            if start is None or mobjects[start : start + len(members)] != members:
+                continue
+            # Packed groups nested into another one are displayed along with it.
+            end = start + len(members)
+            if not any(
+                s <= start < e or start <= s < end for s, (_, e) in runs.items()
+            ):
+                runs[start] = (packed_vgroup, end)
+        if not runs:
+            return mobjects
+        result = []
+        i = 0
+        while i < len(mobjects):
+            if i in runs:
+                packed_vgroup, i = runs[i]
+                result.append(packed_vgroup)
+            else:
+                result.append(mobjects[i])
+                i += 1
+        return result
 
     # Methods associated with svg rendering
 
@@ -646,7 +711,62 @@ class Camera:
         for vmobject in vmobjects:
             self.display_vectorized(vmobject, ctx)
 
-    def display_vectorized(self, vmobject: VMobject, ctx: cairo.Context):
+    def display_multiple_packed_vgroups(
+        self, packed_vgroups: list[PackedVGroup], pixel_array: np.ndarray
+    ):
+        """Displays multiple PackedVGroups in the pixel_array, transforming the
+        points of each group in a single step.
+
+        Parameters
+        ----------
+        packed_vgroups
+            list of the PackedVGroups to display
+        pixel_array
+            The pixel array
+        """
+        ctx = self.get_cairo_context(pixel_array)
+        for packed_vgroup in packed_vgroups:
+            members = packed_vgroup.get_packed_members()
+            points = packed_vgroup.get_packed_points()
+            if (
+                not self.can_display_packed_vgroup(packed_vgroup)
+                or any(vmobject.get_background_image() for vmobject in members)
+                or not np.all(np.isfinite(points))
+            ):
+                self.display_multiple_vectorized_mobjects(
+                    [vmobject for vmobject in members if vmobject.has_points()],
+                    pixel_array,
+                )
+                continue
+            points = self.transform_points_pre_display(packed_vgroup, points)
+            end = 0
+            for vmobject in members:
+                start, end = end, end + vmobject.get_num_points()
+                if start < end:
+                    self.display_vectorized(vmobject, ctx, points[start:end])
+
+    def can_display_packed_vgroup(self, packed_vgroup: PackedVGroup) -> bool:
+        """Whether the points of all members of a PackedVGroup can be
+        transformed along with the group by :meth:`transform_points_pre_display`.
+
+        Parameters
+        ----------
+        packed_vgroup
+            The PackedVGroup
+
+        Returns
+        -------
+        bool
+            True for this camera, which treats all points alike.
+        """
+        return True
+
+    def display_vectorized(
+        self,
+        vmobject: VMobject,
+        ctx: cairo.Context,
+        points: np.ndarray | None = None,
+    ):
         """Displays a VMobject in the cairo context
 
         Parameters
@@ -655,19 +775,27 @@ class Camera:
             The Vectorized Mobject to display
         ctx
             The cairo context to use.
+        points
+            The points of the VMobject, already transformed by
+            :meth:`transform_points_pre_display`, by default None
 
         Returns
         -------
         Camera
             The camera object
         """
-        self.set_cairo_context_path(ctx, vmobject)
+        self.set_cairo_context_path(ctx, vmobject, points)
         self.apply_stroke(ctx, vmobject, background=True)
         self.apply_fill(ctx, vmobject)
         self.apply_stroke(ctx, vmobject)
         return self
 
-    def set_cairo_context_path(self, ctx: cairo.Context, vmobject: VMobject):
+    def set_cairo_context_path(
+        self,
+        ctx: cairo.Context,
+        vmobject: VMobject,
+        points: np.ndarray | None = None,
+    ):
         """Sets a path for the cairo context with the vmobject passed
 
         Parameters
@@ -676,13 +804,17 @@ class Camera:
             The cairo context
         vmobject
             The VMobject
+        points
+            The points of the VMobject, already transformed by
+            :meth:`transform_points_pre_display`, by default None
 
         Returns
         -------
         Camera
             Camera object after setting cairo_context_path
         """
-        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        if points is None:
+            points = self.transform_points_pre_display(vmobject, vmobject.get_points())
         # TODO, shouldn't this be handled in transform_points_pre_display?
         # points = points - self.get_frame_center()
         if len(points) == 0:
@@ -695,8 +827,9 @@ class Camera:
             ctx.new_sub_path()
             start = subpath[0]
             ctx.move_to(*start[:2])
-            for _p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+            # The handles and end anchors of all the curves, as Python floats.
+            for p1, p2, p3 in quads[:, 1:, :2].tolist():
+                ctx.curve_to(*p1, *p2, *p3)
             if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
                 ctx.close_path()
         return self
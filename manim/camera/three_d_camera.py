@@ -358,6 +358,14 @@ class ThreeDCamera(Camera):
         else:
             return self.project_points(points)
 
+    def can_display_packed_vgroup(self, packed_vgroup):  # NOTE : DocStrings From parent
+        # Fixed mobjects are each transformed on their own.
+        return not any(
+            mob in self.fixed_orientation_mobjects
+            or mob in self.fixed_in_frame_mobjects
+            for mob in [packed_vgroup, *packed_vgroup.get_packed_members()]
+        )
+
     def add_fixed_orientation_mobjects(
         self,
         *mobjects: Mobject,
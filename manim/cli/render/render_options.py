@@ -194,6 +194,13 @@ render_options = option_group(
         is_flag=True,
         help="Save section videos in addition to movie file.",
     ),
+    option(
+        "--profile_frames",
+        default=None,
+        is_flag=True,
+        help="Measure the time spent rendering each frame and write a trace.json "
+        "and a summary to the profiles folder of the media directory.",
+    ),
     option(
         "-t",
         "--transparent",
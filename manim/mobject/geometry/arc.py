@@ -42,6 +42,7 @@ __all__ = [
     "ArcPolygonFromArcs",
 ]
 
+import functools
 import itertools
 import warnings
 from typing import TYPE_CHECKING, cast
@@ -71,6 +72,7 @@ if TYPE_CHECKING:
     from manim.mobject.text.tex_mobject import SingleStringMathTex, Tex
     from manim.mobject.text.text_mobject import Text
     from manim.typing import (
+        CubicSpline,
         Point3D,
         Point3DLike,
         QuadraticSpline,
@@ -334,38 +336,39 @@ class Arc(TipableVMobject):
         super().__init__(**kwargs)
 
     def generate_points(self) -> None:
-        self._set_pre_positioned_points()
-        self.scale(self.radius, about_point=ORIGIN)
-        self.shift(self.arc_center)
+        # Place the points of the unit arc, instead of scaling and shifting them.
+        self.points = (
+            self.radius
+            * Arc._get_unit_arc_points(
+                self.num_components, self.angle, self.start_angle
+            )
+            + self.arc_center
+        )
 
     # Points are set a bit differently when rendering via OpenGL.
     # TODO: refactor Arc so that only one strategy for setting points
     # has to be used.
     def init_points(self) -> None:
         self.set_points(
-            Arc._create_quadratic_bezier_points(
+            self.radius
+            * Arc._create_quadratic_bezier_points(
                 angle=self.angle,
                 start_angle=self.start_angle,
                 n_components=self.num_components,
-            ),
+            )
+            + self.arc_center,
         )
-        self.scale(self.radius, about_point=ORIGIN)
-        self.shift(self.arc_center)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _create_quadratic_bezier_points(
         angle: float, start_angle: float = 0, n_components: int = 8
     ) -> QuadraticSpline:
-        samples = np.array(
-            [
-                [np.cos(a), np.sin(a), 0]
-                for a in np.linspace(
-                    start_angle,
-                    start_angle + angle,
-                    2 * n_components + 1,
-                )
-            ],
-        )
+        # The points are cached, so they must not be modified.
+        a = np.linspace(start_angle, start_angle + angle, 2 * n_components + 1)
+        samples = np.zeros((2 * n_components + 1, 3))
+        samples[:, 0] = np.cos(a)
+        samples[:, 1] = np.sin(a)
         theta = angle / n_components
         samples[1::2] /= np.cos(theta / 2)
 
@@ -373,31 +376,38 @@ class Arc(TipableVMobject):
         points[0::3] = samples[0:-1:2]
         points[1::3] = samples[1::2]
         points[2::3] = samples[2::2]
+        points.setflags(write=False)
         return points
 
-    def _set_pre_positioned_points(self) -> None:
-        anchors = np.array(
-            [
-                np.cos(a) * RIGHT + np.sin(a) * UP
-                for a in np.linspace(
-                    self.start_angle,
-                    self.start_angle + self.angle,
-                    self.num_components,
-                )
-            ],
-        )
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_unit_arc_points(
+        num_components: int, angle: float, start_angle: float
+    ) -> CubicSpline:
+        """Return the points of an arc of the unit circle centered at the origin.
+
+        The points are cached, so they must not be modified.
+        """
+        a = np.linspace(start_angle, start_angle + angle, num_components)
+        anchors = np.zeros((num_components, 3))
+        anchors[:, 0] = np.cos(a)
+        anchors[:, 1] = np.sin(a)
         # Figure out which control points will give the
         # Appropriate tangent lines to the circle
-        d_theta = self.angle / (self.num_components - 1.0)
+        d_theta = angle / (num_components - 1.0)
         tangent_vectors = np.zeros(anchors.shape)
         # Rotate all 90 degrees, via (x, y) -> (-y, x)
         tangent_vectors[:, 1] = anchors[:, 0]
         tangent_vectors[:, 0] = -anchors[:, 1]
         # Use tangent vectors to deduce anchors
         factor = 4 / 3 * np.tan(d_theta / 4)
-        handles1 = anchors[:-1] + factor * tangent_vectors[:-1]
-        handles2 = anchors[1:] - factor * tangent_vectors[1:]
-        self.set_anchors_and_handles(anchors[:-1], handles1, handles2, anchors[1:])
+        points = np.empty((4 * (num_components - 1), 3))
+        points[0::4] = anchors[:-1]
+        points[1::4] = anchors[:-1] + factor * tangent_vectors[:-1]
+        points[2::4] = anchors[1:] - factor * tangent_vectors[1:]
+        points[3::4] = anchors[1:]
+        points.setflags(write=False)
+        return points
 
     def get_arc_center(self, warning: bool = True) -> Point3D:
         """Looks at the normals to the first two
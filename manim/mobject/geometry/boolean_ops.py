@@ -6,16 +6,22 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 from pathops import Path as SkiaPath
-from pathops import PathVerb, difference, intersection, union, xor
+from pathops import PathOp, PathVerb, difference, op, xor
 
 from manim import config
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 from manim.mobject.types.vectorized_mobject import VMobject
+from manim.utils.bezier import interpolate
 
 if TYPE_CHECKING:
     from typing import Any
 
-    from manim.typing import Point2DLike_Array, Point3D_Array, Point3DLike_Array
+    from manim.typing import (
+        CubicBezierPath,
+        Point2DLike_Array,
+        Point3D_Array,
+        Point3DLike_Array,
+    )
 
 from ...constants import RendererType
 
@@ -98,19 +104,107 @@ class _BooleanOps(VMobject, metaclass=ConvertToOpenGL):
                 if vmobject.consider_points_equals(subpath[0], subpath[-1]):
                     path.close()
         elif config.renderer == RendererType.CAIRO:
-            subpaths = vmobject.gen_subpaths_from_points_2d(points)  # type: ignore[assignment]
-            for subpath in subpaths:
-                quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
-                start = subpath[0]
-                path.moveTo(*start[:2])
-                for _p0, p1, p2, p3 in quads:
-                    path.cubicTo(*p1[:2], *p2[:2], *p3[:2])
-
-                if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            # Convert all the coordinates to floats at once, so that only
+            # plain lists are indexed per curve.
+            nppcc = vmobject.n_points_per_cubic_curve
+            starts, stops = vmobject._get_subpath_bounds(points, two_d=True)
+            coordinates = points[:, :2].tolist()
+            for start, stop in zip(starts, stops):
+                path.moveTo(*coordinates[start])
+                for i in range(start, stop - nppcc + 1, nppcc):
+                    path.cubicTo(
+                        *coordinates[i + 1], *coordinates[i + 2], *coordinates[i + 3]
+                    )
+
+                if vmobject.consider_points_equals_2d(points[start], points[stop - 1]):
                     path.close()
 
         return path
 
+    def _reduce_skia_paths(self, paths: list[SkiaPath], operator: PathOp) -> SkiaPath:
+        """Combines SkiaPaths with a boolean operation, pairing them up in a
+        balanced tree so that each path takes part in a logarithmic number of
+        operations.
+
+        Parameters
+        ----------
+        paths:
+            The SkiaPaths to combine.
+        operator:
+            The boolean operation, which must be associative.
+
+        Returns
+        -------
+        SkiaPath
+            The combined path.
+        """
+        while len(paths) > 1:
+            paths = [
+                op(one, two, operator) for one, two in zip(paths[0::2], paths[1::2])
+            ] + paths[len(paths) - len(paths) % 2 :]
+        return paths[0]
+
+    def _get_cubic_points_from_skia_path(self, path: SkiaPath) -> CubicBezierPath:
+        """Returns the points of the cubic Bézier curves of a SkiaPath, as
+        adding its verbs one by one to a :class:`~.VMobject` would give.
+
+        Parameters
+        ----------
+        path:
+            The SkiaPath to convert.
+
+        Returns
+        -------
+        CubicBezierPath
+            The points of the curves, built for all the verbs at once.
+        """
+        verbs = np.array(path.verbs, dtype=int)
+        if len(verbs) == 0:
+            return np.zeros((0, 3))
+        # The number of points of each verb, or -1 if it isn't supported.
+        num_points = np.full(max(PathVerb) + 1, -1)
+        num_points[[PathVerb.MOVE, PathVerb.LINE, PathVerb.QUAD]] = [1, 1, 2]
+        num_points[[PathVerb.CUBIC, PathVerb.CLOSE]] = [3, 0]
+        counts = num_points[verbs]
+        if np.any(counts < 0):
+            raise Exception(f"Unsupported: {PathVerb(verbs[counts < 0][0])}")
+
+        points = np.zeros((len(path.points), 3))
+        points[:, :2] = np.reshape(path.points, (-1, 2))
+        stops = np.cumsum(counts)
+        is_move = verbs == PathVerb.MOVE
+        is_close = verbs == PathVerb.CLOSE
+
+        # The point each verb goes to. Closing goes back to the last move.
+        ends = points[stops - 1]
+        last_move = np.maximum.accumulate(np.where(is_move, np.arange(len(verbs)), 0))
+        ends[is_close] = ends[last_move[is_close]]
+
+        # Each verb but a move is a curve from where the previous verb went to.
+        curves = np.repeat(ends[:, np.newaxis], 4, axis=1)
+        curves[1:, 0] = ends[:-1]
+        curves[is_move, 0] = ends[is_move]
+        is_line = (verbs == PathVerb.LINE) | is_close
+        curves[is_line, 1:] = interpolate(
+            curves[is_line, :1],
+            ends[is_line, np.newaxis],
+            self._bezier_t_values[1:, np.newaxis],
+        )
+        is_quad = verbs == PathVerb.QUAD
+        handles = points[stops[is_quad] - 2]
+        curves[is_quad, 1] = 2 / 3 * handles + 1 / 3 * curves[is_quad, 0]
+        curves[is_quad, 2] = 2 / 3 * handles + 1 / 3 * ends[is_quad]
+        is_cubic = verbs == PathVerb.CUBIC
+        curves[is_cubic, 1] = points[stops[is_cubic] - 3]
+        curves[is_cubic, 2] = points[stops[is_cubic] - 2]
+
+        # A move starts the curve after it, but a move followed by another one
+        # is closed by a curve on the spot. A final move is never iterated.
+        keep = np.zeros(curves.shape[:2], dtype=bool)
+        keep[~is_move] = True
+        keep[:-1][is_move[:-1] & is_move[1:]] = True
+        return curves[keep]
+
     def _convert_skia_path_to_vmobject(self, path: SkiaPath) -> VMobject:
         """Converts SkiaPath back to VMobject.
         Parameters
@@ -124,6 +218,10 @@ class _BooleanOps(VMobject, metaclass=ConvertToOpenGL):
             The converted VMobject.
         """
         vmobject = self
+        if config.renderer == RendererType.CAIRO:
+            vmobject.append_points(self._get_cubic_points_from_skia_path(path))
+            return vmobject
+
         current_path_start = np.array([0, 0, 0])
 
         for path_verb, points in path:
@@ -184,12 +282,12 @@ class Union(_BooleanOps):
         if len(vmobjects) < 2:
             raise ValueError("At least 2 mobjects needed for Union.")
         super().__init__(**kwargs)
-        paths = []
-        for vmobject in vmobjects:
-            paths.append(self._convert_vmobject_to_skia_path(vmobject))
-        outpen = SkiaPath()
-        union(paths, outpen.getPen())
-        self._convert_skia_path_to_vmobject(outpen)
+        paths = [
+            self._convert_vmobject_to_skia_path(vmobject) for vmobject in vmobjects
+        ]
+        self._convert_skia_path_to_vmobject(
+            self._reduce_skia_paths(paths, PathOp.UNION)
+        )
 
 
 class Difference(_BooleanOps):
@@ -266,23 +364,12 @@ class Intersection(_BooleanOps):
             raise ValueError("At least 2 mobjects needed for Intersection.")
 
         super().__init__(**kwargs)
-        outpen = SkiaPath()
-        intersection(
-            [self._convert_vmobject_to_skia_path(vmobjects[0])],
-            [self._convert_vmobject_to_skia_path(vmobjects[1])],
-            outpen.getPen(),
+        paths = [
+            self._convert_vmobject_to_skia_path(vmobject) for vmobject in vmobjects
+        ]
+        self._convert_skia_path_to_vmobject(
+            self._reduce_skia_paths(paths, PathOp.INTERSECTION)
         )
-        new_outpen = outpen
-        for _i in range(2, len(vmobjects)):
-            new_outpen = SkiaPath()
-            intersection(
-                [outpen],
-                [self._convert_vmobject_to_skia_path(vmobjects[_i])],
-                new_outpen.getPen(),
-            )
-            outpen = new_outpen
-
-        self._convert_skia_path_to_vmobject(outpen)
 
 
 class Exclusion(_BooleanOps):
@@ -389,24 +389,18 @@ class RegularPolygram(Polygram):
 
         # Utility function for generating the individual
         # polygon vertices.
-        def gen_polygon_vertices(start_angle: float | None) -> tuple[list[Any], float]:
+        def gen_polygon_vertices(
+            start_angle: float | None,
+        ) -> tuple[Point3D_Array, float]:
             reg_vertices, start_angle = regular_vertices(
                 num_vertices,
                 radius=radius,
                 start_angle=start_angle,
             )
 
-            vertices = []
-            i = 0
-            while True:
-                vertices.append(reg_vertices[i])
-
-                i += density
-                i %= num_vertices
-                if i == 0:
-                    break
-
-            return vertices, start_angle
+            # Visit every vertex, stepping by the density.
+            order = np.arange(num_vertices) * density % num_vertices
+            return reg_vertices[order], start_angle
 
         first_group, self.start_angle = gen_polygon_vertices(start_angle)
         vertex_groups = [first_group]
@@ -827,23 +821,28 @@ class ConvexHull(Polygram):
     def __init__(
         self, *points: Point3DLike, tolerance: float = 1e-5, **kwargs: Any
     ) -> None:
-        # Build Convex Hull
         array = np.array(points)[:, :2]
-        hull = QuickHull(tolerance)
-        hull.build(array)
-
-        # Extract Vertices
-        facets = set(hull.facets) - hull.removed
-        facet = facets.pop()
-        subfacets = list(facet.subfacets)
-        while len(subfacets) <= len(facets):
-            sf = subfacets[-1]
-            (facet,) = hull.neighbors[sf] - {facet}
-            (sf,) = facet.subfacets - {sf}
-            subfacets.append(sf)
+        if len(array) > 2 and np.linalg.matrix_rank(array - array[0]) < 2:
+            # QuickHull rejects points on a line, whose hull is the segment
+            # between the extreme points (or a single point).
+            _, _, vh = np.linalg.svd(array - array[0])
+            positions = (array - array[0]) @ vh[0]
+            coordinates = array[np.unique([np.argmin(positions), np.argmax(positions)])]
+        else:
+            # Build Convex Hull
+            hull = QuickHull(tolerance)
+            hull.build(array)
+
+            # Extract Vertices
+            # The hull is convex, so its vertices are in order around an
+            # internal point.
+            coordinates = array[np.unique(hull.simplices[~hull.is_removed])]
+            centered = coordinates - hull.internal
+            coordinates = coordinates[
+                np.argsort(np.arctan2(centered[:, 1], centered[:, 0]))
+            ]
 
         # Setup Vertices as Point3D
-        coordinates = np.vstack([sf.coordinates for sf in subfacets])
         vertices = np.hstack((coordinates, np.zeros((len(coordinates), 1))))
 
         # Call Polygram
@@ -15,7 +15,7 @@ import sys
 import types
 import warnings
 from collections.abc import Iterable
-from functools import partialmethod, reduce
+from functools import partialmethod, reduce, update_wrapper
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -57,11 +57,16 @@ if TYPE_CHECKING:
     )
 
     from ..animation.animation import Animation
+    from ..utils.profiler import FrameProfiler
 
     TimeBasedUpdater: TypeAlias = Callable[["Mobject", float], object]
     NonTimeBasedUpdater: TypeAlias = Callable[["Mobject"], object]
     Updater: TypeAlias = NonTimeBasedUpdater | TimeBasedUpdater
 
+# Attribute values which are never modified in place, so that copies of a
+# mobject can share them instead of copying them.
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, ManimColor)
+
 
 class Mobject:
     """Mathematical Object: base class for objects that can be displayed on screen.
@@ -84,6 +89,9 @@ class Mobject:
     """
 
     animation_overrides = {}
+    # The kind of bounding box (see :meth:`_get_boundary_points`) matching
+    # :meth:`get_points_defining_boundary`, or ``None`` if there is none.
+    _boundary_kind: str | None = "points"
 
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
@@ -95,6 +103,12 @@ class Mobject:
         ] = {}
         cls._add_intrinsic_animation_overrides()
         cls._original__init__ = cls.__init__
+        if (
+            "get_points_defining_boundary" in cls.__dict__
+            and "_boundary_kind" not in cls.__dict__
+        ):
+            # The cached bounding boxes cannot know about custom boundaries.
+            cls._boundary_kind = None
 
     def __init__(
         self,
@@ -109,8 +123,14 @@ class Mobject:
         self.target = target
         self.z_index = z_index
         self.point_hash = None
+        self.parents: list[Mobject] = []
+        self._family: list[Mobject] | None = None
+        self._bounding_boxes: dict[str, Point3D_Array] = {}
+        self._updater_calls: list[tuple[Updater, bool]] | None = None
+        self._family_has_updaters: bool | None = None
+        self._family_has_dependent_updaters: bool | None = None
         self.submobjects = []
-        self.updaters: list[Updater] = []
+        self.updaters = []
         self.updating_suspended = False
         self.color = ManimColor.parse(color)
 
@@ -398,14 +418,92 @@ class Mobject:
         cls = self.__class__
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
+        points = self._points
+        if isinstance(points, np.ndarray) and points.flags.writeable:
+            # The points are shared until either mobject accesses them through
+            # Mobject.points, see there: the copy gets a read-only view, and
+            # the original copies them before they can be modified.
+            self._points_shared = True
+            points = points.view()
+            points.flags.writeable = False
         for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, clone_from_id))
+            if k in (
+                "parents",
+                "_family",
+                "_bounding_boxes",
+                "_submobjects",
+                "_updaters",
+                "_updater_calls",
+                "_family_has_updaters",
+                "_family_has_dependent_updaters",
+            ):
+                # Set below, but reserve the key now: the hashes used for
+                # caching depend on the order of the attributes.
+                result.__dict__[k] = [] if k == "_submobjects" else None
+                continue
+            if k == "_points" and isinstance(v, np.ndarray):
+                v = points
+            elif k == "_points_shared":
+                v = False
+            elif not isinstance(v, _IMMUTABLE_TYPES):
+                v = copy.deepcopy(v, clone_from_id)
+            setattr(result, k, v)
+        # Parents outside of the copied tree are not copied along; the
+        # copied parents link themselves when their submobjects are set.
+        result.parents = []
+        result._family = None
+        result._bounding_boxes = {}
+        result._updater_calls = None
+        result._family_has_updaters = None
+        result._family_has_dependent_updaters = None
+        result.updaters = copy.deepcopy(list(self.updaters), clone_from_id)
+        result.submobjects = [
+            copy.deepcopy(sm, clone_from_id) for sm in self.submobjects
+        ]
+        # The bounding boxes are never modified in place, so they can be shared.
+        result._bounding_boxes = dict(self._bounding_boxes)
         result.original_id = str(id(self))
         return result
 
     def __repr__(self) -> str:
         return str(self.name)
 
+    @property
+    def points(self) -> Point3D_Array:
+        """The points of the mobject.
+
+        Since the returned array may be modified in place, accessing it
+        discards the cached bounding boxes, just like assigning new points.
+        After modifying an array obtained earlier, call
+        :meth:`refresh_bounding_box`.
+
+        Copies of a mobject share their points with the original until one of
+        them accesses this property, which then makes its own copy of the
+        array. Use :meth:`get_points` to read the points without doing so.
+        """
+        points = self._points
+        if self._points_shared or (
+            isinstance(points, np.ndarray) and not points.flags.writeable
+        ):
+            points = self._points = np.array(points)
+            self._points_shared = False
+        self._invalidate_bounding_box()
+        return points
+
+    @points.setter
+    def points(self, points: Point3D_Array) -> None:
+        self._points = points
+        self._points_shared = False
+        self._invalidate_bounding_box()
+
+    def get_points(self) -> Point3D_Array:
+        """Return the points of the mobject, possibly shared with its copies.
+
+        Unlike :attr:`points`, this never copies the array, which therefore
+        must not be modified in place.
+        """
+        return self._points
+
     def reset_points(self) -> None:
         """Sets :attr:`points` to be an empty array."""
         self.points = np.zeros((0, self.dim))
@@ -893,18 +991,44 @@ class Mobject:
         :meth:`get_updaters`
 
         """
-        if self.updating_suspended:
+        if self.updating_suspended or not self.has_family_updaters():
             return self
-        for updater in self.updaters:
-            if "dt" in inspect.signature(updater).parameters:
-                updater(self, dt)
-            else:
-                updater(self)
+        self._call_updaters(dt)
         if recursive:
             for submob in self.submobjects:
                 submob.update(dt, recursive)
         return self
 
+    def _call_updaters(self, dt: float, profiler: FrameProfiler | None = None) -> int:
+        """Call the updaters of ``self``, but not those of its submobjects.
+
+        Parameters
+        ----------
+        dt
+            The parameter ``dt`` to pass to time based updaters.
+        profiler
+            If given, the time spent in each updater is measured with it.
+
+        Returns
+        -------
+        :class:`int`
+            The number of updaters which were skipped because the mobjects
+            they depend on did not change.
+        """
+        skipped = 0
+        for updater, takes_dt in self._get_updater_calls():
+            if isinstance(updater, _DependentUpdater) and not updater.needs_update():
+                skipped += 1
+                continue
+            args = (self, dt) if takes_dt else (self,)
+            if profiler is None:
+                updater(*args)
+            else:
+                name = getattr(updater, "__qualname__", type(updater).__qualname__)
+                with profiler.measure("updater", name):
+                    updater(*args)
+        return skipped
+
     def get_time_based_updaters(self) -> list[TimeBasedUpdater]:
         """Return all updaters using the ``dt`` parameter.
 
@@ -921,11 +1045,7 @@ class Mobject:
         :meth:`has_time_based_updater`
 
         """
-        return [
-            updater
-            for updater in self.updaters
-            if "dt" in inspect.signature(updater).parameters
-        ]
+        return [updater for updater, takes_dt in self._get_updater_calls() if takes_dt]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -941,9 +1061,7 @@ class Mobject:
         :meth:`get_time_based_updaters`
 
         """
-        return any(
-            "dt" in inspect.signature(updater).parameters for updater in self.updaters
-        )
+        return any(takes_dt for _, takes_dt in self._get_updater_calls())
 
     def get_updaters(self) -> list[Updater]:
         """Return all updaters.
@@ -964,11 +1082,98 @@ class Mobject:
     def get_family_updaters(self) -> list[Updater]:
         return list(it.chain(*(sm.get_updaters() for sm in self.get_family())))
 
+    def get_updater_dependencies(self) -> list[Mobject]:
+        """Return the mobjects the updaters of ``self`` declared to depend on.
+
+        Returns
+        -------
+        List[:class:`Mobject`]
+            The ``depends_on`` mobjects passed to :meth:`add_updater`.
+        """
+        dependencies = [
+            updater.dependencies
+            for updater in self.updaters
+            if isinstance(updater, _DependentUpdater)
+        ]
+        return remove_list_redundancies(list(it.chain(*dependencies)))
+
+    def has_family_updaters(self) -> bool:
+        """Test if ``self`` or any of its submobjects has an updater.
+
+        The result is cached and recomputed only after the updaters or the
+        submobjects of a member of the family change.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if :meth:`update` has any updater to call, ``False``
+            otherwise.
+        """
+        if self._family_has_updaters is None:
+            # Every submobject caches its own status, even if an earlier one
+            # already has updaters; _invalidate_updater_status relies on it.
+            sub_statuses = [sm.has_family_updaters() for sm in self.submobjects]
+            self._family_has_updaters = len(self.updaters) > 0 or any(sub_statuses)
+            self._family_has_dependent_updaters = any(
+                isinstance(updater, _DependentUpdater) for updater in self.updaters
+            ) or any(sm._family_has_dependent_updaters for sm in self.submobjects)
+        return self._family_has_updaters
+
+    def _has_family_dependent_updaters(self) -> bool:
+        """Test if ``self`` or any of its submobjects has an updater added with
+        ``depends_on``, cached along with :meth:`has_family_updaters`.
+        """
+        self.has_family_updaters()
+        return bool(self._family_has_dependent_updaters)
+
+    @property
+    def updaters(self) -> list[Updater]:
+        """The update functions of this mobject.
+
+        The list may be modified in place; doing so keeps the cached
+        dispatch information used by :meth:`update` up to date.
+        """
+        return self._updaters
+
+    @updaters.setter
+    def updaters(self, updater_list: Iterable[Updater]) -> None:
+        self._updaters = _UpdaterList(self, updater_list)
+        self._updaters_changed()
+
+    def _updaters_changed(self) -> None:
+        """Discard the cached dispatch information of the updaters."""
+        self._updater_calls = None
+        self._invalidate_updater_status()
+
+    def _invalidate_updater_status(self) -> None:
+        """Discard the cached :meth:`has_family_updaters` result of ``self``
+        and of all of its ancestors.
+        """
+        if self._family_has_updaters is None:
+            # The ancestors of a mobject without a cached status never
+            # have a cached status themselves.
+            return
+        self._family_has_updaters = None
+        self._family_has_dependent_updaters = None
+        for parent in self.parents:
+            parent._invalidate_updater_status()
+
+    def _get_updater_calls(self) -> list[tuple[Updater, bool]]:
+        """Return the updaters together with whether they take a ``dt``
+        parameter, inspecting each updater only once.
+        """
+        if self._updater_calls is None:
+            self._updater_calls = [
+                (updater, _takes_dt(updater)) for updater in self.updaters
+            ]
+        return self._updater_calls
+
     def add_updater(
         self,
         update_function: Updater,
         index: int | None = None,
         call_updater: bool = False,
+        depends_on: Iterable[Mobject] | None = None,
     ) -> Self:
         """Add an update function to this mobject.
 
@@ -990,6 +1195,13 @@ class Mobject:
         call_updater
             Whether or not to call the updater initially. If ``True``, the updater will
             be called using ``dt=0``.
+        depends_on
+            The mobjects (for instance :class:`~.ValueTracker` instances) the updater
+            reads. If given, the updater is only called if the points of one of these
+            mobjects (or of their submobjects) changed since its previous call, and a
+            :class:`~.Scene` calls it after the updaters of these mobjects.
+            Skipped calls are lost, so time based updaters do not receive the time
+            that passed in between.
 
         Returns
         -------
@@ -1024,19 +1236,47 @@ class Mobject:
                     self.add(square)
                     self.wait(2)
 
+        .. manim:: DependentUpdater
+
+            class DependentUpdater(Scene):
+                def construct(self):
+                    tracker = ValueTracker(0)
+                    dot = Dot()
+                    label = DecimalNumber()
+
+                    # The label is only updated while the tracker changes
+                    label.add_updater(
+                        lambda mobject: mobject.set_value(tracker.get_value()).next_to(dot),
+                        depends_on=[tracker],
+                    )
+                    dot.add_updater(lambda mobject: mobject.set_x(tracker.get_value()))
+                    self.add(dot, label)
+                    self.play(tracker.animate.set_value(3))
+                    self.wait()
+
         See also
         --------
         :meth:`get_updaters`
         :meth:`remove_updater`
         :class:`~.UpdateFromFunc`
         """
+        if depends_on is not None:
+            update_function = _DependentUpdater(update_function, depends_on)
+        calls = self._updater_calls
+        takes_dt = _takes_dt(update_function)
         if index is None:
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
+        if calls is not None:
+            # Extend the dispatch information instead of inspecting all
+            # updaters again.
+            calls.insert(
+                len(calls) if index is None else index, (update_function, takes_dt)
+            )
+            self._updater_calls = calls
         if call_updater:
-            parameters = inspect.signature(update_function).parameters
-            if "dt" in parameters:
+            if takes_dt:
                 update_function(self, 0)
             else:
                 update_function(self)
@@ -1219,10 +1459,12 @@ class Mobject:
         :meth:`move_to`
         """
         total_vector = reduce(op.add, vectors)
-        for mob in self.family_members_with_points():
-            mob.points = mob.points.astype("float")
-            mob.points += total_vector
 
+        def func(points: Point3D_Array) -> Point3D_Array:
+            points += total_vector
+            return points
+
+        self._apply_to_family_points(func)
         return self
 
     def scale(self, scale_factor: float, **kwargs) -> Self:
@@ -1316,11 +1558,37 @@ class Mobject:
         self.apply_points_function_about_point(func, **kwargs)
         return self
 
-    def apply_function(self, function: MappingFunction, **kwargs) -> Self:
+    def apply_function(
+        self, function: MappingFunction, vectorized: bool = False, **kwargs
+    ) -> Self:
+        """Apply a function to every point of the mobject and its submobjects.
+
+        Parameters
+        ----------
+        function
+            The function mapping a point to its new position.
+        vectorized
+            Whether ``function`` accepts an array of shape ``(N, 3)`` holding
+            many points and maps each of them; it is then called once instead
+            of once per point.
+        kwargs
+            Additional keyword arguments passed to
+            :meth:`apply_points_function_about_point`. By default, the function
+            is applied about the origin.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+        """
         # Default to applying matrix about the origin, not mobjects center
         if len(kwargs) == 0:
             kwargs["about_point"] = ORIGIN
 
+        if vectorized:
+            self.apply_points_function_about_point(function, **kwargs)
+            return self
+
         def multi_mapping_function(points: Point3D_Array) -> Point3D_Array:
             result: Point3D_Array = np.apply_along_axis(function, 1, points)
             return result
@@ -1411,16 +1679,61 @@ class Mobject:
         about_point: Point3DLike | None = None,
         about_edge: Vector3D | None = None,
     ) -> Self:
+        """Apply a function to the points of the whole family, relative to a
+        point.
+
+        The points of all members of the family are passed to ``func`` in a
+        single array, so ``func`` has to map each point on its own.
+
+        Parameters
+        ----------
+        func
+            The function mapping an array of points to their new positions.
+        about_point
+            The point which is the origin for ``func``.
+        about_edge
+            If ``about_point`` is not given, the critical point in this
+            direction is used, see :meth:`get_critical_point`. Defaults to the
+            center.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+        """
         if about_point is None:
             if about_edge is None:
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
-        for mob in self.family_members_with_points():
-            mob.points -= about_point
-            mob.points = func(mob.points)
-            mob.points += about_point
+
+        def func_about_point(points: Point3D_Array) -> Point3D_Array:
+            points -= about_point
+            points = func(points)
+            points += about_point
+            return points
+
+        self._apply_to_family_points(func_about_point)
         return self
 
+    def _apply_to_family_points(self, func: MultiMappingFunction) -> None:
+        """Call ``func`` once with the points of all members of the family,
+        concatenated into a new array which ``func`` may modify, and hand each
+        member its part of the result.
+        """
+        mobs = self.family_members_with_points()
+        if not mobs:
+            return
+        points = func(
+            np.concatenate([mob.get_points() for mob in mobs], dtype=float)
+            if len(mobs) > 1
+            else mobs[0].get_points().astype(float)
+        )
+        end = 0
+        for mob in mobs:
+            start = end
+            end += mob.get_num_points()
+            mob.points = points[start:end]
+
     def pose_at_angle(self, **kwargs):
         self.rotate(TAU / 14, RIGHT + UP, **kwargs)
         return self
@@ -1985,17 +2298,17 @@ class Mobject:
         """Find the min or max value from a dimension across all points in this and submobjects."""
         assert dim >= 0
         assert dim <= 2
-        if len(self.submobjects) == 0 and len(self.points) == 0:
+        if len(self.submobjects) == 0 and len(self.get_points()) == 0:
             # If we have no points and no submobjects, return 0 (e.g. center)
             return 0
 
         # If we do not have points (but do have submobjects)
         # use only the points from those.
-        if len(self.points) == 0:  # noqa: SIM108
+        if len(self.get_points()) == 0:  # noqa: SIM108
             rv = None
         else:
             # Otherwise, be sure to include our own points
-            rv = reduce_func(self.points[:, dim])
+            rv = reduce_func(self.get_points()[:, dim])
         # Recursively ask submobjects (if any) for the biggest/
         # smallest dimension they have and compare it to the return value.
         for mobj in self.submobjects:
@@ -2007,7 +2320,7 @@ class Mobject:
         return [
             submob
             for submob in self.submobjects
-            if len(submob.submobjects) != 0 or len(submob.points) != 0
+            if len(submob.submobjects) != 0 or len(submob.get_points()) != 0
         ]
 
     def get_merged_array(self, array_attr: str) -> np.ndarray:
@@ -2016,7 +2329,10 @@ class Mobject:
         May contain duplicates; the order is in a depth-first (pre-order)
         traversal of the submobjects.
         """
-        result = getattr(self, array_attr)
+        # Read the points without copying them, see :attr:`points`.
+        result = (
+            self.get_points() if array_attr == "points" else getattr(self, array_attr)
+        )
         for submob in self.submobjects:
             result = np.append(result, submob.get_merged_array(array_attr), axis=0)
         return result
@@ -2035,11 +2351,100 @@ class Mobject:
         return self.get_all_points()
 
     def get_num_points(self) -> int:
-        return len(self.points)
+        return len(self._points)
+
+    def _get_boundary_points(self, kind: str) -> Point3D_Array:
+        """Return the points of ``self``, without its submobjects, that enter
+        the bounding box of the given kind.
+
+        ``"points"`` takes all points, as :meth:`get_points_defining_boundary`
+        does, while ``"length"`` makes mobjects without points and submobjects
+        count as the origin, as :meth:`reduce_across_dimension` does.
+        """
+        if kind == "length" and len(self._points) == 0 and not self.submobjects:
+            return np.zeros((1, self.dim))
+        return self._points
+
+    def _get_bounding_box(self, kind: str) -> Point3D_Array:
+        """Return the minimum and maximum coordinates of the points of the
+        family of the given kind, or an empty array if there are none.
+
+        The boxes are cached per mobject and merged from those of the
+        submobjects, so only the subtrees which changed are visited again.
+        """
+        box = self._bounding_boxes.get(kind)
+        if box is None:
+            points = np.concatenate(
+                [
+                    self._get_boundary_points(kind),
+                    *(sm._get_bounding_box(kind) for sm in self.submobjects),
+                ]
+            )
+            if len(points) == 0:
+                box = np.zeros((0, self.dim))
+            else:
+                box = np.array([points.min(0), points.max(0)])
+            self._bounding_boxes[kind] = box
+        return box
+
+    def _invalidate_bounding_box(self) -> None:
+        """Discard the cached bounding boxes of ``self`` and of its ancestors."""
+        if not self._bounding_boxes:
+            # The ancestors of a mobject without cached bounding boxes never
+            # have cached bounding boxes themselves.
+            return
+        self._bounding_boxes = {}
+        for parent in self.parents:
+            parent._invalidate_bounding_box()
+
+    def refresh_bounding_box(self, recurse_down: bool = False) -> Self:
+        """Discard the cached bounding boxes after points have been modified
+        in place.
+
+        Parameters
+        ----------
+        recurse_down
+            Whether the points of submobjects have been modified as well.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+        """
+        if recurse_down:
+            for submob in self.submobjects:
+                submob.refresh_bounding_box(recurse_down=True)
+        self._invalidate_bounding_box()
+        return self
+
+    def get_bounding_box(self) -> Point3D_Array:
+        """Return the corner with minimal coordinates, the center and the
+        corner with maximal coordinates of the box bounding the points
+        returned by :meth:`get_points_defining_boundary`.
+        """
+        if self._boundary_kind is None:
+            points = self.get_points_defining_boundary()
+            if len(points) == 0:
+                return np.zeros((3, self.dim))
+            mins, maxs = points.min(0), points.max(0)
+        else:
+            box = self._get_bounding_box(self._boundary_kind)
+            if len(box) == 0:
+                return np.zeros((3, self.dim))
+            mins, maxs = box
+        return np.array([mins, (mins + maxs) / 2, maxs])
 
     def get_extremum_along_dim(
         self, points: Point3DLike_Array | None = None, dim: int = 0, key: int = 0
     ) -> float:
+        if points is None and self._boundary_kind is not None:
+            box = self._get_bounding_box(self._boundary_kind)
+            if key < 0:
+                return box[0, dim]
+            elif key == 0:
+                return (box[0, dim] + box[1, dim]) / 2
+            else:
+                return box[1, dim]
         np_points: Point3D_Array = (
             self.get_points_defining_boundary()
             if points is None
@@ -2069,6 +2474,14 @@ class Mobject:
 
         """
         result = np.zeros(self.dim)
+        if self._boundary_kind is not None:
+            box = self._get_bounding_box(self._boundary_kind)
+            if len(box) == 0:
+                return result
+            mins, maxs = box
+            direction = np.asarray(direction[: self.dim])
+            result = np.where(direction < 0, mins, maxs)
+            return np.where(direction == 0, (mins + maxs) / 2, result)
         all_points = self.get_points_defining_boundary()
         if len(all_points) == 0:
             return result
@@ -2151,10 +2564,8 @@ class Mobject:
 
     def length_over_dim(self, dim: int) -> float:
         """Measure the length of an :class:`~.Mobject` in a certain direction."""
-        return self.reduce_across_dimension(
-            max,
-            dim,
-        ) - self.reduce_across_dimension(min, dim)
+        box = self._get_bounding_box("length")
+        return box[1, dim] - box[0, dim]
 
     def get_coord(self, dim: int, direction: Vector3D = ORIGIN):
         """Meant to generalize ``get_x``, ``get_y`` and ``get_z``"""
@@ -2175,12 +2586,12 @@ class Mobject:
     def get_start(self) -> Point3D:
         """Returns the point, where the stroke that surrounds the :class:`~.Mobject` starts."""
         self.throw_error_if_no_points()
-        return np.array(self.points[0])
+        return np.array(self.get_points()[0])
 
     def get_end(self) -> Point3D:
         """Returns the point, where the stroke that surrounds the :class:`~.Mobject` ends."""
         self.throw_error_if_no_points()
-        return np.array(self.points[-1])
+        return np.array(self.get_points()[-1])
 
     def get_start_and_end(self) -> tuple[Point3D, Point3D]:
         """Returns starting and ending point of a stroke as a ``tuple``."""
@@ -2210,7 +2621,7 @@ class Mobject:
 
     def has_points(self) -> bool:
         """Check if :class:`~.Mobject` contains points."""
-        return len(self.points) > 0
+        return len(self._points) > 0
 
     def has_no_points(self) -> bool:
         """Check if :class:`~.Mobject` *does not* contains points."""
@@ -2305,16 +2716,79 @@ class Mobject:
         return Mobject
 
     def split(self) -> list[Self]:
-        result = [self] if len(self.points) > 0 else []
+        result = [self] if len(self.get_points()) > 0 else []
         return result + self.submobjects
 
+    @property
+    def submobjects(self) -> list[Mobject]:
+        """The contained objects.
+
+        The list may be modified in place; doing so keeps the cached family
+        of this mobject (and of all of its ancestors) up to date.
+        """
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobject_list: Iterable[Mobject]) -> None:
+        previous = self.__dict__.get("_submobjects", [])
+        self._submobjects = _SubmobjectList(self, submobject_list)
+        self._unlink_submobjects(previous)
+        self._link_submobjects(self._submobjects)
+
+    def _link_submobjects(self, submobjects: Iterable[Mobject]) -> None:
+        """Register ``self`` as a parent of the given submobjects and mark
+        the family of ``self`` as outdated.
+        """
+        for submob in submobjects:
+            if self not in submob.parents:
+                submob.parents.append(self)
+        self._invalidate_family()
+        self._invalidate_bounding_box()
+        self._invalidate_updater_status()
+
+    def _unlink_submobjects(self, submobjects: Iterable[Mobject]) -> None:
+        """Remove ``self`` from the parents of those of the given mobjects
+        which are no longer submobjects of ``self``.
+        """
+        linked = [sm for sm in dict.fromkeys(submobjects) if self in sm.parents]
+        # Membership tests on a set only pay off for several mobjects.
+        current = set(self._submobjects) if len(linked) > 1 else self._submobjects
+        for submob in linked:
+            if submob not in current:
+                submob.parents.remove(self)
+        self._invalidate_family()
+        self._invalidate_bounding_box()
+        self._invalidate_updater_status()
+
+    def _invalidate_family(self) -> None:
+        """Discard the cached family of ``self`` and of all of its ancestors."""
+        if self._family is None:
+            # The ancestors of a mobject without a cached family never
+            # have a cached family themselves.
+            return
+        self._family = None
+        for parent in self.parents:
+            parent._invalidate_family()
+
     def get_family(self, recurse: bool = True) -> list[Self]:
-        sub_families = [x.get_family() for x in self.submobjects]
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        """Return ``self`` followed by all of its submobjects, recursively."""
+        return list(self._get_family())
+
+    def _get_family(self) -> list[Self]:
+        """Return the family like :meth:`get_family`, but without copying the
+        cached list, which therefore must not be modified.
+
+        It is recomputed only after the submobjects of a member of the family
+        change, so a new list means that the family changed.
+        """
+        if self._family is None:
+            sub_families = [x._get_family() for x in self.submobjects]
+            all_mobjects = [self] + list(it.chain(*sub_families))
+            self._family = remove_list_redundancies(all_mobjects)
+        return self._family
 
     def family_members_with_points(self) -> list[Self]:
-        return [m for m in self.get_family() if m.get_num_points() > 0]
+        return [m for m in self._get_family() if m.get_num_points() > 0]
 
     def arrange(
         self,
@@ -2606,7 +3080,9 @@ class Mobject:
         if recursive:
             for submob in self.submobjects:
                 submob.shuffle(recursive=True)
-        random.shuffle(self.submobjects)
+        submobjects = list(self.submobjects)
+        random.shuffle(submobjects)
+        self.submobjects = submobjects
 
     def invert(self, recursive: bool = False) -> None:
         """Inverts the list of :attr:`submobjects`.
@@ -2807,7 +3283,7 @@ class Mobject:
 
                     self.add(dotL, dotR, dotMiddle)
         """
-        self.points = path_func(mobject1.points, mobject2.points, alpha)
+        self.points = path_func(mobject1.get_points(), mobject2.get_points(), alpha)
         self.interpolate_color(mobject1, mobject2, alpha)
         return self
 
@@ -2937,7 +3413,7 @@ class Mobject:
 
         self.align_data(mobject, skip_point_alignment=True)
         for sm1, sm2 in zip(self.get_family(), mobject.get_family()):
-            sm1.points = np.array(sm2.points)
+            sm1.points = np.array(sm2.get_points())
             sm1.interpolate_color(sm1, sm2, 1)
         return self
 
@@ -2959,7 +3435,7 @@ class Mobject:
                     self.wait(0.5)
         """
         for sm1, sm2 in zip(self.get_family(), mobject.get_family()):
-            sm1.points = np.array(sm2.points)
+            sm1.points = np.array(sm2.get_points())
         return self
 
     # Errors
@@ -3027,6 +3503,204 @@ class Mobject:
         return self
 
 
+class _SubmobjectList(list):
+    """The list stored in :attr:`Mobject.submobjects`.
+
+    In-place modifications of the list update the parent links of the
+    affected submobjects and invalidate the cached family of the owner.
+    """
+
+    def __init__(self, owner: Mobject, submobjects: Iterable[Mobject] = ()) -> None:
+        super().__init__(submobjects)
+        self._owner = owner
+
+    def __reduce_ex__(self, protocol):
+        # Copies of the list are plain lists, they do not belong to a mobject.
+        return list, (list(self),)
+
+    def append(self, submob: Mobject) -> None:
+        super().append(submob)
+        self._owner._link_submobjects((submob,))
+
+    def extend(self, submobjects: Iterable[Mobject]) -> None:
+        submobjects = list(submobjects)
+        super().extend(submobjects)
+        self._owner._link_submobjects(submobjects)
+
+    def __iadd__(self, submobjects: Iterable[Mobject]) -> Self:
+        self.extend(submobjects)
+        return self
+
+    def __imul__(self, n: int) -> Self:
+        previous = list(self)
+        super().__imul__(n)
+        self._owner._unlink_submobjects(previous)
+        return self
+
+    def insert(self, index: int, submob: Mobject) -> None:
+        super().insert(index, submob)
+        self._owner._link_submobjects((submob,))
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, slice):
+            previous = self[key]
+            added = value = list(value)
+        else:
+            previous = [self[key]]
+            added = [value]
+        super().__setitem__(key, value)
+        self._owner._unlink_submobjects(previous)
+        self._owner._link_submobjects(added)
+
+    def __delitem__(self, key) -> None:
+        previous = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        self._owner._unlink_submobjects(previous)
+
+    def remove(self, submob: Mobject) -> None:
+        super().remove(submob)
+        self._owner._unlink_submobjects((submob,))
+
+    def pop(self, index: int = -1) -> Mobject:
+        submob = super().pop(index)
+        self._owner._unlink_submobjects((submob,))
+        return submob
+
+    def clear(self) -> None:
+        previous = list(self)
+        super().clear()
+        self._owner._unlink_submobjects(previous)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._owner._invalidate_family()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._owner._invalidate_family()
+
+
+class _UpdaterList(list):
+    """The list of updaters of a mobject.
+
+    Modifying it discards the cached dispatch information of its owner, see
+    :meth:`Mobject._get_updater_calls`.
+    """
+
+    def __init__(self, owner: Mobject, updaters: Iterable[Updater] = ()) -> None:
+        super().__init__(updaters)
+        self._owner = owner
+
+    def __reduce_ex__(self, protocol):
+        # Copies of the list are plain lists, they do not belong to a mobject.
+        return list, (list(self),)
+
+    def append(self, updater: Updater) -> None:
+        super().append(updater)
+        self._owner._updaters_changed()
+
+    def extend(self, updaters: Iterable[Updater]) -> None:
+        super().extend(updaters)
+        self._owner._updaters_changed()
+
+    def __iadd__(self, updaters: Iterable[Updater]) -> Self:
+        self.extend(updaters)
+        return self
+
+    def __imul__(self, n: int) -> Self:
+        super().__imul__(n)
+        self._owner._updaters_changed()
+        return self
+
+    def insert(self, index: int, updater: Updater) -> None:
+        super().insert(index, updater)
+        self._owner._updaters_changed()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._owner._updaters_changed()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._owner._updaters_changed()
+
+    def remove(self, updater: Updater) -> None:
+        super().remove(updater)
+        self._owner._updaters_changed()
+
+    def pop(self, index: int = -1) -> Updater:
+        updater = super().pop(index)
+        self._owner._updaters_changed()
+        return updater
+
+    def clear(self) -> None:
+        super().clear()
+        self._owner._updaters_changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._owner._updaters_changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._owner._updaters_changed()
+
+
+class _DependentUpdater:
+    """An updater which only needs to be called when the mobjects it depends
+    on changed, see the ``depends_on`` parameter of :meth:`Mobject.add_updater`.
+
+    It compares equal to the wrapped function, so that it can be removed with
+    :meth:`Mobject.remove_updater`.
+    """
+
+    def __init__(self, function: Updater, dependencies: Iterable[Mobject]) -> None:
+        update_wrapper(self, function)
+        self.function = function
+        self.dependencies = tuple(dependencies)
+        self._states: list[Point3D_Array] | None = None
+
+    def __call__(self, mobject: Mobject, *args) -> None:
+        # Copy the points, so that modifying them in place is noticed too.
+        self._states = [np.array(points) for points in self._get_points()]
+        self.function(mobject, *args)
+
+    def __eq__(self, other) -> bool:
+        return other is self or self.function == other
+
+    def __hash__(self) -> int:
+        return hash(self.function)
+
+    def __deepcopy__(self, clone_from_id) -> _DependentUpdater:
+        # Just like the objects referenced by the function, the
+        # dependencies are not copied.
+        return type(self)(
+            copy.deepcopy(self.function, clone_from_id), self.dependencies
+        )
+
+    def _get_points(self) -> list[Point3D_Array]:
+        return [
+            mob.get_points()
+            for dependency in self.dependencies
+            for mob in dependency.get_family()
+        ]
+
+    def needs_update(self) -> bool:
+        """Return whether the points of a dependency changed since the last call."""
+        if self._states is None:
+            return True
+        points = self._get_points()
+        return len(points) != len(self._states) or any(
+            not np.array_equal(current, previous)
+            for current, previous in zip(points, self._states)
+        )
+
+
+def _takes_dt(updater: Updater) -> bool:
+    """Return whether ``updater`` has to be called with a ``dt`` parameter."""
+    return "dt" in inspect.signature(updater).parameters
+
+
 class Group(Mobject, metaclass=ConvertToOpenGL):
     """Groups together multiple :class:`Mobjects <.Mobject>`.
 
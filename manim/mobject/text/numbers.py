@@ -300,6 +300,7 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
                 # for compatibility with updaters to not leave first number in place while updating,
                 # not needed with opengl renderer
                 mob.points[:] = 0
+                mob.refresh_bounding_box()
 
         self.init_colors()
         return self
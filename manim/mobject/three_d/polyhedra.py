@@ -433,24 +433,11 @@ class ConvexHull3D(Polyhedron):
         hull = QuickHull(tolerance)
         hull.build(array)
 
-        # Setup Lists
-        vertices = []
-        faces = []
-
         # Extract Faces
-        c = 0
-        d = {}
-        facets = set(hull.facets) - hull.removed
-        for facet in facets:
-            tmp = set()
-            for subfacet in facet.subfacets:
-                for point in subfacet.points:
-                    if point not in d:
-                        vertices.append(point.coordinates)
-                        d[point] = c
-                        c += 1
-                    tmp.add(point)
-            faces.append([d[point] for point in tmp])
+        facets = hull.simplices[~hull.is_removed]
+        indices, faces = np.unique(facets, return_inverse=True)
+        vertices = list(array[indices])
+        faces = faces.reshape(facets.shape).tolist()
 
         # Call Polyhedron
         super().__init__(
@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = [
     "VMobject",
     "VGroup",
+    "PackedVGroup",
     "VDict",
     "VectorizedPoint",
     "CurvesAsSubmobjects",
@@ -13,12 +14,15 @@ __all__ = [
 
 
 import itertools as it
+import operator as op
 import sys
 from collections.abc import Hashable, Iterable, Mapping, Sequence
+from functools import reduce
 from typing import TYPE_CHECKING, Callable, Literal
 
 import numpy as np
 from PIL.Image import Image
+from scipy.spatial import KDTree
 
 from manim import config
 from manim.constants import *
@@ -30,11 +34,13 @@ from manim.mobject.three_d.three_d_utils import (
     get_3d_vmob_gradient_start_and_end_points,
 )
 from manim.utils.bezier import (
+    _integer_interpolate_arrays,
     bezier,
     bezier_remap,
-    get_smooth_cubic_bezier_handle_points,
+    get_smooth_cubic_bezier_handle_points_batched,
     integer_interpolate,
     interpolate,
+    partial_bezier_curves,
     partial_bezier_points,
     proportions_along_bezier_curve_for_point,
 )
@@ -45,6 +51,7 @@ from manim.utils.iterables import (
     stretch_array_to_length,
     tuplify,
 )
+from manim.utils.paths import straight_path
 from manim.utils.space_ops import rotate_vector, shoelace_direction
 
 if TYPE_CHECKING:
@@ -55,10 +62,11 @@ if TYPE_CHECKING:
 
     from manim.typing import (
         CubicBezierPath,
-        CubicBezierPointsLike,
         CubicSpline,
         ManimFloat,
         MappingFunction,
+        MultiMappingFunction,
+        PathFuncType,
         Point2DLike,
         Point3D,
         Point3D_Array,
@@ -78,6 +86,43 @@ if TYPE_CHECKING:
 #   That's kind of weird.
 
 
+# The points aligned by VMobject.align_points, keyed by the points they were
+# aligned from. The oldest ones are dropped first.
+_ALIGNED_POINTS_CACHE_SIZE = 128
+_aligned_points_cache: dict[tuple, tuple[Point3D_Array, ...]] = {}
+
+
+class _PointBuffer:
+    """An array holding the points of a :class:`VMobject` followed by room for
+    more, see :meth:`VMobject.append_points`.
+
+    The points of the mobject are a view of the rows before ``end``. The
+    buffer is not copied along with the mobject: copies share the view, and
+    the first of them to append points then moves them to a new buffer.
+    """
+
+    __slots__ = ("array", "end")
+
+    def __init__(self, array: Point3D_Array, end: int) -> None:
+        self.array = array
+        self.end = end
+
+    def __deepcopy__(self, clone_from_id) -> None:
+        return None
+
+    def ends_with(self, points: Point3D_Array) -> bool:
+        """Return whether ``points`` is a writable view of the rows of the
+        buffer just before ``end``.
+        """
+        array = self.array
+        return (
+            points.base is array
+            and points.flags.writeable
+            and points.__array_interface__["data"][0] + points.nbytes
+            == array.__array_interface__["data"][0] + self.end * array.strides[0]
+        )
+
+
 class VMobject(Mobject):
     """A vectorized mobject.
 
@@ -104,6 +149,7 @@ class VMobject(Mobject):
     """
 
     sheen_factor = 0.0
+    _boundary_kind = "anchors"
 
     def __init__(
         self,
@@ -158,6 +204,11 @@ class VMobject(Mobject):
             0, 1, n_points_per_cubic_curve
         )
         self.cap_style: CapStyleType = cap_style
+        self._curve_lengths: (
+            tuple[int, npt.NDArray[ManimFloat], npt.NDArray[ManimFloat]] | None
+        ) = None
+        self._point_buffer: _PointBuffer | None = None
+        self._subpath_bounds: tuple[bool, float, list[int], list[int]] | None = None
         super().__init__(**kwargs)
         self.submobjects: list[VMobject]
 
@@ -780,8 +831,8 @@ class VMobject(Mobject):
             (the target size) to a Numpy array. The default implementation
             is based on Numpy's ``resize`` function.
         """
-        if new_length != len(self.points):
-            self.points = resize_func(self.points, new_length)
+        if new_length != len(self.get_points()):
+            self.points = resize_func(self.get_points(), new_length)
         return self
 
     def set_anchors_and_handles(
@@ -807,7 +858,7 @@ class VMobject(Mobject):
         assert len(anchors1) == len(handles1) == len(handles2) == len(anchors2)
         nppcc = self.n_points_per_cubic_curve  # 4
         total_len = nppcc * len(anchors1)
-        self.points = np.empty((total_len, self.dim))
+        points = np.empty((total_len, self.dim))
         # the following will, from the four sets, dispatch them in points such that
         # self.points = [
         #     anchors1[0], handles1[0], handles2[0], anchors1[0], anchors1[1],
@@ -815,7 +866,8 @@ class VMobject(Mobject):
         # ]
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
-            self.points[index::nppcc] = array
+            points[index::nppcc] = array
+        self.points = points
         return self
 
     def clear_points(self) -> None:
@@ -839,11 +891,28 @@ class VMobject(Mobject):
         # TODO, check that number new points is a multiple of 4?
         # or else that if len(self.points) % 4 == 1, then
         # len(new_points) % 4 == 3?
-        n = len(self.points)
-        points = np.empty((n + len(new_points), self.dim))
-        points[:n] = self.points
-        points[n:] = new_points
-        self.points = points
+        points = self.get_points()
+        n = len(points)
+        k = len(new_points)
+        buffer = self._point_buffer
+        if (
+            buffer is not None
+            and not self._points_shared
+            and buffer.end + k <= len(buffer.array)
+            and buffer.ends_with(points)
+        ):
+            start = buffer.end - n
+        else:
+            # Leave room for as many points again, so that appending points
+            # repeatedly only copies them a logarithmic number of times.
+            buffer = _PointBuffer(np.empty((2 * (n + k), self.dim)), n)
+            buffer.array[:n] = points
+            self._point_buffer = buffer
+            start = 0
+        end = buffer.end + k
+        buffer.array[buffer.end : end] = new_points
+        buffer.end = end
+        self.points = buffer.array[start:end]
         return self
 
     def start_new_path(self, point: Point3DLike) -> Self:
@@ -864,7 +933,7 @@ class VMobject(Mobject):
             The VMobject itself, after appending ``point`` and starting a new
             curve.
         """
-        n_points = len(self.points)
+        n_points = len(self.get_points())
         nppc = self.n_points_per_curve
         if n_points % nppc != 0:
             # close the open path by appending the last
@@ -1003,7 +1072,7 @@ class VMobject(Mobject):
             self.add_line_to(new_anchor)
         else:
             self.throw_error_if_no_points()
-            last_h2, last_a2 = self.points[-2:]
+            last_h2, last_a2 = self.get_points()[-2:]
             last_tangent = last_a2 - last_h2
             handle1 = last_a2 + last_tangent
             if handle2 is None:
@@ -1016,14 +1085,15 @@ class VMobject(Mobject):
     def has_new_path_started(self) -> bool:
         nppcc = self.n_points_per_cubic_curve  # 4
         # A new path starting is defined by a control point which is not part of a bezier subcurve.
-        return len(self.points) % nppcc == 1
+        return len(self.get_points()) % nppcc == 1
 
     def get_last_point(self) -> Point3D:
-        return self.points[-1]
+        return self.get_points()[-1]
 
     def is_closed(self) -> bool:
         # TODO use consider_points_equals_2d ?
-        return self.consider_points_equals(self.points[0], self.points[-1])
+        points = self.get_points()
+        return self.consider_points_equals(points[0], points[-1])
 
     def close_path(self) -> None:
         if not self.is_closed():
@@ -1056,7 +1126,7 @@ class VMobject(Mobject):
             # Pop the last point from self.points and
             # add it to start_corners
             start_corners = np.empty((num_points, self.dim))
-            start_corners[0] = self.points[-1]
+            start_corners[0] = self.get_points()[-1]
             start_corners[1:] = points[:-1]
             end_corners = points
             self.points = self.points[:-1]
@@ -1138,26 +1208,41 @@ class VMobject(Mobject):
         """
         assert mode in ["jagged", "smooth"], 'mode must be either "jagged" or "smooth"'
         nppcc = self.n_points_per_cubic_curve
-        for submob in self.family_members_with_points():
-            subpaths = submob.get_subpaths()
-            submob.clear_points()
-            # A subpath can be composed of several bezier curves.
-            for subpath in subpaths:
-                # This will retrieve the anchors of the subpath, by selecting every n element in the array subpath
-                # The append is needed as the last element is not reached when slicing with numpy.
-                anchors = np.append(subpath[::nppcc], subpath[-1:], 0)
-                if mode == "smooth":
-                    h1, h2 = get_smooth_cubic_bezier_handle_points(anchors)
-                else:  # mode == "jagged"
-                    # The following will make the handles aligned with the anchors, thus making the bezier curve a segment
-                    a1 = anchors[:-1]
-                    a2 = anchors[1:]
-                    h1 = interpolate(a1, a2, 1.0 / 3)
-                    h2 = interpolate(a1, a2, 2.0 / 3)
-                new_subpath = np.array(subpath)
-                new_subpath[1::nppcc] = h1
-                new_subpath[2::nppcc] = h2
-                submob.append_points(new_subpath)
+        submobs = self.family_members_with_points()
+        # The subpaths of all the submobjects are processed at once.
+        subpaths = [submob.get_subpaths() for submob in submobs]
+        all_subpaths = [subpath for paths in subpaths for subpath in paths]
+        if not all_subpaths:
+            for submob in submobs:
+                submob.clear_points()
+            return self
+        points = np.concatenate(all_subpaths)
+        # A subpath can be composed of several bezier curves. Its anchors are
+        # the first point of each of its curves and its last point.
+        num_curves = np.array([len(subpath) for subpath in all_subpaths]) // nppcc
+        curve_ends = np.cumsum(num_curves)
+        anchors = np.insert(
+            points[::nppcc], curve_ends, points[curve_ends * nppcc - 1], axis=0
+        )
+        anchor_offsets = np.append(0, curve_ends + np.arange(1, len(curve_ends) + 1))
+        if mode == "smooth":
+            h1, h2 = get_smooth_cubic_bezier_handle_points_batched(
+                anchors, anchor_offsets
+            )
+        else:  # mode == "jagged"
+            # The following will make the handles aligned with the anchors, thus making the bezier curve a segment
+            a1 = np.delete(anchors, anchor_offsets[1:] - 1, axis=0)
+            a2 = np.delete(anchors, anchor_offsets[:-1], axis=0)
+            h1 = interpolate(a1, a2, 1.0 / 3)
+            h2 = interpolate(a1, a2, 2.0 / 3)
+        points[1::nppcc] = h1
+        points[2::nppcc] = h2
+
+        start = 0
+        for submob, paths in zip(submobs, subpaths):
+            end = start + sum(len(subpath) for subpath in paths)
+            submob.points = points[start:end]
+            start = end
         return self
 
     def make_smooth(self) -> Self:
@@ -1175,13 +1260,15 @@ class VMobject(Mobject):
         if self.has_new_path_started():
             # Remove last point, which is starting
             # a new path
-            self.points = self.points[:-1]
-        self.append_points(vectorized_mobject.points)
+            self.points = self.get_points()[:-1]
+        self.append_points(vectorized_mobject.get_points())
 
-    def apply_function(self, function: MappingFunction) -> Self:
+    def apply_function(
+        self, function: MappingFunction, vectorized: bool = False
+    ) -> Self:
         factor = self.pre_function_handle_to_anchor_scale_factor
         self.scale_handle_to_anchor_distances(factor)
-        super().apply_function(function)
+        super().apply_function(function, vectorized)
         self.scale_handle_to_anchor_distances(1.0 / factor)
         if self.make_smooth_after_applying_functions:
             self.make_smooth()
@@ -1218,7 +1305,7 @@ class VMobject(Mobject):
             ``self``
         """
         for submob in self.family_members_with_points():
-            if len(submob.points) < self.n_points_per_cubic_curve:
+            if len(submob.get_points()) < self.n_points_per_cubic_curve:
                 # The case that a bezier quad is not complete (there is no bezier curve as there is not enough control points.)
                 continue
             a1, h1, h2, a2 = submob.get_anchors_and_handles()
@@ -1264,7 +1351,7 @@ class VMobject(Mobject):
 
     def gen_cubic_bezier_tuples_from_points(
         self, points: CubicBezierPathLike
-    ) -> tuple[CubicBezierPointsLike, ...]:
+    ) -> CubicBezierPoints_Array:
         """Returns the bezier tuples from an array of points.
 
         self.points is a list of the anchors and handles of the bezier curves of the mobject (ie [anchor1, handle1, handle2, anchor2, anchor3 ..])
@@ -1279,67 +1366,106 @@ class VMobject(Mobject):
 
         Returns
         -------
-        tuple
-            Bezier control points.
+        CubicBezierPoints_Array
+            Bezier control points, as a view of ``points`` of shape
+            ``(num_curves, n_points_per_cubic_curve, dim)``.
         """
         nppcc = self.n_points_per_cubic_curve
+        points = np.asarray(points)
         remainder = len(points) % nppcc
         points = points[: len(points) - remainder]
         # Basically take every nppcc element.
-        return tuple(points[i : i + nppcc] for i in range(0, len(points), nppcc))
+        return points.reshape(-1, nppcc, *points.shape[1:])
 
     def get_cubic_bezier_tuples(self) -> CubicBezierPoints_Array:
-        return self.get_cubic_bezier_tuples_from_points(self.points)
+        return self.get_cubic_bezier_tuples_from_points(self.get_points())
+
+    def _get_subpath_bounds(
+        self, points: CubicBezierPath, two_d: bool
+    ) -> tuple[list[int], list[int]]:
+        """Return the indices in ``points`` at which the subpaths formed by
+        them start and stop.
+
+        A curve continues the subpath of the previous curve if it starts at
+        the end of that curve, as decided by :meth:`consider_points_equals`,
+        or :meth:`consider_points_equals_2d` if ``two_d`` is true. The anchors
+        of all the curves are compared at once.
+
+        The bounds of the subpaths of :attr:`points` are cached until the
+        points change.
+        """
+        tolerance = self.tolerance_for_point_equality
+        is_own_points = points is self.get_points()
+        cached = self._subpath_bounds
+        if (
+            is_own_points
+            and cached is not None
+            and cached[0] == two_d
+            and cached[1] == tolerance
+        ):
+            return cached[2], cached[3]
+
+        nppcc = self.n_points_per_cubic_curve
+        points = np.asarray(points)
+        # The end of each curve, and the start of the next curve.
+        ends = points[nppcc - 1 : len(points) - 1 : nppcc]
+        starts = points[nppcc::nppcc]
+        if two_d:
+            # Like consider_points_equals_2d, for all the pairs at once.
+            rtol = 1.0e-5
+            x_is_far = np.abs(ends[:, 0] - starts[:, 0]) > (
+                tolerance + rtol * np.abs(starts[:, 0])
+            )
+            y_is_close = np.abs(ends[:, 1] - starts[:, 1]) <= (
+                tolerance + rtol * np.abs(starts[:, 1])
+            )
+            is_continuous = ~x_is_far & y_is_close
+        else:
+            is_continuous = np.isclose(ends, starts, atol=tolerance).all(axis=1)
+        split_indices = np.concatenate(
+            [[0], (np.flatnonzero(~is_continuous) + 1) * nppcc, [len(points)]]
+        )
+        is_long_enough = np.diff(split_indices) >= nppcc
+        bounds = (
+            split_indices[:-1][is_long_enough].tolist(),
+            split_indices[1:][is_long_enough].tolist(),
+        )
+        if is_own_points:
+            self._subpath_bounds = (two_d, tolerance, *bounds)
+        return bounds
 
     def _gen_subpaths_from_points(
         self,
         points: CubicBezierPath,
-        filter_func: Callable[[int], bool],
+        two_d: bool = False,
     ) -> Iterable[CubicSpline]:
         """Given an array of points defining the bezier curves of the vmobject, return subpaths formed by these points.
-        Here, Two bezier curves form a path if at least two of their anchors are evaluated True by the relation defined by filter_func.
-
-        The algorithm every bezier tuple (anchors and handles) in ``self.points`` (by regrouping each n elements, where
-        n is the number of points per cubic curve)), and evaluate the relation between two anchors with filter_func.
-        NOTE : The filter_func takes an int n as parameter, and will evaluate the relation between points[n] and points[n - 1]. This should probably be changed so
-        the function takes two points as parameters.
+        Here, two consecutive bezier curves belong to the same subpath if the end anchor of the first one and the
+        start anchor of the second one are considered equal.
 
         Parameters
         ----------
         points
             points defining the bezier curve.
-        filter_func
-            Filter-func defining the relation.
+        two_d
+            Whether to compare the anchors with :meth:`consider_points_equals_2d`
+            instead of :meth:`consider_points_equals`.
 
         Returns
         -------
         Iterable[CubicSpline]
-            subpaths formed by the points.
+            subpaths formed by the points, as views of ``points``.
         """
-        nppcc = self.n_points_per_cubic_curve
-        filtered = filter(filter_func, range(nppcc, len(points), nppcc))
-        split_indices = [0] + list(filtered) + [len(points)]
-        return (
-            points[i1:i2]
-            for i1, i2 in zip(split_indices, split_indices[1:])
-            if (i2 - i1) >= nppcc
-        )
+        starts, stops = self._get_subpath_bounds(points, two_d)
+        return (points[start:stop] for start, stop in zip(starts, stops))
 
     def get_subpaths_from_points(self, points: CubicBezierPath) -> list[CubicSpline]:
-        return list(
-            self._gen_subpaths_from_points(
-                points,
-                lambda n: not self.consider_points_equals(points[n - 1], points[n]),
-            ),
-        )
+        return list(self._gen_subpaths_from_points(points))
 
     def gen_subpaths_from_points_2d(
         self, points: CubicBezierPath
     ) -> Iterable[CubicSpline]:
-        return self._gen_subpaths_from_points(
-            points,
-            lambda n: not self.consider_points_equals_2d(points[n - 1], points[n]),
-        )
+        return self._gen_subpaths_from_points(points, two_d=True)
 
     def get_subpaths(self) -> list[CubicSpline]:
         """Returns subpaths formed by the curves of the VMobject.
@@ -1351,7 +1477,7 @@ class VMobject(Mobject):
         list[CubicSpline]
             subpaths.
         """
-        return self.get_subpaths_from_points(self.points)
+        return self.get_subpaths_from_points(self.get_points())
 
     def get_nth_curve_points(self, n: int) -> CubicBezierPoints:
         """Returns the points defining the nth curve of the vmobject.
@@ -1368,7 +1494,7 @@ class VMobject(Mobject):
         """
         assert n < self.get_num_curves()
         nppcc = self.n_points_per_cubic_curve
-        return self.points[nppcc * n : nppcc * (n + 1)]
+        return self.get_points()[nppcc * n : nppcc * (n + 1)]
 
     def get_nth_curve_function(self, n: int) -> Callable[[float], Point3D]:
         """Returns the expression of the nth curve.
@@ -1463,6 +1589,67 @@ class VMobject(Mobject):
 
         return curve, length
 
+    def _get_curve_lengths(
+        self, sample_points: int | None = None
+    ) -> tuple[npt.NDArray[ManimFloat], npt.NDArray[ManimFloat]]:
+        """Return the (approximate) lengths of all curves, like
+        :meth:`get_nth_curve_length`, and their cumulative sums starting at 0.
+
+        They are computed for all curves at once, and cached until the points
+        change.
+        """
+        if sample_points is None:
+            sample_points = 10
+        cached = self._curve_lengths
+        if cached is not None and cached[0] == sample_points:
+            return cached[1:]
+        lengths = self._get_curve_length_pieces(sample_points).sum(axis=1)
+        cumulative_lengths = np.concatenate([[0], np.cumsum(lengths)])
+        self._curve_lengths = (sample_points, lengths, cumulative_lengths)
+        return lengths, cumulative_lengths
+
+    def _get_curve_length_pieces(
+        self, sample_points: int | None = None
+    ) -> npt.NDArray[ManimFloat]:
+        """Return the short line lengths of all curves, like
+        :meth:`get_nth_curve_length_pieces`, as an array of shape
+        ``(num_curves, sample_points - 1)``.
+        """
+        if sample_points is None:
+            sample_points = 10
+        return self._get_length_pieces_of_curves(self._get_curves(), sample_points)
+
+    @staticmethod
+    def _get_length_pieces_of_curves(
+        curves: npt.NDArray[ManimFloat], sample_points: int
+    ) -> npt.NDArray[ManimFloat]:
+        """Return the short line lengths of the given curves, as an array of
+        shape ``(num_curves, sample_points - 1)``.
+        """
+        # Sample all the curves at each value of t at once.
+        curve_function = bezier(curves.transpose(1, 0, 2))
+        samples = np.stack(
+            [curve_function(t) for t in np.linspace(0, 1, sample_points)], axis=1
+        )
+        return np.linalg.norm(samples[:, 1:] - samples[:, :-1], axis=2)
+
+    def _get_curves(self) -> npt.NDArray[ManimFloat]:
+        """Return the control points of the curves as an array of shape
+        ``(num_curves, n_points_per_cubic_curve, dim)``.
+        """
+        nppcc = self.n_points_per_cubic_curve
+        num_curves = self.get_num_curves()
+        return self.get_points()[: num_curves * nppcc].reshape(
+            num_curves, nppcc, self.dim
+        )
+
+    def _invalidate_bounding_box(self) -> None:
+        # The lengths of the curves and the subpaths change along with the
+        # points.
+        self._curve_lengths = None
+        self._subpath_bounds = None
+        super()._invalidate_bounding_box()
+
     def get_num_curves(self) -> int:
         """Returns the number of curves of the vmobject.
 
@@ -1472,7 +1659,7 @@ class VMobject(Mobject):
             number of curves of the vmobject.
         """
         nppcc = self.n_points_per_cubic_curve
-        return len(self.points) // nppcc
+        return len(self.get_points()) // nppcc
 
     def get_curve_functions(
         self,
@@ -1550,26 +1737,64 @@ class VMobject(Mobject):
 
         self.throw_error_if_no_points()
         if alpha == 1:
-            return self.points[-1]
+            return self.get_points()[-1]
 
-        curves_and_lengths = tuple(self.get_curve_functions_with_lengths())
+        return self.points_from_proportions(np.array([alpha]))[0]
 
-        target_length = alpha * sum(length for _, length in curves_and_lengths)
-        current_length = 0
+    def points_from_proportions(self, alphas: npt.ArrayLike) -> Point3D_Array:
+        """Gets the points at several proportions along the path of the
+        :class:`VMobject` at once, like :meth:`point_from_proportion`.
 
-        for curve, length in curves_and_lengths:
-            if current_length + length >= target_length:
-                if length != 0:
-                    residue = (target_length - current_length) / length
-                else:
-                    residue = 0
+        Parameters
+        ----------
+        alphas
+            The proportions along the path of the :class:`VMobject`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The points on the :class:`VMobject`, one for each proportion.
 
-                return curve(residue)
+        Raises
+        ------
+        :exc:`ValueError`
+            If any of the ``alphas`` is not between 0 and 1.
+        :exc:`Exception`
+            If the :class:`VMobject` has no points.
 
-            current_length += length
-        raise Exception(
-            "Not sure how you reached here, please file a bug report at https://github.com/ManimCommunity/manim/issues/new/choose"
+        Examples
+        --------
+        ::
+
+            >>> from manim import Line
+            >>> Line([0, 0, 0], [4, 0, 0]).points_from_proportions([0, 0.25, 1])
+            array([[0., 0., 0.],
+                   [1., 0., 0.],
+                   [4., 0., 0.]])
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        if np.any((alphas < 0) | (alphas > 1)):
+            raise ValueError(f"Alphas {alphas} not all between 0 and 1.")
+
+        self.throw_error_if_no_points()
+        lengths, cumulative_lengths = self._get_curve_lengths()
+        target_lengths = alphas * cumulative_lengths[-1]
+        # The first curve reaching the target length contains the point.
+        indices = np.minimum(
+            np.searchsorted(cumulative_lengths[1:], target_lengths, side="left"),
+            len(lengths) - 1,
+        )
+        curve_lengths = lengths[indices]
+        residues = np.divide(
+            target_lengths - cumulative_lengths[indices],
+            curve_lengths,
+            out=np.zeros_like(target_lengths),
+            where=curve_lengths != 0,
         )
+        curves = self._get_curves()[indices]
+        points = bezier(curves.transpose(1, 0, 2))(residues[:, np.newaxis])
+        points[alphas == 1] = self.get_points()[-1]
+        return points
 
     def proportion_from_point(
         self,
@@ -1606,11 +1831,12 @@ class VMobject(Mobject):
         # the proportion along the ``VMobject`` the point is at.
 
         num_curves = self.get_num_curves()
-        total_length = self.get_arc_length()
+        lengths, cumulative_lengths = self._get_curve_lengths()
+        total_length = cumulative_lengths[-1]
         target_length = 0
         for n in range(num_curves):
             control_points = self.get_nth_curve_points(n)
-            length = self.get_nth_curve_length(n)
+            length = lengths[n]
             proportions_along_bezier = proportions_along_bezier_curve_for_point(
                 point,
                 control_points,
@@ -1639,7 +1865,8 @@ class VMobject(Mobject):
             Iterable of the anchors and handles.
         """
         nppcc = self.n_points_per_cubic_curve
-        return [self.points[i::nppcc] for i in range(nppcc)]
+        points = self.get_points()
+        return [points[i::nppcc] for i in range(nppcc)]
 
     def get_start_anchors(self) -> Point3D_Array:
         """Returns the start anchors of the bezier curves.
@@ -1649,7 +1876,7 @@ class VMobject(Mobject):
         Point3D_Array
             Starting anchors
         """
-        return self.points[:: self.n_points_per_cubic_curve]
+        return self.get_points()[:: self.n_points_per_cubic_curve]
 
     def get_end_anchors(self) -> Point3D_Array:
         """Return the end anchors of the bezier curves.
@@ -1660,7 +1887,7 @@ class VMobject(Mobject):
             Starting anchors
         """
         nppcc = self.n_points_per_cubic_curve
-        return self.points[nppcc - 1 :: nppcc]
+        return self.get_points()[nppcc - 1 :: nppcc]
 
     def get_anchors(self) -> list[Point3D]:
         """Returns the anchors of the curves forming the VMobject.
@@ -1670,8 +1897,9 @@ class VMobject(Mobject):
         Point3D_Array
             The anchors.
         """
-        if self.points.shape[0] == 1:
-            return self.points
+        points = self.get_points()
+        if points.shape[0] == 1:
+            return points
 
         s = self.get_start_anchors()
         e = self.get_end_anchors()
@@ -1683,6 +1911,15 @@ class VMobject(Mobject):
             tuple(it.chain(*(sm.get_anchors() for sm in self.get_family())))
         )
 
+    def _get_boundary_points(self, kind: str) -> Point3D_Array:
+        if kind != "anchors" or len(self.get_points()) == 1:
+            return super()._get_boundary_points(kind)
+        # The same points as in get_anchors, without building a list
+        start_anchors = self.get_start_anchors()
+        end_anchors = self.get_end_anchors()
+        n_curves = min(len(start_anchors), len(end_anchors))
+        return np.concatenate([start_anchors[:n_curves], end_anchors[:n_curves]])
+
     def get_arc_length(self, sample_points_per_curve: int | None = None) -> float:
         """Return the approximated length of the whole curve.
 
@@ -1696,12 +1933,8 @@ class VMobject(Mobject):
         float
             The length of the :class:`VMobject`.
         """
-        return sum(
-            length
-            for _, length in self.get_curve_functions_with_lengths(
-                sample_points=sample_points_per_curve,
-            )
-        )
+        _, cumulative_lengths = self._get_curve_lengths(sample_points_per_curve)
+        return cumulative_lengths[-1]
 
     # Alignment
     def align_points(self, vmobject: VMobject) -> Self:
@@ -1736,13 +1969,55 @@ class VMobject(Mobject):
             if mob.has_new_path_started():
                 mob.add_line_to(mob.get_last_point())
 
+        # Transforming between the same shapes again, for instance when going
+        # back and forth between them, aligns the same points again.
+        points1 = self.get_points()
+        points2 = vmobject.get_points()
+        key = (
+            type(self),
+            type(vmobject),
+            self.tolerance_for_point_equality,
+            vmobject.tolerance_for_point_equality,
+            points1.shape,
+            points2.shape,
+            hash(points1.tobytes()),
+            hash(points2.tobytes()),
+        )
+        cached = _aligned_points_cache.get(key)
+        if (
+            cached is not None
+            and np.array_equal(cached[0], points1)
+            and np.array_equal(cached[1], points2)
+        ):
+            new_path1, new_path2 = cached[2:]
+        else:
+            new_path1, new_path2 = self._align_subpaths(vmobject)
+            if len(_aligned_points_cache) >= _ALIGNED_POINTS_CACHE_SIZE:
+                del _aligned_points_cache[next(iter(_aligned_points_cache))]
+            for array in (new_path1, new_path2):
+                array.flags.writeable = False
+            _aligned_points_cache[key] = (
+                points1.copy(),
+                points2.copy(),
+                new_path1,
+                new_path2,
+            )
+        # The aligned points are shared with the cache, see Mobject.points.
+        self.points = new_path1
+        vmobject.points = new_path2
+        return self
+
+    def _align_subpaths(
+        self, vmobject: VMobject
+    ) -> tuple[Point3D_Array, Point3D_Array]:
+        """Return the points of ``self`` and ``vmobject`` with the same number
+        of subpaths, with corresponding subpaths each containing the same
+        number of points, see :meth:`align_points`.
+        """
         # Figure out what the subpaths are
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
 
         nppcc = self.n_points_per_cubic_curve
 
@@ -1761,19 +2036,21 @@ class VMobject(Mobject):
                     break
             return path
 
+        # Build the new subpaths, and join them once at the end.
+        new_subpaths1 = []
+        new_subpaths2 = []
         for n in range(n_subpaths):
             # For each pair of subpaths, add points until they are the same length
             sp1 = get_nth_subpath(subpaths1, n)
             sp2 = get_nth_subpath(subpaths2, n)
             diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
             diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
-        return self
+            new_subpaths1.append(self.insert_n_curves_to_point_list(diff1, sp1))
+            new_subpaths2.append(self.insert_n_curves_to_point_list(diff2, sp2))
+        return (
+            np.concatenate(new_subpaths1, axis=0, dtype=float).reshape(-1, self.dim),
+            np.concatenate(new_subpaths2, axis=0, dtype=float).reshape(-1, self.dim),
+        )
 
     def insert_n_curves(self, n: int) -> Self:
         """Inserts n curves to the bezier curves of the vmobject.
@@ -1792,7 +2069,7 @@ class VMobject(Mobject):
         if self.has_new_path_started():
             new_path_point = self.get_last_point()
 
-        new_points = self.insert_n_curves_to_point_list(n, self.points)
+        new_points = self.insert_n_curves_to_point_list(n, self.get_points())
         self.set_points(new_points)
 
         if new_path_point is not None:
@@ -1909,7 +2186,7 @@ class VMobject(Mobject):
         # - A start, which is some ending portion of an inner cubic.
         # - An end, which is the starting portion of a later inner cubic.
         if a <= 0 and b >= 1:
-            self.set_points(vmobject.points)
+            self.set_points(vmobject.get_points())
             return self
         num_curves = vmobject.get_num_curves()
         if num_curves == 0:
@@ -1933,32 +2210,33 @@ class VMobject(Mobject):
             # Look at the "lower_index"-th Bézier curve and select its part from
             # t=lower_residue to t=upper_residue.
             self.points = partial_bezier_points(
-                vmobject.points[nppc * lower_index : nppc * (lower_index + 1)],
+                vmobject.get_points()[nppc * lower_index : nppc * (lower_index + 1)],
                 lower_residue,
                 upper_residue,
             )
         else:
             # Allocate space for (upper_index-lower_index+1) Bézier curves.
-            self.points = np.empty((nppc * (upper_index - lower_index + 1), self.dim))
+            points = np.empty((nppc * (upper_index - lower_index + 1), self.dim))
             # Look at the "lower_index"-th Bezier curve and select its part from
             # t=lower_residue to t=1. This is the first curve in self.points.
-            self.points[:nppc] = partial_bezier_points(
-                vmobject.points[nppc * lower_index : nppc * (lower_index + 1)],
+            points[:nppc] = partial_bezier_points(
+                vmobject.get_points()[nppc * lower_index : nppc * (lower_index + 1)],
                 lower_residue,
                 1,
             )
             # If there are more curves between the "lower_index"-th and the
             # "upper_index"-th Béziers, add them all to self.points.
-            self.points[nppc:-nppc] = vmobject.points[
+            points[nppc:-nppc] = vmobject.get_points()[
                 nppc * (lower_index + 1) : nppc * upper_index
             ]
             # Look at the "upper_index"-th Bézier curve and select its part from
             # t=0 to t=upper_residue. This is the last curve in self.points.
-            self.points[-nppc:] = partial_bezier_points(
-                vmobject.points[nppc * upper_index : nppc * (upper_index + 1)],
+            points[-nppc:] = partial_bezier_points(
+                vmobject.get_points()[nppc * upper_index : nppc * (upper_index + 1)],
                 0,
                 upper_residue,
             )
+            self.points = points
 
         return self
 
@@ -2279,6 +2557,348 @@ class VGroup(VMobject, metaclass=ConvertToOpenGL):
         self.submobjects[key] = value
 
 
+class _PackedArrays:
+    """The contiguous arrays of a :class:`PackedVGroup` and the views into them
+    held by the members of its family.
+
+    The arrays are not copied along with the group: copies pack their own.
+    """
+
+    __slots__ = ("family", "members", "buffers", "views", "lengths", "plain_style")
+
+    def __deepcopy__(self, clone_from_id) -> None:
+        return None
+
+
+class PackedVGroup(VGroup):
+    """A :class:`VGroup` storing the points and colors of its whole family in
+    contiguous arrays.
+
+    The points, fill colors, stroke colors and background stroke colors of the
+    :class:`VMobject` instances in the family are views into one array per
+    attribute. Shifting, scaling, rotating, recoloring and interpolating the
+    group are then single NumPy operations instead of one per submobject, and
+    the :class:`.Camera` transforms the points of the group in one pass. This
+    pays off for groups of thousands of small mobjects like dots or lines.
+
+    Submobjects can still be modified on their own. If this replaces one of
+    their arrays instead of modifying it in place, or if the family of the group
+    changes, the arrays are packed again before the next operation on the group.
+
+    The functions passed to :meth:`apply_points_function_about_point` and
+    :meth:`interpolate_family` are called once with the points of the whole
+    family, so they must treat each point independently, as the path functions
+    in :mod:`~.utils.paths` do.
+
+    Notes
+    -----
+    With the OpenGL renderer, this behaves like a plain :class:`VGroup`.
+
+    Examples
+    --------
+    .. manim:: PackedDotsExample
+
+        class PackedDotsExample(Scene):
+            def construct(self):
+                dots = PackedVGroup(
+                    *(
+                        Dot([x, y, 0], radius=0.03)
+                        for x in np.linspace(-6, 6, 49)
+                        for y in np.linspace(-3, 3, 25)
+                    )
+                )
+                self.add(dots)
+                self.play(dots.animate.rotate(PI / 6).set_color(YELLOW))
+    """
+
+    _packed_array_names = (
+        "_points",
+        "fill_rgbas",
+        "stroke_rgbas",
+        "background_stroke_rgbas",
+    )
+    _packing: _PackedArrays | None = None
+
+    def __init__(
+        self, *vmobjects: VMobject | Iterable[VMobject], **kwargs: Any
+    ) -> None:
+        super().__init__(*vmobjects, **kwargs)
+        self.pack()
+
+    def __deepcopy__(self, clone_from_id) -> Self:
+        # Pack first, so that no points are shared with other copies yet.
+        packing = self._ensure_packed()
+        result = super().__deepcopy__(clone_from_id)
+        result.pack()
+        if packing is not None:
+            # The copy no longer shares the packed points, so they can be
+            # modified in place again, see :attr:`.Mobject.points`.
+            for mob in packing.members:
+                mob._points_shared = False
+        return result
+
+    def pack(self) -> Self:
+        """Store the points and colors of the family in contiguous arrays.
+
+        This happens automatically whenever needed, see :class:`PackedVGroup`.
+
+        Returns
+        -------
+        :class:`PackedVGroup`
+            ``self``
+        """
+        if not isinstance(self, VMobject):
+            # OpenGL renderer
+            return self
+        family = self._get_family()
+        members = [mob for mob in family if isinstance(mob, VMobject)]
+        packing = _PackedArrays()
+        packing.family = family
+        packing.members = members
+        packing.buffers = {}
+        packing.views = {}
+        packing.lengths = {}
+        for name in self._packed_array_names:
+            arrays = [getattr(mob, name) for mob in members]
+            lengths = tuple(len(array) for array in arrays)
+            buffer = np.concatenate(arrays, dtype=float)
+            ends = np.cumsum(lengths)
+            views = [buffer[end - length : end] for length, end in zip(lengths, ends)]
+            # The views hold the same values as the arrays they replace, so
+            # the bounding boxes stay valid.
+            for mob, view in zip(members, views):
+                setattr(mob, name, view)
+            packing.buffers[name] = buffer
+            packing.views[name] = views
+            packing.lengths[name] = lengths
+        # The points were copied into the buffer, so none are shared any more.
+        for mob in members:
+            mob._points_shared = False
+        packing.plain_style = all(
+            type(mob).set_fill is VMobject.set_fill
+            and type(mob).set_stroke is VMobject.set_stroke
+            and type(mob).interpolate is VMobject.interpolate
+            and type(mob).interpolate_color is VMobject.interpolate_color
+            for mob in members
+            if mob is not self
+        )
+        self._packing = packing
+        return self
+
+    def _ensure_packed(self) -> _PackedArrays | None:
+        """Return the packed arrays, packing the family again if it changed or
+        if any of its arrays were replaced, or ``None`` if the group is not
+        packed at all.
+        """
+        packing = self._packing
+        if packing is None:
+            return None
+        if packing.family is not self._get_family() or not all(
+            getattr(mob, name) is view
+            for name, views in packing.views.items()
+            for mob, view in zip(packing.members, views)
+        ):
+            return self.pack()._packing
+        if any(mob._points_shared for mob in packing.members):
+            # Some points are shared with a copy.
+            return self.pack()._packing
+        return packing
+
+    def get_packed_members(self) -> list[VMobject]:
+        """Return the members of the family whose arrays are packed, in the
+        order of the packed arrays.
+        """
+        packing = self._ensure_packed()
+        return [] if packing is None else packing.members
+
+    def get_packed_points(self) -> Point3D_Array:
+        """Return the points of the whole family as one array.
+
+        The points of each member of :meth:`get_packed_members` follow each
+        other; modifying the array in place modifies the members.
+        """
+        packing = self._ensure_packed()
+        if packing is None:
+            return self.get_all_points()
+        return packing.buffers["_points"]
+
+    def _refresh_packed_bounding_boxes(self, packing: _PackedArrays) -> None:
+        for mob in packing.members:
+            mob._invalidate_bounding_box()
+
+    def shift(self, *vectors: Vector3D) -> Self:
+        packing = self._ensure_packed()
+        if packing is None:
+            return super().shift(*vectors)
+        packing.buffers["_points"] += reduce(op.add, vectors)
+        self._refresh_packed_bounding_boxes(packing)
+        return self
+
+    def apply_points_function_about_point(
+        self,
+        func: MultiMappingFunction,
+        about_point: Point3DLike | None = None,
+        about_edge: Vector3D | None = None,
+    ) -> Self:
+        packing = self._ensure_packed()
+        if packing is None:
+            return super().apply_points_function_about_point(
+                func, about_point, about_edge
+            )
+        if about_point is None:
+            if about_edge is None:
+                about_edge = ORIGIN
+            about_point = self.get_critical_point(about_edge)
+        points = packing.buffers["_points"]
+        points -= about_point
+        points[:] = func(points)
+        points += about_point
+        self._refresh_packed_bounding_boxes(packing)
+        return self
+
+    def _set_packed_rgbas(
+        self,
+        name: str,
+        color: ParsableManimColor | None,
+        opacity: float | None,
+    ) -> _PackedArrays | None:
+        """Set the colors of the whole family at once, as
+        :meth:`~.VMobject.update_rgbas_array` would for each member.
+
+        Returns the packed arrays, or ``None`` if some member needs to be
+        handled separately.
+        """
+        packing = self._ensure_packed()
+        if packing is None or not packing.plain_style:
+            return None
+        rgbas = self.generate_rgbas_array(color, opacity)
+        # A sheen adds a second color, and members without any color get
+        # a new array.
+        if len(rgbas) != 1 or not all(
+            len(view) and not mob.get_sheen_factor()
+            for mob, view in zip(packing.members, packing.views[name])
+        ):
+            return None
+        buffer = packing.buffers[name]
+        if color is not None:
+            buffer[:, :3] = rgbas[0, :3]
+        if opacity is not None:
+            buffer[:, 3] = rgbas[0, 3]
+        return packing
+
+    def set_fill(
+        self,
+        color: ParsableManimColor | None = None,
+        opacity: float | None = None,
+        family: bool = True,
+    ) -> Self:
+        packing = (
+            self._set_packed_rgbas("fill_rgbas", color, opacity) if family else None
+        )
+        if packing is None:
+            return super().set_fill(color, opacity, family)
+        if opacity is not None:
+            for mob in packing.members:
+                mob.fill_opacity = opacity
+        return self
+
+    def set_stroke(
+        self,
+        color: ParsableManimColor = None,
+        width: float | None = None,
+        opacity: float | None = None,
+        background=False,
+        family: bool = True,
+    ) -> Self:
+        array_name = "background_stroke_rgbas" if background else "stroke_rgbas"
+        packing = self._set_packed_rgbas(array_name, color, opacity) if family else None
+        if packing is None:
+            return super().set_stroke(color, width, opacity, background, family)
+        if background:
+            width_name = "background_stroke_width"
+            opacity_name = "background_stroke_opacity"
+        else:
+            width_name = "stroke_width"
+            opacity_name = "stroke_opacity"
+        if color is not None and background:
+            if isinstance(color, (list, tuple)):
+                color = ManimColor.parse(color)
+            else:
+                color = ManimColor(color)
+        for mob in packing.members:
+            if width is not None:
+                setattr(mob, width_name, width)
+            if opacity is not None:
+                setattr(mob, opacity_name, opacity)
+            if color is not None and background:
+                mob.background_stroke_color = color
+        return self
+
+    def interpolate_family(
+        self,
+        mobject1: Mobject,
+        mobject2: Mobject,
+        alpha: float,
+        path_func: PathFuncType = straight_path(),
+    ) -> Self:
+        """Interpolate each member of the family between the corresponding
+        members of the families of ``mobject1`` and ``mobject2``, as
+        :class:`.Transform` does.
+
+        If both are packed groups with the same layout as this one, each array
+        is interpolated in a single step.
+
+        Returns
+        -------
+        :class:`PackedVGroup`
+            ``self``
+        """
+        packings = (
+            self._ensure_packed(),
+            mobject1._ensure_packed() if isinstance(mobject1, PackedVGroup) else None,
+            mobject2._ensure_packed() if isinstance(mobject2, PackedVGroup) else None,
+        )
+        packing, packing1, packing2 = packings
+        if (
+            any(p is None for p in packings)
+            or not packing.plain_style
+            or not packing.lengths == packing1.lengths == packing2.lengths
+        ):
+            for mob, mob1, mob2 in zip(
+                self.family_members_with_points(),
+                mobject1.family_members_with_points(),
+                mobject2.family_members_with_points(),
+            ):
+                mob.interpolate(mob1, mob2, alpha, path_func)
+            return self
+        for name, buffer in packing.buffers.items():
+            if name == "_points":
+                buffer[:] = path_func(
+                    packing1.buffers[name], packing2.buffers[name], alpha
+                )
+            else:
+                buffer[:] = interpolate(
+                    packing1.buffers[name], packing2.buffers[name], alpha
+                )
+        for mob, mob1, mob2 in zip(packing.members, packing1.members, packing2.members):
+            for attr in (
+                "stroke_width",
+                "background_stroke_width",
+                "sheen_direction",
+                "sheen_factor",
+            ):
+                value = (
+                    getattr(mob2, attr)
+                    if alpha == 1.0
+                    else interpolate(getattr(mob1, attr), getattr(mob2, attr), alpha)
+                )
+                if isinstance(value, np.ndarray):
+                    value = value.copy()
+                setattr(mob, attr, value)
+        self._refresh_packed_bounding_boxes(packing)
+        return self
+
+
 class VDict(VMobject, metaclass=ConvertToOpenGL):
     """A VGroup-like class, also offering submobject access by
     key, like a python dict
@@ -2648,7 +3268,7 @@ class VectorizedPoint(VMobject, metaclass=ConvertToOpenGL):
         return self.artificial_height
 
     def get_location(self) -> Point3D:
-        return np.array(self.points[0])
+        return np.array(self.get_points()[0])
 
     def set_location(self, new_loc: Point3D):
         self.set_points(np.array([new_loc]))
@@ -2707,7 +3327,7 @@ class CurvesAsSubmobjects(VGroup):
         submobjs_with_pts = self._get_submobjects_with_points()
 
         if alpha == 1:
-            return submobjs_with_pts[-1].points[-1]
+            return submobjs_with_pts[-1].get_points()[-1]
 
         submobjs_arc_lengths = tuple(
             part.get_arc_length() for part in submobjs_with_pts
@@ -2734,7 +3354,7 @@ class CurvesAsSubmobjects(VGroup):
 
     def _get_submobjects_with_points(self):
         submobjs_with_pts = tuple(
-            part for part in self.submobjects if len(part.points) > 0
+            part for part in self.submobjects if len(part.get_points()) > 0
         )
         if len(submobjs_with_pts) == 0:
             caller_name = sys._getframe(1).f_code.co_name
@@ -2762,6 +3382,10 @@ class DashedVMobject(VMobject, metaclass=ConvertToOpenGL):
             If ``True``, dashes will be (approximately) equally long.
             If ``False``, dashes will be split evenly in the curve's
             input t variable (legacy behavior).
+        dashes_as_subpaths
+            If ``True``, the dashes are the subpaths of this mobject instead
+            of one submobject each, which is much cheaper for many dashes.
+            Fills of the dashes are then drawn together.
 
     Examples
     --------
@@ -2806,96 +3430,257 @@ class DashedVMobject(VMobject, metaclass=ConvertToOpenGL):
         dash_offset: float = 0,
         color: ManimColor = WHITE,
         equal_lengths: bool = True,
+        dashes_as_subpaths: bool = False,
         **kwargs,
     ) -> None:
         self.dashed_ratio = dashed_ratio
         self.num_dashes = num_dashes
+        self.dash_offset = dash_offset
+        self.equal_lengths = equal_lengths
+        self.dashes_as_subpaths = dashes_as_subpaths
         super().__init__(color=color, **kwargs)
-        r = self.dashed_ratio
-        n = self.num_dashes
-        if n > 0:
-            # Assuming total length is 1
-            dash_len = r / n
-            if vmobject.is_closed():
-                void_len = (1 - r) / n
+        # What is needed to compute the dashes again for another offset.
+        self._set_dashed_curves(vmobject._get_curves().copy())
+        self._dashed_is_closed = vmobject.has_points() and vmobject.is_closed()
+        if self.num_dashes > 0:
+            dash_starts, dash_ends = self._get_dash_proportions()
+            if self.dashes_as_subpaths:
+                self.points = self._get_dash_points(dash_starts, dash_ends)[0]
             else:
-                void_len = 1 - r if n == 1 else (1 - r) / (n - 1)
-
-            period = dash_len + void_len
-            phase_shift = (dash_offset % 1) * period
-
-            if vmobject.is_closed():  # noqa: SIM108
-                # closed curves have equal amount of dashes and voids
-                pattern_len = 1
-            else:
-                # open curves start and end with a dash, so the whole dash pattern with the last void is longer
-                pattern_len = 1 + void_len
-
-            dash_starts = [((i * period + phase_shift) % pattern_len) for i in range(n)]
-            dash_ends = [
-                ((i * period + dash_len + phase_shift) % pattern_len) for i in range(n)
-            ]
-
-            # closed shapes can handle overflow at the 0-point
-            # open shapes need special treatment for it
-            if not vmobject.is_closed():
-                # due to phase shift being [0...1] range, always the last dash element needs attention for overflow
-                # if an entire dash moves out of the shape end:
-                if dash_ends[-1] > 1 and dash_starts[-1] > 1:
-                    # remove the last element since it is out-of-bounds
-                    dash_ends.pop()
-                    dash_starts.pop()
-                elif dash_ends[-1] < dash_len:  # if it overflowed
-                    if (
-                        dash_starts[-1] < 1
-                    ):  # if the beginning of the piece is still in range
-                        dash_starts.append(0)
-                        dash_ends.append(dash_ends[-1])
-                        dash_ends[-2] = 1
-                    else:
-                        dash_starts[-1] = 0
-                elif dash_starts[-1] > (1 - dash_len):
-                    dash_ends[-1] = 1
-
-            if equal_lengths:
-                # calculate the entire length by adding up short line-pieces
-                norms = np.array(0)
-                for k in range(vmobject.get_num_curves()):
-                    norms = np.append(norms, vmobject.get_nth_curve_length_pieces(k))
-                # add up length-pieces in array form
-                length_vals = np.cumsum(norms)
-                ref_points = np.linspace(0, 1, length_vals.size)
-                curve_length = length_vals[-1]
                 self.add(
                     *(
-                        vmobject.get_subcurve(
-                            np.interp(
-                                dash_starts[i] * curve_length,
-                                length_vals,
-                                ref_points,
-                            ),
-                            np.interp(
-                                dash_ends[i] * curve_length,
-                                length_vals,
-                                ref_points,
-                            ),
-                        )
-                        for i in range(len(dash_starts))
-                    )
-                )
-            else:
-                self.add(
-                    *(
-                        vmobject.get_subcurve(
-                            dash_starts[i],
-                            dash_ends[i],
-                        )
-                        for i in range(len(dash_starts))
+                        vmobject.get_subcurve(dash_start, dash_end)
+                        for dash_start, dash_end in zip(dash_starts, dash_ends)
                     )
                 )
+        # The points of the dashes when they were computed, to find how this
+        # mobject has been transformed since.
+        self._dashed_points = self._get_dashes_points()
         # Family is already taken care of by get_subcurve
         # implementation
         if config.renderer == RendererType.OPENGL:
             self.match_style(vmobject, recurse=False)
         else:
             self.match_style(vmobject, family=False)
+
+    def set_dash_offset(self, dash_offset: float) -> Self:
+        """Shift the dashes along the dashed :class:`VMobject`, for instance
+        to animate marching ants.
+
+        The dashes are computed again from the points the dashed
+        :class:`VMobject` had when this mobject was created, moved by the
+        affine transformation (shifts, rotations, scalings, ...) that this
+        mobject has undergone since. Other deformations, for instance by
+        :meth:`~.Mobject.apply_function`, are followed approximately, by also
+        moving each point like the closest point of the dashes. No mobjects are
+        created: with ``dashes_as_subpaths``, only the points of this
+        mobject change, otherwise the points of the dashes change and dashes
+        are only added or removed when their number changes.
+
+        Parameters
+        ----------
+        dash_offset
+            The new offset of the dashes, as in :class:`DashedVMobject`.
+
+        Returns
+        -------
+        :class:`DashedVMobject`
+            ``self``
+
+        Examples
+        --------
+        ::
+
+            circle = DashedVMobject(Circle(), dashes_as_subpaths=True)
+            circle.add_updater(
+                lambda mob, dt: mob.set_dash_offset(mob.dash_offset + dt)
+            )
+        """
+        self.dash_offset = dash_offset
+        if self.num_dashes <= 0:
+            return self
+        self._follow_dashes()
+        points, offsets = self._get_dash_points(*self._get_dash_proportions())
+        if self.dashes_as_subpaths:
+            self.points = points
+            self._dashed_points = self._get_dashes_points()
+            return self
+        num_dashes = len(offsets) - 1
+        if len(self.submobjects) > num_dashes:
+            self.remove(*self.submobjects[num_dashes:])
+        elif self.submobjects:
+            self.add(
+                *(
+                    self.submobjects[-1].copy()
+                    for _ in range(num_dashes - len(self.submobjects))
+                )
+            )
+        for dash, start, end in zip(self.submobjects, offsets, offsets[1:]):
+            dash.points = points[start:end]
+        self._dashed_points = self._get_dashes_points()
+        return self
+
+    def _set_dashed_curves(self, curves: npt.NDArray[ManimFloat]) -> None:
+        """Set the curves of the dashed :class:`VMobject`, of shape
+        ``(num_curves, n_points_per_cubic_curve, dim)``.
+        """
+        self._dashed_curves = curves
+        # The length of the dashed vmobject up to each of the points sampled on
+        # its curves, starting at 0.
+        self._dashed_length_vals = np.cumsum(
+            np.append(0, VMobject._get_length_pieces_of_curves(curves, 10))
+        )
+
+    def _get_dashes_points(self) -> Point3D_Array:
+        """Return the points of the dashes, whether they are subpaths or
+        submobjects, as a new array.
+        """
+        return np.concatenate(
+            [np.zeros((0, self.dim))] + [mob.get_points() for mob in self.get_family()]
+        )
+
+    def _follow_dashes(self) -> None:
+        """Apply to the dashed curves the affine transformation that maps the
+        points the dashes were computed with to their current points.
+
+        If the points are not related by an affine transformation, each point
+        of the dashed curves is additionally moved by the deviation from it of
+        the closest of these points.
+
+        Nothing changes if the points of the dashes are the same, or if their
+        number changed and the transformation can therefore not be found.
+        """
+        reference = self._dashed_points
+        points = self._get_dashes_points()
+        if (
+            len(reference) == 0
+            or points.shape != reference.shape
+            or np.array_equal(points, reference)
+        ):
+            return
+        # Fit the transformation in homogeneous coordinates. It is only
+        # determined on the affine span of the dashes, for instance their plane,
+        # which contains the dashed curves as well.
+        homogeneous = np.column_stack([reference, np.ones(len(reference))])
+        matrix = np.linalg.lstsq(homogeneous, points, rcond=None)[0]
+        curves = self._dashed_curves @ matrix[:-1] + matrix[-1]
+        residuals = points - homogeneous @ matrix
+        if not np.allclose(residuals, 0, atol=1e-6):
+            # The dashes lie on the dashed curves, so that the deviation of the
+            # closest of their points approximates the one of each curve point.
+            closest = KDTree(reference).query(
+                self._dashed_curves.reshape(-1, self.dim)
+            )[1]
+            curves += residuals[closest].reshape(curves.shape)
+        self._set_dashed_curves(curves)
+
+    def _get_dash_proportions(
+        self,
+    ) -> tuple[npt.NDArray[ManimFloat], npt.NDArray[ManimFloat]]:
+        """Return the proportions of the dashed :class:`VMobject`, as taken by
+        :meth:`~.VMobject.get_subcurve`, at which the dashes start and end.
+        """
+        r = self.dashed_ratio
+        n = self.num_dashes
+        is_closed = self._dashed_is_closed
+        # Assuming total length is 1
+        dash_len = r / n
+        if is_closed:  # noqa: SIM108
+            void_len = (1 - r) / n
+        else:
+            void_len = 1 - r if n == 1 else (1 - r) / (n - 1)
+
+        period = dash_len + void_len
+        phase_shift = (self.dash_offset % 1) * period
+
+        if is_closed:  # noqa: SIM108
+            # closed curves have equal amount of dashes and voids
+            pattern_len = 1
+        else:
+            # open curves start and end with a dash, so the whole dash pattern with the last void is longer
+            pattern_len = 1 + void_len
+
+        dash_starts = [((i * period + phase_shift) % pattern_len) for i in range(n)]
+        dash_ends = [
+            ((i * period + dash_len + phase_shift) % pattern_len) for i in range(n)
+        ]
+
+        # closed shapes can handle overflow at the 0-point
+        # open shapes need special treatment for it
+        if not is_closed:
+            # due to phase shift being [0...1] range, always the last dash element needs attention for overflow
+            # if an entire dash moves out of the shape end:
+            if dash_ends[-1] > 1 and dash_starts[-1] > 1:
+                # remove the last element since it is out-of-bounds
+                dash_ends.pop()
+                dash_starts.pop()
+            elif dash_ends[-1] < dash_len:  # if it overflowed
+                if (
+                    dash_starts[-1] < 1
+                ):  # if the beginning of the piece is still in range
+                    dash_starts.append(0)
+                    dash_ends.append(dash_ends[-1])
+                    dash_ends[-2] = 1
+                else:
+                    dash_starts[-1] = 0
+            elif dash_starts[-1] > (1 - dash_len):
+                dash_ends[-1] = 1
+
+        if self.equal_lengths:
+            # Find the proportions at which the dashes are at the given
+            # proportions of the length of the curve.
+            length_vals = self._dashed_length_vals
+            ref_points = np.linspace(0, 1, length_vals.size)
+            curve_length = length_vals[-1]
+            return (
+                np.interp(
+                    np.multiply(dash_starts, curve_length), length_vals, ref_points
+                ),
+                np.interp(
+                    np.multiply(dash_ends, curve_length), length_vals, ref_points
+                ),
+            )
+        return np.array(dash_starts, dtype=float), np.array(dash_ends, dtype=float)
+
+    def _get_dash_points(
+        self,
+        dash_starts: npt.NDArray[ManimFloat],
+        dash_ends: npt.NDArray[ManimFloat],
+    ) -> tuple[Point3D_Array, npt.NDArray[np.int_]]:
+        """Return the points of all the dashes at once, along with the
+        indices at which the points of each dash start, followed by the
+        number of points.
+
+        The dashes are the same curves as :meth:`~.VMobject.get_subcurve`
+        gives.
+        """
+        curves = self._dashed_curves
+        num_curves = len(curves)
+        if num_curves == 0:
+            return np.zeros((0, self.dim)), np.zeros(len(dash_starts) + 1, dtype=int)
+        lower_index, lower_residue = _integer_interpolate_arrays(
+            num_curves, dash_starts
+        )
+        upper_index, upper_residue = _integer_interpolate_arrays(num_curves, dash_ends)
+        # The dashes of closed curves may continue from the last curve to the
+        # first one.
+        if self._dashed_is_closed:
+            upper_index = upper_index + num_curves * (dash_starts > dash_ends)
+        lengths = upper_index - lower_index + 1
+        offsets = np.append(0, np.cumsum(lengths))
+        curve_indices = np.repeat(lower_index - offsets[:-1], lengths) + np.arange(
+            offsets[-1]
+        )
+        dash_curves = curves[curve_indices % num_curves]
+
+        # The first curve of each dash starts at the lower residue, and its
+        # last curve ends at the upper residue.
+        lower = np.zeros(len(dash_curves))
+        upper = np.ones(len(dash_curves))
+        lower[offsets[:-1]] = lower_residue
+        upper[offsets[1:] - 1] = upper_residue
+        partial = np.union1d(offsets[:-1], offsets[1:] - 1)
+        dash_curves[partial] = partial_bezier_curves(
+            dash_curves[partial], lower[partial], upper[partial]
+        )
+        return dash_curves.reshape(-1, self.dim), offsets * curves.shape[1]
@@ -2,15 +2,51 @@
 
 from __future__ import annotations
 
-__all__ = ["ValueTracker", "ComplexValueTracker"]
+__all__ = ["ValueTracker", "ComplexValueTracker", "record_value_trackers"]
 
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import numpy as np
 
 from manim.mobject.mobject import Mobject
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 from manim.utils.paths import straight_path
 
+# The lists of the currently active record_value_trackers() contexts.
+_tracker_records: list[list[ValueTracker]] = []
+
+
+@contextmanager
+def record_value_trackers() -> Iterator[list[ValueTracker]]:
+    """Record the value trackers whose value is read within the context.
+
+    Yields
+    ------
+    List[:class:`ValueTracker`]
+        A list which is extended by each value tracker (once) whose
+        :meth:`~.ValueTracker.get_value` is called within the context.
+
+    Examples
+    --------
+    ::
+
+        >>> from manim import ValueTracker, record_value_trackers
+        >>> tracker = ValueTracker(1)
+        >>> with record_value_trackers() as trackers:
+        ...     _ = tracker.get_value() + tracker.get_value()
+        >>> trackers == [tracker]
+        True
+    """
+    trackers = []
+    _tracker_records.append(trackers)
+    try:
+        yield trackers
+    finally:
+        _tracker_records.remove(trackers)
+        trackers[:] = dict.fromkeys(trackers)
+
 
 class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
     """A mobject that can be used for tracking (real-valued) parameters.
@@ -76,11 +112,14 @@ class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
 
     def get_value(self) -> float:
         """Get the current value of this ValueTracker."""
+        for trackers in _tracker_records:
+            trackers.append(self)
         return self.points[0, 0]
 
     def set_value(self, value: float):
         """Sets a new scalar value to the ValueTracker"""
         self.points[0, 0] = value
+        self.refresh_bounding_box()
         return self
 
     def increment_value(self, d_value: float):
@@ -167,10 +206,13 @@ class ComplexValueTracker(ValueTracker):
         The value is internally stored as a points array [a, b, 0]. This can be accessed directly
         to represent the value geometrically, see the usage example.
         """
+        for trackers in _tracker_records:
+            trackers.append(self)
         return complex(*self.points[0, :2])
 
     def set_value(self, z):
         """Sets a new complex value to the ComplexValueTracker"""
         z = complex(z)
         self.points[0, :2] = (z.real, z.imag)
+        self.refresh_bounding_box()
         return self
@@ -813,6 +813,7 @@ class StreamLines(VectorField):
                     max_color_scheme_value,
                     colors,
                 )
+        lines = []
         for point in start_points:
             points = [point]
             for _ in range(max_steps):
@@ -827,7 +828,12 @@ class StreamLines(VectorField):
             line = get_vectorized_mobject_class()()
             line.duration = step * dt
             step = max(1, int(len(points) / self.max_anchors_per_line))
-            line.set_points_smoothly(points[::step])
+            line.set_points_as_corners(points[::step])
+            lines.append(line)
+        # Smooth all the lines at once, as set_points_smoothly would.
+        self.add(*lines)
+        self.make_smooth()
+        for line in lines:
             if self.single_color:
                 line.set_stroke(
                     color=self.color, width=self.stroke_width, opacity=opacity
@@ -851,7 +857,6 @@ class StreamLines(VectorField):
                     else:
                         line.color_using_background_image(self.background_img)
                     line.set_stroke(width=self.stroke_width, opacity=opacity)
-            self.add(line)
         self.stream_lines = [*self.submobjects]
 
     def create(
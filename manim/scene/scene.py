@@ -8,6 +8,7 @@ __all__ = ["Scene"]
 
 import copy
 import datetime
+import heapq
 import inspect
 import platform
 import random
@@ -48,8 +49,9 @@ from ..utils import opengl, space_ops
 from ..utils.exceptions import EndSceneEarlyException, RerunSceneException
 from ..utils.family import extract_mobject_family_members
 from ..utils.family_ops import restructure_list_to_exclude_certain_family_members
-from ..utils.file_ops import open_media_file
+from ..utils.file_ops import guarantee_existence, open_media_file
 from ..utils.iterables import list_difference_update, list_update
+from ..utils.profiler import FrameProfiler, measure
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -127,6 +129,7 @@ class Scene:
         self.widgets = []
         self.dearpygui_imported = dearpygui_imported
         self.updaters = []
+        self.updater_statistics: list[tuple[int, int]] = []
         self.point_lights = []
         self.ambient_light = None
         self.key_to_function_map = {}
@@ -148,8 +151,11 @@ class Scene:
         else:
             self.renderer = renderer
         self.renderer.init_scene(self)
+        self._profiler = None
+        if config.profile_frames:
+            self.profiler = FrameProfiler()
 
-        self.mobjects = []
+        self.mobjects: list[Mobject] = []
         # TODO, remove need for foreground mobjects
         self.foreground_mobjects = []
         if self.random_seed is not None:
@@ -160,6 +166,22 @@ class Scene:
     def camera(self):
         return self.renderer.camera
 
+    @property
+    def profiler(self) -> FrameProfiler | None:
+        """The profiler measuring the time spent rendering each frame, or ``None``.
+
+        It is created if the ``profile_frames`` option is set, and its results
+        are written to the ``profiles`` folder of the media directory once the
+        scene is rendered.
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: FrameProfiler | None) -> None:
+        self._profiler = profiler
+        self.renderer.camera.profiler = profiler
+        self.renderer.file_writer.profiler = profiler
+
     @property
     def time(self) -> float:
         """The time since the start of the scene."""
@@ -245,6 +267,8 @@ class Scene:
         self.tear_down()
         # We have to reset these settings in case of multiple renders.
         self.renderer.scene_finished(self)
+        if self.profiler is not None:
+            self.write_profile()
 
         # Show info only if animations are rendered or to get image
         if (
@@ -263,6 +287,20 @@ class Scene:
         if config["preview"] or config["show_in_file_browser"]:
             open_media_file(self.renderer.file_writer)
 
+    def write_profile(self) -> None:
+        """Write the measurements of :attr:`profiler` to ``trace.json`` (in the
+        Chrome trace event format) and ``summary.txt``, in the folder
+        ``profiles/<scene name>`` of the media directory.
+        """
+        directory = guarantee_existence(
+            config.get_dir("media_dir") / "profiles" / str(self),
+        )
+        self.profiler.write_trace(directory / "trace.json")
+        summary = self.profiler.get_summary()
+        (directory / "summary.txt").write_text(summary, encoding="utf-8")
+        logger.info(f"Frame profile of {str(self)}:\n{summary}")
+        logger.info(f"Profile written to {directory}")
+
     def setup(self):
         """
         This is meant to be implemented by any scenes which
@@ -347,13 +385,110 @@ class Scene:
         """
         Begins updating all mobjects in the Scene.
 
+        Updaters added with ``depends_on`` (see :meth:`.Mobject.add_updater`) are
+        called after the updaters of the mobjects they depend on, and skipped if
+        these did not change. In that case, the updaters of each mobject are called
+        once, even if it is part of several families.
+
+        With the Cairo renderer, if there are such updaters or :attr:`profiler` is
+        set, the numbers of called and skipped updaters are appended to
+        :attr:`updater_statistics`, and the time spent in each updater is measured
+        by the profiler. Otherwise, the mobjects are simply updated in turn.
+
         Parameters
         ----------
         dt
             Change in time between updates. Defaults (mostly) to 1/frames_per_second
         """
+        if config.renderer == RendererType.OPENGL or (
+            self.profiler is None
+            and not any(mob._has_family_dependent_updaters() for mob in self.mobjects)
+        ):
+            for mobject in self.mobjects:
+                mobject.update(dt)
+            return
+        updated_mobjects = self.get_updated_mobjects()
+        if any(mob.get_updater_dependencies() for mob in updated_mobjects):
+            updated_mobjects = self.sort_by_updater_dependencies(
+                list(dict.fromkeys(updated_mobjects)),
+            )
+        skipped = 0
+        for mob in updated_mobjects:
+            if type(mob).update is Mobject.update:
+                skipped += mob._call_updaters(dt, self.profiler)
+            else:
+                # Respect overrides of update; the submobjects are in the list
+                # themselves if they have updaters.
+                with measure(self.profiler, "update", type(mob).__qualname__):
+                    mob.update(dt, recursive=False)
+        num_updaters = sum(len(mob.updaters) for mob in updated_mobjects)
+        self.updater_statistics.append((num_updaters - skipped, skipped))
+
+    def get_updated_mobjects(self) -> list[Mobject]:
+        """Return the mobjects whose updaters are called by :meth:`update_mobjects`.
+
+        Returns
+        -------
+        list
+            The family members of the mobjects in the scene which have updaters and
+            whose updating is not suspended, in the order of the scene.
+        """
+        updated_mobjects = []
+
+        def collect(mobject):
+            if mobject.updating_suspended or not mobject.has_family_updaters():
+                return
+            if mobject.updaters:
+                updated_mobjects.append(mobject)
+            for submob in mobject.submobjects:
+                collect(submob)
+
         for mobject in self.mobjects:
-            mobject.update(dt)
+            collect(mobject)
+        return updated_mobjects
+
+    @staticmethod
+    def sort_by_updater_dependencies(mobjects: list[Mobject]) -> list[Mobject]:
+        """Sort mobjects such that the updaters of each mobject are called after
+        the updaters of the mobjects they depend on.
+
+        Mobjects without such a dependency keep their order. If the dependencies
+        are cyclic, the mobjects on the cycle keep their order as well.
+
+        Parameters
+        ----------
+        mobjects
+            The mobjects to sort, see :meth:`get_updated_mobjects`.
+
+        Returns
+        -------
+        list
+            The sorted mobjects.
+        """
+        index = {mob: i for i, mob in enumerate(mobjects)}
+        dependents = [[] for _ in mobjects]
+        num_dependencies = [0] * len(mobjects)
+        for i, mob in enumerate(mobjects):
+            for dependency in mob.get_updater_dependencies():
+                # The updaters of the submobjects of a dependency modify it too.
+                for member in dependency.get_family():
+                    j = index.get(member, i)
+                    if j != i:
+                        dependents[j].append(i)
+                        num_dependencies[i] += 1
+        # Kahn's algorithm, always continuing with the first mobject in the
+        # scene whose dependencies are done.
+        ready = [i for i, n in enumerate(num_dependencies) if n == 0]
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for j in dependents[i]:
+                num_dependencies[j] -= 1
+                if num_dependencies[j] == 0:
+                    heapq.heappush(ready, j)
+        order += [i for i, n in enumerate(num_dependencies) if n > 0]
+        return [mobjects[i] for i in order]
 
     def update_meshes(self, dt):
         for obj in self.meshes:
@@ -853,7 +988,7 @@ class Scene:
         for i, mob in enumerate(mobjects):
             update_possibilities = [
                 mob in animation_mobjects,
-                len(mob.get_family_updaters()) > 0,
+                mob.has_family_updaters(),
                 mob in self.foreground_mobjects,
             ]
             if any(update_possibilities):
@@ -1255,6 +1390,12 @@ class Scene:
 
     def begin_animations(self) -> None:
         """Start the animations of the scene."""
+        self.updater_statistics = []
+        if self.profiler is not None:
+            self.profiler.start_play(
+                f"play {self.renderer.num_plays}: "
+                + ", ".join(type(animation).__name__ for animation in self.animations),
+            )
         for animation in self.animations:
             animation._setup_scene(self)
             animation.begin()
@@ -1528,10 +1669,15 @@ class Scene:
     def update_to_time(self, t):
         dt = t - self.last_t
         self.last_t = t
+        profiler = self.profiler
         for animation in self.animations:
             animation.update_mobjects(dt)
             alpha = t / animation.run_time
-            animation.interpolate(alpha)
+            if profiler is None:
+                animation.interpolate(alpha)
+            else:
+                with profiler.measure("interpolate", type(animation).__qualname__):
+                    animation.interpolate(alpha)
         self.update_mobjects(dt)
         self.update_meshes(dt)
         self.update_self(dt)
@@ -34,6 +34,7 @@ from ..utils.file_ops import (
     modify_atime,
     write_to_movie,
 )
+from ..utils.profiler import FrameProfiler, measure
 from ..utils.sounds import get_full_sound_file_path
 from .section import DefaultSectionType, Section
 
@@ -105,6 +106,9 @@ class SceneFileWriter:
 
     force_output_as_scene_name = False
 
+    #: Measures the time spent writing frames, see :attr:`.Scene.profiler`.
+    profiler: FrameProfiler | None = None
+
     def __init__(
         self,
         renderer: CairoRenderer | OpenGLRenderer,
@@ -415,27 +419,31 @@ class SceneFileWriter:
     def listen_and_write(self):
         """For internal use only: blocks until new frame is available on the queue."""
         while True:
-            num_frames, frame_data = self.queue.get()
+            num_frames, frame_data, play = self.queue.get()
             if frame_data is None:
                 break
 
-            self.encode_and_write_frame(frame_data, num_frames)
+            self.encode_and_write_frame(frame_data, num_frames, play)
 
-    def encode_and_write_frame(self, frame: PixelArray, num_frames: int) -> None:
+    def encode_and_write_frame(
+        self, frame: PixelArray, num_frames: int, play: int | None = None
+    ) -> None:
         """
         For internal use only: takes a given frame in ``np.ndarray`` format and
-        write it to the stream
+        write it to the stream. ``play`` is the index of the play the frame was
+        written in, see :meth:`.FrameProfiler.add_measurement`.
         """
-        for _ in range(num_frames):
-            # Notes: precomputing reusing packets does not work!
-            # I.e., you cannot do `packets = encode(...)`
-            # and reuse it, as it seems that `mux(...)`
-            # consumes the packet.
-            # The same issue applies for `av_frame`,
-            # reusing it renders weird-looking frames.
-            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
-            for packet in self.video_stream.encode(av_frame):
-                self.video_container.mux(packet)
+        with measure(self.profiler, "encode", "encode_and_write_frame", play):
+            for _ in range(num_frames):
+                # Notes: precomputing reusing packets does not work!
+                # I.e., you cannot do `packets = encode(...)`
+                # and reuse it, as it seems that `mux(...)`
+                # consumes the packet.
+                # The same issue applies for `av_frame`,
+                # reusing it renders weird-looking frames.
+                av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+                for packet in self.video_stream.encode(av_frame):
+                    self.video_container.mux(packet)
 
     def write_frame(
         self, frame_or_renderer: np.ndarray | OpenGLRenderer, num_frames: int = 1
@@ -451,30 +459,34 @@ class SceneFileWriter:
         num_frames
             The number of times to write frame.
         """
-        if write_to_movie():
-            frame: np.ndarray = (
-                frame_or_renderer.get_frame()
-                if config.renderer == RendererType.OPENGL
-                else frame_or_renderer
-            )
-
-            msg = (num_frames, frame)
-            self.queue.put(msg)
+        with measure(self.profiler, "write_frame", "write_frame"):
+            if write_to_movie():
+                frame: np.ndarray = (
+                    frame_or_renderer.get_frame()
+                    if config.renderer == RendererType.OPENGL
+                    else frame_or_renderer
+                )
 
-        if is_png_format() and not config["dry_run"]:
-            image: Image = (
-                frame_or_renderer.get_image()
-                if config.renderer == RendererType.OPENGL
-                else Image.fromarray(frame_or_renderer)
-            )
-            target_dir = self.image_file_path.parent / self.image_file_path.stem
-            extension = self.image_file_path.suffix
-            self.output_image(
-                image,
-                target_dir,
-                extension,
-                config["zero_pad"],
-            )
+                # The frame is encoded later, when the profiler may already
+                # measure the next play.
+                play = None if self.profiler is None else self.profiler.current_play
+                msg = (num_frames, frame, play)
+                self.queue.put(msg)
+
+            if is_png_format() and not config["dry_run"]:
+                image: Image = (
+                    frame_or_renderer.get_image()
+                    if config.renderer == RendererType.OPENGL
+                    else Image.fromarray(frame_or_renderer)
+                )
+                target_dir = self.image_file_path.parent / self.image_file_path.stem
+                extension = self.image_file_path.suffix
+                self.output_image(
+                    image,
+                    target_dir,
+                    extension,
+                    config["zero_pad"],
+                )
 
     def output_image(self, image: Image.Image, target_dir, ext, zero_pad: bool):
         if zero_pad:
@@ -566,7 +578,7 @@ class SceneFileWriter:
             self.video_container = video_container
             self.video_stream = stream
 
-            self.queue: Queue[tuple[int, PixelArray | None]] = Queue()
+            self.queue: Queue[tuple[int, PixelArray | None, int | None]] = Queue()
             self.writer_thread = Thread(target=self.listen_and_write, args=())
             self.writer_thread.start()
 
@@ -577,7 +589,7 @@ class SceneFileWriter:
         in the video stream holding a partial file, and then close
         the corresponding container.
         """
-        self.queue.put((-1, None))
+        self.queue.put((-1, None, None))
         self.writer_thread.join()
 
         for packet in self.video_stream.encode():
@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = [
     "bezier",
     "partial_bezier_points",
+    "partial_bezier_curves",
     "split_bezier",
     "subdivide_bezier",
     "bezier_remap",
@@ -14,6 +15,7 @@ __all__ = [
     "inverse_interpolate",
     "match_interpolate",
     "get_smooth_cubic_bezier_handle_points",
+    "get_smooth_cubic_bezier_handle_points_batched",
     "is_closed",
     "proportions_along_bezier_curve_for_point",
     "point_lies_on_bezier",
@@ -29,12 +31,15 @@ import numpy as np
 from manim.utils.simple_functions import choose
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from manim.typing import (
         BezierPoints,
         BezierPoints_Array,
         BezierPointsLike,
         BezierPointsLike_Array,
         ColVector,
+        ManimFloat,
         MatrixMN,
         Point3D,
         Point3D_Array,
@@ -393,6 +398,64 @@ def partial_bezier_points(points: BezierPointsLike, a: float, b: float) -> Bezie
     return arr
 
 
+def partial_bezier_curves(
+    curves: BezierPointsLike_Array,
+    a: float | npt.ArrayLike,
+    b: float | npt.ArrayLike,
+) -> BezierPoints_Array:
+    r"""Like :func:`partial_bezier_points`, but for an array of Bézier curves of
+    the same degree, each of them with its own bounds.
+
+    Parameters
+    ----------
+    curves
+        An array of shape ``(n_curves, n_points_per_curve, dim)`` containing the
+        control points of the Bézier curves.
+    a
+        The lower bound of each of the partial curves, or one lower bound for
+        all of them.
+    b
+        The upper bound of each of the partial curves, or one upper bound for
+        all of them.
+
+    Returns
+    -------
+    :class:`~.BezierPoints_Array`
+        An array of the same shape as ``curves`` containing the control points
+        of the partial Bézier curves.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> curves = np.array([[[0, 0, 0], [1, 0, 0]], [[0, 0, 0], [0, 2, 0]]])
+        >>> partial_bezier_curves(curves, [0, 0.25], [0.5, 1])
+        array([[[0. , 0. , 0. ],
+                [0.5, 0. , 0. ]],
+        <BLANKLINE>
+               [[0. , 0.5, 0. ],
+                [0. , 2. , 0. ]]])
+    """
+    # See the fallback case of partial_bezier_points for the meaning of the
+    # two loops, which here process all the curves at once.
+    arr = np.array(curves, dtype=float)
+    N = arr.shape[1]
+    a = np.broadcast_to(np.asarray(a, dtype=float), arr.shape[:1])
+    b = np.broadcast_to(np.asarray(b, dtype=float), arr.shape[:1])
+
+    a_col = a[:, np.newaxis, np.newaxis]
+    for i in range(1, N):
+        arr[:, : N - i] += a_col * (arr[:, 1 : N - i + 1] - arr[:, : N - i])
+
+    # If a = 1, all the points already coincide with the last one.
+    mu = np.divide(1 - b, 1 - a, out=np.zeros_like(a), where=a < 1)
+    mu_col = mu[:, np.newaxis, np.newaxis]
+    for i in range(1, N):
+        arr[:, i:] += mu_col * (arr[:, i - 1 : -1] - arr[:, i:])
+
+    return arr
+
+
 def split_bezier(points: BezierPointsLike, t: float) -> Spline:
     r"""Split a Bézier curve at argument ``t`` into two curves.
 
@@ -1106,6 +1169,18 @@ def integer_interpolate(
     return (value, residue)
 
 
+def _integer_interpolate_arrays(
+    end: int | npt.NDArray[np.int_], alpha: npt.NDArray[ManimFloat]
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[ManimFloat]]:
+    """Vectorized :func:`integer_interpolate` from 0 to each of ``end``."""
+    value = end * alpha
+    index = np.where(alpha >= 1, end - 1, value.astype(int))
+    residue = np.where(alpha >= 1, 1.0, value % 1)
+    index[alpha <= 0] = 0
+    residue[alpha <= 0] = 0
+    return index, residue
+
+
 @overload
 def mid(start: float, end: float) -> float: ...
 
@@ -1293,6 +1368,31 @@ CP_CLOSED_MEMO = np.array([1 / 3])
 UP_CLOSED_MEMO = np.array([1 / 3])
 
 
+def _get_closed_memos(size: int) -> tuple[npt.NDArray[ManimFloat], ...]:
+    """Return the first ``size`` elements of :math:`c'` and :math:`u'` for
+    :func:`get_smooth_closed_cubic_bezier_handle_points`, extending
+    ``CP_CLOSED_MEMO`` and ``UP_CLOSED_MEMO`` if needed.
+    """
+    global CP_CLOSED_MEMO
+    global UP_CLOSED_MEMO
+
+    len_memo = CP_CLOSED_MEMO.size
+    if len_memo < size:
+        cp = np.empty(size)
+        up = np.empty(size)
+        cp[:len_memo] = CP_CLOSED_MEMO
+        up[:len_memo] = UP_CLOSED_MEMO
+        # Forward Substitution 1
+        # Calculate up (at the same time we calculate cp).
+        for i in range(len_memo, size):
+            cp[i] = 1 / (4 - cp[i - 1])
+            up[i] = -cp[i] * up[i - 1]
+        CP_CLOSED_MEMO = cp
+        UP_CLOSED_MEMO = up
+        return cp, up
+    return CP_CLOSED_MEMO[:size], UP_CLOSED_MEMO[:size]
+
+
 def get_smooth_closed_cubic_bezier_handle_points(
     anchors: Point3DLike_Array,
 ) -> tuple[Point3D_Array, Point3D_Array]:
@@ -1517,31 +1617,11 @@ def get_smooth_closed_cubic_bezier_handle_points(
         A tuple of two arrays: one containing the 1st handle for every curve in
         the closed cubic spline, and the other containing the 2nd handles.
     """
-    global CP_CLOSED_MEMO
-    global UP_CLOSED_MEMO
-
     A = np.asarray(anchors)
     N = A.shape[0] - 1
     dim = A.shape[1]
 
-    # Calculate cp (c prime) and up (u prime) with help from
-    # CP_CLOSED_MEMO and UP_CLOSED_MEMO.
-    len_memo = CP_CLOSED_MEMO.size
-    if len_memo < N - 1:
-        cp = np.empty(N - 1)
-        up = np.empty(N - 1)
-        cp[:len_memo] = CP_CLOSED_MEMO
-        up[:len_memo] = UP_CLOSED_MEMO
-        # Forward Substitution 1
-        # Calculate up (at the same time we calculate cp).
-        for i in range(len_memo, N - 1):
-            cp[i] = 1 / (4 - cp[i - 1])
-            up[i] = -cp[i] * up[i - 1]
-        CP_CLOSED_MEMO = cp
-        UP_CLOSED_MEMO = up
-    else:
-        cp = CP_CLOSED_MEMO[: N - 1]
-        up = UP_CLOSED_MEMO[: N - 1]
+    cp, up = _get_closed_memos(N - 1)
 
     # The last element of u' is different
     cp_last_division = 1 / (3 - cp[N - 2])
@@ -1585,6 +1665,24 @@ def get_smooth_closed_cubic_bezier_handle_points(
 CP_OPEN_MEMO = np.array([0.5])
 
 
+def _get_open_memo(size: int) -> npt.NDArray[ManimFloat]:
+    """Return the first ``size`` elements of :math:`c'` for
+    :func:`get_smooth_open_cubic_bezier_handle_points`, extending
+    ``CP_OPEN_MEMO`` if needed.
+    """
+    global CP_OPEN_MEMO
+
+    len_memo = CP_OPEN_MEMO.size
+    if len_memo < size:
+        cp = np.empty(size)
+        cp[:len_memo] = CP_OPEN_MEMO
+        for i in range(len_memo, size):
+            cp[i] = 1 / (4 - cp[i - 1])
+        CP_OPEN_MEMO = cp
+        return cp
+    return CP_OPEN_MEMO[:size]
+
+
 def get_smooth_open_cubic_bezier_handle_points(
     anchors: Point3DLike_Array,
 ) -> tuple[Point3D_Array, Point3D_Array]:
@@ -1697,22 +1795,11 @@ def get_smooth_open_cubic_bezier_handle_points(
         A tuple of two arrays: one containing the 1st handle for every curve in
         the open cubic spline, and the other containing the 2nd handles.
     """
-    global CP_OPEN_MEMO
-
     A = np.asarray(anchors)
     N = A.shape[0] - 1
     dim = A.shape[1]
 
-    # Calculate cp (c prime) with help from CP_OPEN_MEMO.
-    len_memo = CP_OPEN_MEMO.size
-    if len_memo < N - 1:
-        cp = np.empty(N - 1)
-        cp[:len_memo] = CP_OPEN_MEMO
-        for i in range(len_memo, N - 1):
-            cp[i] = 1 / (4 - cp[i - 1])
-        CP_OPEN_MEMO = cp
-    else:
-        cp = CP_OPEN_MEMO[: N - 1]
+    cp = _get_open_memo(N - 1)
 
     # Calculate Dp (D prime).
     Dp = np.empty((N, dim))
@@ -1738,6 +1825,196 @@ def get_smooth_open_cubic_bezier_handle_points(
     return H1, H2
 
 
+def get_smooth_cubic_bezier_handle_points_batched(
+    anchors: Point3DLike_Array,
+    offsets: npt.ArrayLike,
+) -> tuple[Point3D_Array, Point3D_Array]:
+    """Like :func:`get_smooth_cubic_bezier_handle_points`, but for many cubic
+    splines at once.
+
+    The tridiagonal systems of all the splines are solved together: each step
+    of the substitutions of :func:`get_smooth_closed_cubic_bezier_handle_points`
+    and :func:`get_smooth_open_cubic_bezier_handle_points` is done for all the
+    splines which are long enough at once. The handles are the same as the ones
+    of the functions for a single spline.
+
+    Parameters
+    ----------
+    anchors
+        The anchors of all the cubic splines, one spline after the other.
+    offsets
+        The indices in ``anchors`` at which the anchors of each spline start,
+        followed by the number of anchors. Every spline must have at least one
+        anchor.
+
+    Returns
+    -------
+    :class:`tuple` [:class:`~.Point3D_Array`, :class:`~.Point3D_Array`]
+        A tuple of two arrays: one containing the 1st handle for every curve of
+        every spline, and the other containing the 2nd handles. The curves of
+        the spline ``i`` start at ``offsets[i] - i``.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> anchors = np.array([[0, 0, 0], [3, 0, 0], [0, 0, 0], [0, 3, 0], [3, 3, 0]])
+        >>> h1, h2 = get_smooth_cubic_bezier_handle_points_batched(anchors, [0, 2, 5])
+        >>> h1
+        array([[ 1.  ,  0.  ,  0.  ],
+               [-0.25,  1.25,  0.  ],
+               [ 0.5 ,  3.5 ,  0.  ]])
+        >>> h2
+        array([[ 2.  ,  0.  ,  0.  ],
+               [-0.5 ,  2.5 ,  0.  ],
+               [ 1.75,  3.25,  0.  ]])
+    """
+    anchors = np.asarray(anchors)
+    offsets = np.asarray(offsets)
+    dim = anchors.shape[1]
+    n_curves = np.diff(offsets) - 1
+    curve_offsets = offsets[:-1] - np.arange(len(n_curves))
+    H1 = np.empty((offsets[-1] - len(n_curves), dim))
+    H2 = np.empty_like(H1)
+
+    # Splines with a single curve are straight lines, as in
+    # get_smooth_cubic_bezier_handle_points.
+    single = n_curves == 1
+    start = anchors[offsets[:-1][single]]
+    end = anchors[offsets[:-1][single] + 1]
+    H1[curve_offsets[single]] = interpolate(start, end, 1 / 3)
+    H2[curve_offsets[single]] = interpolate(start, end, 2 / 3)
+
+    several = n_curves > 1
+    start = anchors[offsets[:-1][several]]
+    end = anchors[offsets[1:][several] - 1]
+    # Like is_closed, for all the splines at once.
+    tolerance = 1e-8 + 1e-5 * start
+    distance = np.abs(end - start)
+    closed = np.zeros_like(several)
+    closed[several] = ~np.any(distance[:, :-1] > tolerance[:, :-1], axis=1) & (
+        distance[:, -1] <= tolerance[:, -1]
+    )
+    for splines, solve in (
+        (np.flatnonzero(closed), _solve_smooth_closed_cubic_bezier_handle_points),
+        (
+            np.flatnonzero(several & ~closed),
+            _solve_smooth_open_cubic_bezier_handle_points,
+        ),
+    ):
+        if len(splines) == 0:
+            continue
+        # Pad the anchors of the splines, sorted from the longest to the
+        # shortest, so that the splines which are long enough for a step of
+        # the substitutions are the first ones.
+        splines = splines[np.argsort(-n_curves[splines], kind="stable")]
+        N = n_curves[splines]
+        indices = np.arange(N[0] + 1)
+        is_anchor = indices <= N[:, np.newaxis]
+        A = np.zeros((len(splines), N[0] + 1, dim))
+        A[is_anchor] = anchors[(offsets[splines, np.newaxis] + indices)[is_anchor]]
+        h1, h2 = solve(A, N)
+        is_curve = is_anchor[:, 1:]
+        curves = (curve_offsets[splines, np.newaxis] + indices[:-1])[is_curve]
+        H1[curves] = h1[is_curve]
+        H2[curves] = h2[is_curve]
+
+    return H1, H2
+
+
+def _solve_smooth_closed_cubic_bezier_handle_points(
+    A: npt.NDArray[ManimFloat], N: npt.NDArray[np.int_]
+) -> tuple[npt.NDArray[ManimFloat], npt.NDArray[ManimFloat]]:
+    """Solve the systems of :func:`get_smooth_closed_cubic_bezier_handle_points`
+    for the closed splines with the anchors ``A``, of shape
+    ``(n_splines, N[0] + 1, dim)``, and ``N`` curves in decreasing order.
+    """
+    M = N[0]
+    splines = np.arange(len(N))
+    # The number of splines with more than i curves, for every i.
+    counts = np.searchsorted(-N, -np.arange(M + 1))
+    cp, up = _get_closed_memos(M - 1)
+
+    # The last element of u' is different
+    cp_last_division = 1 / (3 - cp[N - 2])
+    up_last = cp_last_division * (1 - up[N - 2])
+
+    # Backward Substitution 1
+    # Calculate q.
+    q = np.empty((len(N), M))
+    q[splines, N - 1] = up_last
+    for i in range(M - 2, -1, -1):
+        m = counts[i + 1]
+        q[:m, i] = up[i] - cp[i] * q[:m, i + 1]
+
+    # Forward Substitution 2
+    # Calculate Dp (D prime).
+    Dp = np.empty(A[:, 1:].shape)
+    AUX = 4 * A[:, :M] + 2 * A[:, 1:]
+    Dp[:, 0] = AUX[:, 0] / 3
+    for i in range(1, M - 1):
+        m = counts[i + 1]
+        Dp[:m, i] = cp[i] * (AUX[:m, i] - Dp[:m, i - 1])
+    Dp[splines, N - 1] = cp_last_division[:, np.newaxis] * (
+        AUX[splines, N - 1] - Dp[splines, N - 2]
+    )
+
+    # Backward Substitution
+    Y = Dp
+    for i in range(M - 2, -1, -1):
+        m = counts[i + 1]
+        Y[:m, i] = Dp[:m, i] - cp[i] * Y[:m, i + 1]
+
+    # Calculate H1.
+    Y_sum = Y[:, 0] + Y[splines, N - 1]
+    q_factor = 1 / (1 + q[:, 0] + q[splines, N - 1])
+    H1 = Y - (q_factor[:, np.newaxis] * q)[:, :, np.newaxis] * Y_sum[:, np.newaxis]
+
+    # Calculate H2.
+    H2 = np.empty_like(H1)
+    H2[:, : M - 1] = 2 * A[:, 1:M] - H1[:, 1:M]
+    H2[splines, N - 1] = 2 * A[splines, N] - H1[:, 0]
+
+    return H1, H2
+
+
+def _solve_smooth_open_cubic_bezier_handle_points(
+    A: npt.NDArray[ManimFloat], N: npt.NDArray[np.int_]
+) -> tuple[npt.NDArray[ManimFloat], npt.NDArray[ManimFloat]]:
+    """Solve the systems of :func:`get_smooth_open_cubic_bezier_handle_points`
+    for the open splines with the anchors ``A``, of shape
+    ``(n_splines, N[0] + 1, dim)``, and ``N`` curves in decreasing order.
+    """
+    M = N[0]
+    splines = np.arange(len(N))
+    # The number of splines with more than i curves, for every i.
+    counts = np.searchsorted(-N, -np.arange(M + 1))
+    cp = _get_open_memo(M - 1)
+
+    # Calculate Dp (D prime).
+    Dp = np.empty(A[:, 1:].shape)
+    Dp[:, 0] = 0.5 * A[:, 0] + A[:, 1]
+    for i in range(1, M - 1):
+        m = counts[i + 1]
+        Dp[:m, i] = cp[i] * (4 * A[:m, i] + 2 * A[:m, i + 1] - Dp[:m, i - 1])
+    Dp[splines, N - 1] = (1 / (7 - 2 * cp[N - 2]))[:, np.newaxis] * (
+        8 * A[splines, N - 1] + A[splines, N] - 2 * Dp[splines, N - 2]
+    )
+
+    # Backward Substitution.
+    H1 = Dp
+    for i in range(M - 2, -1, -1):
+        m = counts[i + 1]
+        H1[:m, i] = Dp[:m, i] - cp[i] * H1[:m, i + 1]
+
+    # Calculate H2.
+    H2 = np.empty_like(H1)
+    H2[:, : M - 1] = 2 * A[:, 1:M] - H1[:, 1:M]
+    H2[splines, N - 1] = 0.5 * (A[splines, N] + H1[splines, N - 1])
+
+    return H1, H2
+
+
 @overload
 def get_quadratic_approximation_of_cubic(
     a0: Point3DLike, h0: Point3DLike, h1: Point3DLike, a1: Point3DLike
@@ -32,6 +32,18 @@ KEYS_TO_FILTER_OUT = {
     "background",
     "pixel_array",
     "pixel_array_to_cairo_context",
+    "parents",
+    "_family",
+    "_bounding_boxes",
+    "_packing",
+    "_updater_calls",
+    "_family_has_updaters",
+    "_family_has_dependent_updaters",
+    "_curve_lengths",
+    "_point_buffer",
+    "_points_shared",
+    "_subpath_bounds",
+    "profiler",
 }
 
 
@@ -1,14 +1,15 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
-from queue import PriorityQueue
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
 
 import numpy as np
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy.typing as npt
+
     from manim.typing import (
         Point2D,
         Point2D_Array,
@@ -54,27 +55,59 @@ class Polygon:
             cy = np.sum((y + yr) * factor) / (6.0 * self.area)
             self.centroid = np.array([cx, cy])
 
-    def compute_distance(self, point: Point2DLike) -> float:
-        """Compute the minimum distance from a point to the polygon."""
-        scalars = np.einsum("ij,ij->i", self.norm, point - self.start)
-        clips = np.clip(scalars, 0, 1).reshape(-1, 1)
-        d: float = np.min(
-            np.linalg.norm(self.start + self.diff * clips - point, axis=1)
+    # A point is an array as well, so the overloads can only be told apart
+    # by the shape of the array.
+    @overload
+    def compute_distance(self, point: Point2DLike) -> float: ...  # type: ignore[overload-overlap, unused-ignore]
+
+    @overload
+    def compute_distance(self, point: Point2DLike_Array) -> npt.NDArray[np.float64]: ...
+
+    def compute_distance(
+        self, point: Point2DLike | Point2DLike_Array
+    ) -> float | npt.NDArray[np.float64]:
+        """Compute the minimum distance from a point to the polygon.
+
+        An array of points gives an array of distances, each computed against
+        all the edges at once.
+        """
+        points = np.asarray(point)[..., np.newaxis, :]
+        scalars = np.einsum("ij,...ij->...i", self.norm, points - self.start)
+        clips = np.clip(scalars, 0, 1)[..., np.newaxis]
+        d = np.min(
+            np.linalg.norm(self.start + self.diff * clips - points, axis=-1), axis=-1
         )
-        return d if self.inside(point) else -d
+        distances: float | npt.NDArray[np.float64] = np.where(
+            self.inside(points[..., 0, :]), d, -d
+        )[()]
+        return distances
+
+    @overload
+    def inside(self, point: Point2DLike) -> bool: ...  # type: ignore[overload-overlap, unused-ignore]
+
+    @overload
+    def inside(self, point: Point2DLike_Array) -> npt.NDArray[np.bool_]: ...
 
-    def inside(self, point: Point2DLike) -> bool:
-        """Check if a point is inside the polygon."""
+    def inside(
+        self, point: Point2DLike | Point2DLike_Array
+    ) -> bool | npt.NDArray[np.bool_]:
+        """Check if a point is inside the polygon.
+
+        An array of points gives an array of booleans.
+        """
         # Views
-        px, py = point
+        points = np.asarray(point)
+        px, py = points[..., 0, np.newaxis], points[..., 1, np.newaxis]
         x, y = self.start[:, 0], self.start[:, 1]
         xr, yr = self.stop[:, 0], self.stop[:, 1]
 
-        # Count Crossings (enforce short-circuit)
+        # Count Crossings, only where the edge spans the height of the point
         c = (y > py) != (yr > py)
-        c = px < x[c] + (py - y[c]) * (xr[c] - x[c]) / (yr[c] - y[c])
-        c_sum: int = np.sum(c)
-        return c_sum % 2 == 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c &= px < x + (py - y) * (xr - x) / (yr - y)
+        c_sum = np.count_nonzero(c, axis=-1)
+        is_inside: bool | npt.NDArray[np.bool_] = (c_sum % 2 == 1)[()]
+        return is_inside
 
 
 class Cell:
@@ -98,16 +131,16 @@ class Cell:
         self.p = self.d + self.h * np.sqrt(2)
 
     def __lt__(self, other: Cell) -> bool:
-        return self.d < other.d
+        return bool(self.d < other.d)
 
     def __gt__(self, other: Cell) -> bool:
-        return self.d > other.d
+        return bool(self.d > other.d)
 
     def __le__(self, other: Cell) -> bool:
-        return self.d <= other.d
+        return bool(self.d <= other.d)
 
     def __ge__(self, other: Cell) -> bool:
-        return self.d >= other.d
+        return bool(self.d >= other.d)
 
 
 def polylabel(rings: Sequence[Point3DLike_Array], precision: float = 0.01) -> Cell:
@@ -140,29 +173,33 @@ def polylabel(rings: Sequence[Point3DLike_Array], precision: float = 0.01) -> Ce
     h = s / 2.0
 
     # Initial Grid
-    queue: PriorityQueue[Cell] = PriorityQueue()
     xv, yv = np.meshgrid(np.arange(mins[0], maxs[0], s), np.arange(mins[1], maxs[1], s))
-    for corner in np.vstack([xv.ravel(), yv.ravel()]).T:
-        queue.put(Cell(corner + h, h, polygon))
+    centers = np.vstack([xv.ravel(), yv.ravel()]).T + h
 
     # Initial Guess
     best = Cell(polygon.centroid, 0, polygon)
     bbox = Cell(mins + (dims / 2), 0, polygon)
     if bbox.d > best.d:
         best = bbox
+    best_c, best_h, best_d = best.c, best.h, best.d
 
     # While there are cells to consider...
+    # All the cells of a subdivision level share their size, so they are
+    # processed at once, in chunks of bounded memory.
     directions = np.array([[-1, -1], [1, -1], [-1, 1], [1, 1]])
-    while not queue.empty():
-        cell = queue.get()
-        if cell > best:
-            best = cell
+    chunk_size = max(1, 2**16 // len(polygon.start))
+    while len(centers):
+        d = np.concatenate(
+            [
+                polygon.compute_distance(centers[i : i + chunk_size])
+                for i in range(0, len(centers), chunk_size)
+            ]
+        )
+        i = np.argmax(d)
+        if d[i] > best_d:
+            best_c, best_h, best_d = centers[i], h, d[i]
         # If a cell is promising, subdivide!
-        if cell.p - best.d > precision:
-            h = cell.h / 2.0
-            offsets = cell.c + directions * h
-            queue.put(Cell(offsets[0], h, polygon))
-            queue.put(Cell(offsets[1], h, polygon))
-            queue.put(Cell(offsets[2], h, polygon))
-            queue.put(Cell(offsets[3], h, polygon))
-    return best
+        promising = d + h * np.sqrt(2) - best_d > precision
+        h /= 2.0
+        centers = (centers[promising, np.newaxis] + directions * h).reshape(-1, 2)
+    return Cell(best_c, best_h, polygon)
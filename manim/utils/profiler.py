@@ -0,0 +1,144 @@
+"""Measuring where the time rendering the frames of a scene goes.
+
+The profiler of a scene is enabled with the ``--profile_frames`` flag (or by
+assigning a :class:`FrameProfiler` to :attr:`.Scene.profiler`).
+"""
+
+from __future__ import annotations
+
+__all__ = ["FrameProfiler"]
+
+
+import json
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from manim.typing import StrPath
+
+
+_NO_MEASUREMENT = nullcontext()
+
+
+class FrameProfiler:
+    """Collects the time spent in the stages of rendering frames.
+
+    The measurements are grouped by category (for instance ``"updater"`` or
+    ``"interpolate"``) and name (for instance the qualified name of an updater
+    or the class of an animation), and aggregated per call of
+    :meth:`.Scene.play`.
+
+    Examples
+    --------
+    ::
+
+        >>> from manim.utils.profiler import FrameProfiler
+        >>> profiler = FrameProfiler()
+        >>> profiler.start_play("Example")
+        >>> with profiler.measure("updater", "label_updater"):
+        ...     pass
+        >>> count, seconds = profiler.plays[-1][1]["updater", "label_updater"]
+        >>> count
+        1
+    """
+
+    def __init__(self) -> None:
+        self.plays: list[tuple[str, dict[tuple[str, str], list[Any]]]] = []
+        self.events: list[dict[str, Any]] = []
+        self._start = time.perf_counter()
+        self.start_play("setup")
+
+    def start_play(self, name: str) -> None:
+        """Aggregate the following measurements separately, under ``name``."""
+        self.plays.append((name, {}))
+
+    @property
+    def current_play(self) -> int:
+        """The index in :attr:`plays` of the play measurements are added to."""
+        return len(self.plays) - 1
+
+    @contextmanager
+    def measure(
+        self, category: str, name: str, play: int | None = None
+    ) -> Iterator[None]:
+        """Measure the time spent in the context, see :meth:`add_measurement`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_measurement(category, name, start, time.perf_counter(), play)
+
+    def add_measurement(
+        self,
+        category: str,
+        name: str,
+        start: float,
+        end: float,
+        play: int | None = None,
+    ) -> None:
+        """Add a measurement, with ``start`` and ``end`` as given by
+        :func:`time.perf_counter`.
+
+        It is added to the play with the index ``play``, by default the
+        :attr:`current_play`. Work done in another thread, like encoding the
+        frames, passes the play it was queued in.
+        """
+        if play is None:
+            play = self.current_play
+        statistics = self.plays[play][1].setdefault((category, name), [0, 0.0])
+        statistics[0] += 1
+        statistics[1] += end - start
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._start) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": threading.get_ident(),
+            },
+        )
+
+    def get_summary(self) -> str:
+        """Return a table of the measurements, per play and sorted by the
+        total time spent.
+        """
+        lines = []
+        for play_name, statistics in self.plays:
+            if not statistics:
+                continue
+            lines.append(play_name)
+            items = sorted(statistics.items(), key=lambda item: -item[1][1])
+            for (category, name), (count, seconds) in items:
+                lines.append(
+                    f"  {category:<18} {name:<50} {count:>8} calls "
+                    f"{seconds * 1e3:>10.2f} ms {seconds / count * 1e6:>10.1f} us/call",
+                )
+        return "\n".join(lines)
+
+    def write_trace(self, file_path: StrPath) -> None:
+        """Write the measurements in the Chrome trace event format, which can
+        be opened with ``chrome://tracing`` or https://ui.perfetto.dev.
+        """
+        trace = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        Path(file_path).write_text(json.dumps(trace), encoding="utf-8")
+
+
+def measure(
+    profiler: FrameProfiler | None,
+    category: str,
+    name: str,
+    play: int | None = None,
+) -> AbstractContextManager[None]:
+    """Return :meth:`FrameProfiler.measure` for the given profiler, or a
+    context doing nothing if it is ``None``.
+    """
+    if profiler is None:
+        return _NO_MEASUREMENT
+    return profiler.measure(category, name, play)
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from manim.typing import PointND, PointND_Array
 
 
@@ -80,6 +82,14 @@ class QuickHull:
     """
     QuickHull algorithm for constructing a convex hull from a set of points.
 
+    The facets are stored in arrays: facet ``i`` is the simplex spanned by the
+    points ``points[simplices[i]]``, with outward unit normal ``normals[i]``,
+    and ``adjacency[i, j]`` is the facet sharing the ridge opposite to its
+    ``j``-th vertex. Facets are never deleted, only flagged in ``is_removed``,
+    so the facets of the hull are ``simplices[~is_removed]``. The attributes
+    ``facets``, ``removed``, ``outside``, ``neighbors`` and ``unclaimed`` give
+    the same information with :class:`Facet` and :class:`SubFacet` objects.
+
     Parameters
     ----------
     tolerance
@@ -87,6 +97,21 @@ class QuickHull:
 
     Attributes
     ----------
+    points
+        The points the hull is built from.
+    simplices
+        Indices into ``points`` of the vertices of each facet considered.
+    normals
+        Outward unit normal of each facet.
+    offsets
+        Signed distance from the origin to the hyperplane of each facet.
+    adjacency
+        Indices of the neighboring facets of each facet, one across each ridge.
+    is_removed
+        Mask of the internal facets that have been removed from the hull during the construction process.
+    outside_indices
+        Indices into ``points`` of the outside points of each facet, or ``None``
+        once the facet has been removed.
     facets
         List of facets considered.
     removed
@@ -96,7 +121,7 @@ class QuickHull:
     neighbors
         Mapping of subfacets to their neighboring facets. Each subfacet links precisely two neighbors.
     unclaimed
-        Points that have not yet been classified as inside or outside the current hull.
+        Points that are not outside of any facet of the current hull.
     internal
         An internal point (i.e., the center of the initial simplex) used as a reference during hull construction.
     tolerance
@@ -104,75 +129,211 @@ class QuickHull:
     """
 
     def __init__(self, tolerance: float = 1e-5) -> None:
-        self.facets: list[Facet] = []
-        self.removed: set[Facet] = set()
-        self.outside: dict[Facet, tuple[PointND_Array | None, PointND | None]] = {}
-        self.neighbors: dict[SubFacet, set[Facet]] = {}
-        self.unclaimed: PointND_Array | None = None
+        self.points: PointND_Array | None = None
+        self.simplices: npt.NDArray[np.intp] = np.empty((0, 0), dtype=np.intp)
+        self.normals: PointND_Array = np.empty((0, 0))
+        self.offsets: npt.NDArray[np.float64] = np.empty(0)
+        self.adjacency: npt.NDArray[np.intp] = np.empty((0, 0), dtype=np.intp)
+        self.is_removed: npt.NDArray[np.bool_] = np.empty(0, dtype=bool)
+        self.outside_indices: list[npt.NDArray[np.intp] | None] = []
         self.internal: PointND | None = None
         self.tolerance = tolerance
+        self.num_facets = 0
+        self._facets: list[Facet] = []
+
+    # The attributes of the implementation with Facet objects, created from the
+    # arrays on access.
+
+    @property
+    def facets(self) -> list[Facet]:
+        if self.points is None or self.internal is None:
+            return self._facets
+        # Facets are only ever appended, so only the new ones are created.
+        for vertices in self.simplices[len(self._facets) : self.num_facets]:
+            self._facets.append(Facet(self.points[vertices], self.internal))
+        return self._facets
+
+    @property
+    def removed(self) -> set[Facet]:
+        facets = self.facets
+        return {facets[i] for i in np.flatnonzero(self.is_removed[: self.num_facets])}
+
+    @property
+    def outside(self) -> dict[Facet, tuple[PointND_Array | None, PointND | None]]:
+        if self.points is None:
+            return {}
+        outside: dict[Facet, tuple[PointND_Array | None, PointND | None]] = {}
+        for i, (facet, indices) in enumerate(zip(self.facets, self.outside_indices)):
+            if indices is None or not indices.size:
+                outside[facet] = (
+                    None if indices is None else self.points[indices],
+                    None,
+                )
+                continue
+            projections = self.points[indices] @ self.normals[i]
+            outside[facet] = (
+                self.points[indices],
+                self.points[indices[np.argmax(projections)]],
+            )
+        return outside
+
+    @property
+    def neighbors(self) -> dict[SubFacet, set[Facet]]:
+        neighbors: dict[SubFacet, set[Facet]] = {}
+        facets = self.facets
+        for i in np.flatnonzero(~self.is_removed[: self.num_facets]):
+            for subfacet in facets[i].subfacets:
+                neighbors.setdefault(subfacet, set()).add(facets[i])
+        return neighbors
+
+    @property
+    def unclaimed(self) -> PointND_Array | None:
+        if self.points is None:
+            return None
+        claimed = np.zeros(len(self.points), dtype=bool)
+        for indices in self.outside_indices:
+            if indices is not None:
+                claimed[indices] = True
+        return self.points[~claimed]
 
     def initialize(self, points: PointND_Array) -> None:
-        # Sample Points
-        simplex = points[
-            np.random.choice(points.shape[0], points.shape[1] + 1, replace=False)
-        ]
-        self.unclaimed = points
-        new_internal: PointND = np.mean(simplex, axis=0)
-        self.internal = new_internal
+        num, dim = points.shape
+        self.points = points
+        self._facets = []
+
+        # The lexicographically smallest point is a vertex of the hull. Grow the
+        # simplex from it with the point farthest from the span of the others.
+        simplex = [np.lexsort(points.T[::-1])[0]]
+        for _ in range(dim):
+            offsets = points - points[simplex[0]]
+            if len(simplex) > 1:
+                basis, _ = np.linalg.qr(offsets[simplex[1:]].T)
+                offsets -= (offsets @ basis) @ basis.T
+            distances = np.einsum("ij,ij->i", offsets, offsets)
+            farthest = np.argmax(distances)
+            if not distances[farthest] > 0:
+                raise ValueError("The points supplied to build Convex Hull are flat!")
+            simplex.append(farthest)
+        self.internal = np.mean(points[simplex], axis=0)
 
         # Build Simplex
-        for c in range(simplex.shape[0]):
-            facet = Facet(np.delete(simplex, c, axis=0), internal=new_internal)
-            self.classify(facet)
-            self.facets.append(facet)
-
-        # Attach Neighbors
-        for f in self.facets:
-            for sf in f.subfacets:
-                self.neighbors.setdefault(sf, set()).add(f)
-
-    def classify(self, facet: Facet) -> None:
-        assert self.unclaimed is not None, (
-            "Call .initialize() before using .classify()."
-        )
+        # The facet opposite to each vertex of the simplex shares its ridges
+        # with the facets opposite to its own vertices.
+        simplex_array = np.array(simplex)
+        opposite = np.array([np.delete(np.arange(dim + 1), c) for c in range(dim + 1)])
+        facets = self._add_facets(simplex_array[opposite], opposite)
+        self._classify(facets, np.arange(num))
+
+    def _add_facets(
+        self, vertices: npt.NDArray[np.intp], neighbors: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.intp]:
+        assert self.points is not None
+        assert self.internal is not None
 
-        if not self.unclaimed.size:
-            self.outside[facet] = (None, None)
-            return
+        start = self.num_facets
+        stop = start + len(vertices)
+        if stop > len(self.simplices):
+            capacity = 2 * stop
+            dim = self.points.shape[1]
+            for name, shape, dtype in (
+                ("simplices", (capacity, dim), np.intp),
+                ("normals", (capacity, dim), np.float64),
+                ("offsets", (capacity,), np.float64),
+                ("adjacency", (capacity, dim), np.intp),
+                ("is_removed", (capacity,), bool),
+            ):
+                array = np.zeros(shape, dtype=dtype)
+                if start:
+                    array[:start] = getattr(self, name)[:start]
+                setattr(self, name, array)
+
+        coordinates = self.points[vertices]
+        centers = np.mean(coordinates, axis=1)
+        _, _, vh = np.linalg.svd(coordinates - centers[:, np.newaxis])
+        normals = vh[:, -1]
+        normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+
+        # If a normal points towards the internal point, flip it!
+        flip = np.einsum("ij,ij->i", normals, centers - self.internal) < 0
+        normals[flip] *= -1
+
+        self.simplices[start:stop] = vertices
+        self.normals[start:stop] = normals
+        self.offsets[start:stop] = np.einsum("ij,ij->i", normals, centers)
+        self.adjacency[start:stop] = neighbors
+        self.is_removed[start:stop] = False
+        self.outside_indices.extend([None] * len(vertices))
+        self.num_facets = stop
+        return np.arange(start, stop)
+
+    def _classify(
+        self, facets: npt.NDArray[np.intp], candidates: npt.NDArray[np.intp]
+    ) -> None:
+        """Assign each candidate point to the first of ``facets`` it is outside
+        of, and drop the points inside all of them.
+        """
+        assert self.points is not None, "Call .initialize() before using ._classify()."
 
         # Compute Projections
-        projections = (self.unclaimed - facet.center) @ facet.normal
-        arg = np.argmax(projections)
+        projections = (
+            self.points[candidates] @ self.normals[facets].T - self.offsets[facets]
+        )
         mask = projections > self.tolerance
+        claimed = np.any(mask, axis=1)
+        owners = np.argmax(mask[claimed], axis=1)
 
-        # Identify Eye and Outside Set
-        eye = self.unclaimed[arg] if projections[arg] > self.tolerance else None
-        outside = self.unclaimed[mask]
-        self.outside[facet] = (outside, eye)
-        self.unclaimed = self.unclaimed[~mask]
+        # Identify Outside Sets
+        order = np.argsort(owners, kind="stable")
+        splits = np.cumsum(np.bincount(owners, minlength=len(facets)))[:-1]
+        for facet, outside in zip(facets, np.split(candidates[claimed][order], splits)):
+            self.outside_indices[facet] = outside
 
     def compute_horizon(self, eye: PointND, start_facet: Facet) -> Horizon:
+        """Find the facets visible from ``eye`` around ``start_facet``, see
+        :meth:`_compute_horizon`.
+        """
+        assert self.points is not None
+        facets = self.facets
+        visible, boundary, positions = self._compute_horizon(
+            eye, facets.index(start_facet)
+        )
         horizon = Horizon()
-        self._recursive_horizon(eye, start_facet, horizon)
+        horizon.facets = {facets[f] for f in visible}
+        horizon.boundary = [
+            SubFacet(self.points[np.delete(self.simplices[f], position)])
+            for f, position in zip(boundary, positions)
+        ]
         return horizon
 
-    def _recursive_horizon(self, eye: PointND, facet: Facet, horizon: Horizon) -> bool:
-        visible = np.dot(facet.normal, eye - facet.center) > 0
-        if not visible:
-            return False
-
-        # If the eye is visible from the facet:
-        # Label the facet as visible and cross each edge
-        horizon.facets.add(facet)
-        for subfacet in facet.subfacets:
-            neighbor = (self.neighbors[subfacet] - {facet}).pop()
-            # If the neighbor is not visible, then the edge shared must be on the boundary
-            if neighbor not in horizon.facets and not self._recursive_horizon(
-                eye, neighbor, horizon
-            ):
-                horizon.boundary.append(subfacet)
-        return True
+    def _compute_horizon(
+        self, eye_point: PointND, start_facet: int
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """Find the facets visible from ``eye_point`` around ``start_facet``.
+
+        Returns
+        -------
+        The visible facets, and the ridges of the horizon as the visible facet
+        they belong to and the position of the vertex of that facet opposite to
+        them.
+        """
+        visible = np.zeros(self.num_facets, dtype=bool)
+        tested = np.zeros(self.num_facets, dtype=bool)
+        visible[start_facet] = tested[start_facet] = True
+
+        # Cross the edges of the visible facets, testing a whole front at once.
+        front = np.array([start_facet])
+        while front.size:
+            adjacent = np.unique(self.adjacency[front])
+            adjacent = adjacent[~tested[adjacent]]
+            tested[adjacent] = True
+            distances = self.normals[adjacent] @ eye_point - self.offsets[adjacent]
+            front = adjacent[distances > 0]
+            visible[front] = True
+
+        # If the neighbor is not visible, then the ridge shared must be on the boundary
+        facets = np.flatnonzero(visible)
+        boundary, positions = np.nonzero(~visible[self.adjacency[facets]])
+        return facets, facets[boundary], positions
 
     def build(self, points: PointND_Array) -> None:
         num, dim = points.shape
@@ -183,36 +344,56 @@ class QuickHull:
 
         self.initialize(points)
 
-        # This helps the type checker.
-        assert self.unclaimed is not None
-        assert self.internal is not None
-
-        while True:
-            updated = False
-            for facet in self.facets:
-                if facet in self.removed:
-                    continue
-                outside, eye = self.outside[facet]
-                if eye is not None:
-                    updated = True
-                    horizon = self.compute_horizon(eye, facet)
-                    for f in horizon.facets:
-                        points_to_append = self.outside[f][0]
-                        # TODO: is this always true?
-                        assert points_to_append is not None
-                        self.unclaimed = np.vstack((self.unclaimed, points_to_append))
-                        self.removed.add(f)
-                        for sf in f.subfacets:
-                            self.neighbors[sf].discard(f)
-                            if self.neighbors[sf] == set():
-                                del self.neighbors[sf]
-                    for sf in horizon.boundary:
-                        nf = Facet(
-                            np.vstack((sf.coordinates, eye)), internal=self.internal
-                        )
-                        self.classify(nf)
-                        self.facets.append(nf)
-                        for nsf in nf.subfacets:
-                            self.neighbors.setdefault(nsf, set()).add(nf)
-            if not updated:
-                break
+        # The ridges of a facet, each missing one of its vertices.
+        ridges = np.array([np.delete(np.arange(dim), i) for i in range(dim)])
+
+        # Facets are only ever appended, so a single pass visits them all.
+        facet = 0
+        while facet < self.num_facets:
+            outside = self.outside_indices[facet]
+            if self.is_removed[facet] or outside is None or not outside.size:
+                facet += 1
+                continue
+            projections = points[outside] @ self.normals[facet] - self.offsets[facet]
+            eye = outside[np.argmax(projections)]
+            visible, boundary, positions = self._compute_horizon(points[eye], facet)
+            candidates = np.concatenate([self.outside_indices[f] for f in visible])
+            self.is_removed[visible] = True
+            for f in visible:
+                self.outside_indices[f] = None
+
+            # Cone the horizon to the eye, each new facet replacing the vertex
+            # of a visible facet opposite to a ridge of the horizon.
+            count = len(boundary)
+            rows = np.arange(count)
+            vertices = self.simplices[boundary]
+            vertices[rows, positions] = eye
+            neighbors = np.empty_like(vertices)
+            across = self.adjacency[boundary, positions]
+            neighbors[rows, positions] = across
+            new = self._add_facets(vertices, neighbors)
+
+            # Relink the facets beyond the horizon to the new ones.
+            relinked = np.argmax(self.adjacency[across] == boundary[:, None], axis=1)
+            self.adjacency[across, relinked] = new
+
+            # The other ridges of the new facets contain the eye, and are shared
+            # by exactly two new facets: pair them up by sorting their vertices.
+            keys = np.sort(vertices[:, ridges], axis=2)
+            keep = np.arange(dim) != positions[:, None]
+            facet_ids, ridge_ids = np.nonzero(keep)
+            keys = keys[keep]
+            order = np.lexsort(keys.T[::-1])
+            first, second = order[0::2], order[1::2]
+            self.adjacency[new[facet_ids[first]], ridge_ids[first]] = new[
+                facet_ids[second]
+            ]
+            self.adjacency[new[facet_ids[second]], ridge_ids[second]] = new[
+                facet_ids[first]
+            ]
+
+            self._classify(new, candidates)
+            facet += 1
+
+        for name in ("simplices", "normals", "offsets", "adjacency", "is_removed"):
+            setattr(self, name, getattr(self, name)[: self.num_facets])
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import itertools as it
+import functools
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Callable
 
@@ -487,12 +487,19 @@ def regular_vertices(
     if start_angle is None:
         start_angle = 0 if n % 2 == 0 else TAU / 4
 
-    start_vector = rotate_vector(RIGHT * radius, start_angle)
-    vertices = compass_directions(n, start_vector)
+    vertices = radius * _get_unit_regular_vertices(n, start_angle)
 
     return vertices, start_angle
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_unit_regular_vertices(n: int, start_angle: float) -> np.ndarray:
+    # The vertices are cached, so they must not be modified.
+    vertices = compass_directions(n, rotate_vector(RIGHT, start_angle))
+    vertices.setflags(write=False)
+    return vertices
+
+
 def complex_to_R3(complex_num: complex) -> np.ndarray:
     return np.array((complex_num.real, complex_num.imag, 0))
 
@@ -732,56 +739,54 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> list:
     # with holes is instead treated as a (very convex)
     # polygon with one edge.  Do this by drawing connections
     # between rings close to each other
-    rings = [list(range(e0, e1)) for e0, e1 in zip([0, *ring_ends], ring_ends)]
+    ring_end_indices = np.asarray(ring_ends, dtype=int)
+    ring_starts = np.concatenate(([0], ring_end_indices[:-1]))
+    rings = [np.arange(e0, e1) for e0, e1 in zip(ring_starts, ring_end_indices)]
     attached_rings = rings[:1]
-    detached_rings = rings[1:]
+    is_detached = np.ones(len(verts), dtype=bool)
+    for ring in attached_rings:
+        is_detached[ring] = False
+    # Indices that are already being used to draw some connection
+    is_connected = np.zeros(len(verts), dtype=bool)
     loop_connections = {}
 
-    while detached_rings:
-        i_range, j_range = (
-            list(
-                filter(
-                    # Ignore indices that are already being
-                    # used to draw some connection
-                    lambda i: i not in loop_connections,
-                    it.chain(*ring_group),
-                ),
-            )
-            for ring_group in (attached_rings, detached_rings)
-        )
+    def closest(indices: np.ndarray, point: np.ndarray) -> int:
+        # Like min(indices, key=...) with norm_squared, the first of the
+        # closest ones.
+        differences = verts[indices] - point
+        distances = differences[:, np.newaxis] @ differences[:, :, np.newaxis]
+        return int(indices[np.argmin(distances)])
+
+    for _ in range(len(rings) - 1):
+        i_range = np.concatenate(attached_rings)
+        i_range = i_range[~is_connected[i_range]]
+        j_range = np.flatnonzero(is_detached & ~is_connected)
 
         # Closest point on the attached rings to an estimated midpoint
-        # of the detached rings
-        tmp_j_vert = midpoint(verts[j_range[0]], verts[j_range[len(j_range) // 2]])
-        i = min(i_range, key=lambda i: norm_squared(verts[i] - tmp_j_vert))
+        # of the detached rings (computed inline, as midpoint is slow)
+        tmp_j_vert = (verts[j_range[0]] + verts[j_range[len(j_range) // 2]]) / 2
+        i = closest(i_range, tmp_j_vert)
         # Closest point of the detached rings to the aforementioned
         # point of the attached rings
-        j = min(j_range, key=lambda j: norm_squared(verts[i] - verts[j]))
+        j = closest(j_range, verts[i])
         # Recalculate i based on new j
-        i = min(i_range, key=lambda i: norm_squared(verts[i] - verts[j]))
+        i = closest(i_range, verts[j])
 
         # Remember to connect the polygon at these points
         loop_connections[i] = j
         loop_connections[j] = i
+        is_connected[[i, j]] = True
 
         # Move the ring which j belongs to from the
         # attached list to the detached list
-        new_ring = next(
-            (ring for ring in detached_rings if ring[0] <= j < ring[-1]), None
-        )
-        if new_ring is not None:
-            detached_rings.remove(new_ring)
-            attached_rings.append(new_ring)
-        else:
-            raise Exception("Could not find a ring to attach")
+        new_ring = rings[np.searchsorted(ring_end_indices, j, side="right")]
+        is_detached[new_ring] = False
+        attached_rings.append(new_ring)
 
     # Setup linked list
-    after: list[int] = []
-    end0 = 0
-    for end1 in ring_ends:
-        after.extend(range(end0 + 1, end1))
-        after.append(end0)
-        end0 = end1
+    successors = np.arange(1, len(verts) + 1)
+    successors[ring_end_indices - 1] = ring_starts
+    after: list[int] = successors.tolist()
 
     # Find an ordering of indices walking around the polygon
     indices = []
@@ -799,7 +804,8 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list) -> list:
             break
 
     meta_indices = earcut(verts[indices, :2], [len(indices)])
-    return [indices[mi] for mi in meta_indices]
+    triangulation: list = np.array(indices)[meta_indices].tolist()
+    return triangulation
 
 
 def cartesian_to_spherical(vec: Sequence[float]) -> np.ndarray:
@@ -0,0 +1,43 @@
+"""Benchmark family queries on deep :class:`~.VGroup` trees.
+
+usage: python bench_family.py [depth] [branching]
+"""
+
+from __future__ import annotations
+
+import sys
+
+from timing import report
+
+from manim import VGroup, VMobject
+
+
+def build_tree(depth: int, branching: int) -> VGroup:
+    if depth == 0:
+        return VGroup(*(VMobject() for _ in range(branching)))
+    return VGroup(*(build_tree(depth - 1, branching) for _ in range(branching)))
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    branching = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    tree = build_tree(depth, branching)
+    leaf = tree
+    while leaf.submobjects:
+        leaf = leaf.submobjects[-1]
+    print(f"{len(tree.get_family())} mobjects (depth {depth}, branching {branching})")
+
+    report("get_family (cached)", tree.get_family, number=200)
+    report("family_members_with_points", tree.family_members_with_points, number=200)
+
+    def modify_and_query():
+        leaf.add(VMobject())
+        tree.get_family()
+        leaf.submobjects.pop()
+        tree.get_family()
+
+    report("modify leaf + get_family (rebuild)", modify_and_query, number=20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark building the convex hull of point clouds, as done by
+:class:`~.ConvexHull` and :class:`~.ConvexHull3D`.
+
+usage: python bench_qhull.py
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from timing import report
+
+from manim import ConvexHull, ConvexHull3D
+from manim.utils.qhull import QuickHull
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    def build(points):
+        QuickHull().build(points)
+
+    for num_points in (1_000, 10_000, 100_000):
+        points = rng.normal(size=(num_points, 3))
+        report(
+            f"QuickHull 2D, {num_points} points",
+            lambda points=points: build(points[:, :2]),
+        )
+        report(
+            f"QuickHull 3D, {num_points} points", lambda points=points: build(points)
+        )
+
+    # Every point is a vertex of the hull.
+    points = rng.normal(size=(10_000, 3))
+    sphere = points / np.linalg.norm(points, axis=1)[:, np.newaxis]
+    report("QuickHull 3D, 10000 on a sphere", lambda: build(sphere), number=1)
+
+    points = rng.normal(size=(10_000, 3))
+    report("ConvexHull, 10000 points", lambda: ConvexHull(*points))
+    report("ConvexHull3D, 10000 points", lambda: ConvexHull3D(*points))
+
+
+if __name__ == "__main__":
+    main()
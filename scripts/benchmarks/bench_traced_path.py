@@ -0,0 +1,38 @@
+"""Benchmark tracing the path of a point with :class:`~.TracedPath`.
+
+usage: python bench_traced_path.py [frames]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+from timing import report
+
+from manim import TracedPath
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    dt = 1 / 60
+
+    def trace(dissipating_time=None):
+        time = 0.0
+
+        def point():
+            return np.array([np.cos(time), np.sin(time), 0])
+
+        path = TracedPath(point, dissipating_time=dissipating_time)
+        for _ in range(frames):
+            time += dt
+            path.update_path(path, dt)
+        return path
+
+    print(f"{frames} frames")
+    report("TracedPath", trace)
+    report("TracedPath (dissipating)", lambda: trace(dissipating_time=1))
+
+
+if __name__ == "__main__":
+    main()
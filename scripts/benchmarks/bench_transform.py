@@ -0,0 +1,40 @@
+"""Benchmark interpolating a :class:`~.Transform` of many small mobjects.
+
+usage: python bench_transform.py [mobjects]
+"""
+
+from __future__ import annotations
+
+import sys
+
+from timing import report
+
+from manim import Circle, FadeOut, Square, Transform, VGroup
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    source = VGroup(*(Square(0.1) for _ in range(count))).arrange_in_grid()
+    target = VGroup(*(Circle(0.05) for _ in range(count))).arrange_in_grid()
+    print(f"{count} mobjects")
+
+    anim = Transform(source, target)
+    anim.begin()
+    report("interpolate (packed families)", lambda: anim.interpolate(0.5), number=50)
+
+    lagged = Transform(source, target, lag_ratio=1e-9)
+    lagged.begin()
+    report("interpolate (per member)", lambda: lagged.interpolate(0.5), number=50)
+
+    report("Transform begin", lambda: Transform(source, target).begin(), number=5)
+    report("FadeOut begin", lambda: FadeOut(source).begin(), number=5)
+
+    fade_out = FadeOut(source)
+    fade_out.begin()
+    report(
+        "FadeOut interpolate (style only)", lambda: fade_out.interpolate(0.5), number=50
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark triangulating the polygons of a paragraph of :class:`~.Text`, as
+done to fill mobjects with the OpenGL renderer.
+
+usage: python bench_triangulation.py [repeats]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+from timing import report
+
+from manim import DL, DR, UL, UR, Text
+from manim.utils.space_ops import earclip_triangulation
+
+PARAGRAPH = (
+    "Bobbed apple boughs bob above a quagga;\n"
+    "odd dappled beagles doze beside a babbling brook,\n"
+    "and a bold goblin gobbles baked pear pudding."
+)
+
+
+def get_rings(vmobject):
+    """Return the anchors of the subpaths of ``vmobject`` as rings."""
+    nppcc = vmobject.n_points_per_cubic_curve
+    return [subpath[::nppcc] for subpath in vmobject.get_subpaths()]
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    text = Text(PARAGRAPH * repeats)
+    glyphs = [
+        (np.concatenate(rings), np.cumsum([len(ring) for ring in rings]))
+        for rings in map(get_rings, text.family_members_with_points())
+    ]
+    # All the rings of the paragraph as the holes of a single polygon.
+    outer = np.array([text.get_corner(corner) for corner in (DL, DR, UR, UL)])
+    rings = [outer] + [
+        ring for glyph in text.family_members_with_points() for ring in get_rings(glyph)
+    ]
+    paragraph = (np.concatenate(rings), np.cumsum([len(ring) for ring in rings]))
+    num_holes = sum(len(ends) - 1 for _, ends in glyphs)
+    print(f"{len(glyphs)} glyphs, {num_holes} counters, {len(rings)} rings")
+
+    report(
+        "earclip_triangulation per glyph",
+        lambda: [earclip_triangulation(verts, ends) for verts, ends in glyphs],
+    )
+    report(
+        "earclip_triangulation of the paragraph",
+        lambda: earclip_triangulation(*paragraph),
+        number=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
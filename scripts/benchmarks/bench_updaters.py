@@ -0,0 +1,37 @@
+"""Benchmark calling the updaters of many mobjects.
+
+usage: python bench_updaters.py [num_updated] [num_inert]
+"""
+
+from __future__ import annotations
+
+import sys
+
+from timing import report
+
+from manim import Dot, VGroup
+
+
+def main():
+    num_updated = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_inert = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    updated = VGroup(*(Dot() for _ in range(num_updated)))
+    for i, dot in enumerate(updated):
+        if i % 2:
+            dot.add_updater(lambda mob, dt: mob.set_opacity(dt))
+        else:
+            dot.add_updater(lambda mob: mob.set_opacity(1))
+    inert = VGroup(*(VGroup(Dot(), Dot()) for _ in range(num_inert)))
+    print(f"{num_updated} mobjects with updaters, {num_inert} inert groups")
+
+    report("update (updaters)", lambda: updated.update(1 / 60), number=20)
+    report("update (inert)", lambda: inert.update(1 / 60), number=20)
+
+    def has_time_based_updaters():
+        return any(mob.has_time_based_updater() for mob in updated.get_family())
+
+    report("has_time_based_updater (family)", has_time_based_updaters, number=20)
+
+
+if __name__ == "__main__":
+    main()
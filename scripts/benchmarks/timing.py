@@ -0,0 +1,15 @@
+"""Helpers shared by the benchmark scripts in this folder."""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable
+
+
+def report(name: str, stmt: Callable[[], Any], number: int = 3) -> None:
+    """Print the mean time taken by ``number`` calls of ``stmt``."""
+    seconds = timeit.timeit(stmt, number=number) / number
+    if seconds < 1e-2:
+        print(f"{name:<40} {seconds * 1e6:10.1f} us")
+    else:
+        print(f"{name:<40} {seconds * 1e3:10.2f} ms")
@@ -13,6 +13,7 @@ from manim.mobject.geometry.arc import Circle
 from manim.mobject.geometry.line import Line
 from manim.mobject.geometry.polygram import RegularPolygon, Square
 from manim.scene.scene import Scene
+from manim.utils.rate_functions import linear
 
 
 def test_succession_timing():
@@ -197,3 +198,33 @@ def test_empty_animation_group_fails():
 def test_empty_succession_fails():
     with pytest.raises(ValueError, match="Please add at least one subanimation."):
         Succession().begin()
+
+
+def test_animationgroup_only_interpolates_active_animations():
+    class MyAnimation(Animation):
+        def __init__(self, mobject):
+            super().__init__(mobject)
+            self.alphas = []
+
+        def interpolate(self, alpha):
+            self.alphas.append(alpha)
+
+    animations = [MyAnimation(Square()) for _ in range(10)]
+    animation_group = AnimationGroup(*animations, lag_ratio=1, rate_func=linear)
+    # Beginning an animation interpolates it once.
+    animation_group.begin()
+    assert [len(anim.alphas) for anim in animations] == [1] * 10
+
+    animation_group.interpolate(0.25)
+    assert [len(anim.alphas) for anim in animations] == [2, 2, 2] + [1] * 7
+    animation_group.interpolate(0.32)
+    # The third animation is settled once, the fourth has begun.
+    assert [len(anim.alphas) for anim in animations] == [2, 2, 3, 2] + [1] * 6
+    assert animations[2].alphas[-1] == 1
+    assert animation_group.anims_begun.tolist() == [True] * 4 + [False] * 6
+    assert animation_group.anims_finished.tolist() == [True] * 3 + [False] * 7
+
+    # Going back, the animations which are no longer begun are reset once.
+    animation_group.interpolate(0.05)
+    assert [len(anim.alphas) for anim in animations] == [3, 3, 4, 3] + [1] * 6
+    assert [anim.alphas[-1] for anim in animations[1:4]] == [0, 0, 0]
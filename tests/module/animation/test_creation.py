@@ -3,7 +3,19 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from manim import AddTextLetterByLetter, Text
+from manim import (
+    AddTextLetterByLetter,
+    Circle,
+    Create,
+    Dot,
+    DrawBorderThenFill,
+    Line,
+    Square,
+    Text,
+    Triangle,
+    VGroup,
+    VMobject,
+)
 
 
 def test_non_empty_text_creation():
@@ -32,3 +44,41 @@ def test_run_time_for_non_empty_text(config):
     expected_run_time = np.max((1 / config.frame_rate, run_time_per_char)) * len(s.text)
     anim = AddTextLetterByLetter(s, time_per_char=run_time_per_char)
     assert anim.run_time == expected_run_time
+
+
+def test_create_computes_partial_curves_at_once():
+    """Check that Create gives the same result as computing the partial curves
+    of each submobject one by one.
+    """
+    group = VGroup(Square(), Circle(), VMobject(), Line().add(Dot()))
+    anim = Create(group)
+    anim.begin()
+    assert anim._partial_curves is not None
+
+    for alpha in (0.3, 0.7, 1):
+        anim.interpolate(alpha)
+        families = list(anim.get_all_families_zipped())
+        for i, (submobject, starting_submobject) in enumerate(families):
+            expected = submobject.copy().pointwise_become_partial(
+                starting_submobject,
+                0,
+                anim.get_sub_alpha(alpha, i, len(families)),
+            )
+            np.testing.assert_allclose(submobject.points, expected.points)
+
+
+def test_draw_border_then_fill_computes_partial_curves_at_once():
+    group = VGroup(Square(fill_opacity=1), Circle(fill_opacity=1), Triangle())
+    anim = DrawBorderThenFill(group, lag_ratio=0.5)
+    anim.begin()
+    assert anim._partial_curves is not None
+
+    anim.interpolate(0.4)
+    families = list(anim.get_all_families_zipped())
+    for i, (submobject, _, outline) in enumerate(families):
+        sub_alpha = anim.get_sub_alpha(0.4, i, len(families))
+        if sub_alpha < 0.5:
+            expected = outline.copy().pointwise_become_partial(
+                outline, 0, 2 * sub_alpha
+            )
+            np.testing.assert_allclose(submobject.points, expected.points)
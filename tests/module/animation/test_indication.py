@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import Triangle, Wiggle
+from manim.utils.bezier import interpolate
+from manim.utils.rate_functions import there_and_back, wiggle
+
+
+def test_wiggle_resets_points_about_the_current_center():
+    """Test that each frame of a :class:`.Wiggle` starts over from the
+    original points, scaled and rotated about their center.
+    """
+    triangle = Triangle().shift([1, 2, 0])
+    start = triangle.copy()
+    anim = Wiggle(triangle)
+    anim.begin()
+    for alpha in (0.3, 0.6, 0.45):
+        anim.interpolate_submobject(triangle, anim.starting_mobject, alpha)
+        expected = start.copy()
+        expected.scale(
+            interpolate(1, anim.scale_value, there_and_back(alpha)),
+            about_point=start.get_center(),
+        )
+        expected.rotate(
+            wiggle(alpha, anim.n_wiggles) * anim.rotation_angle,
+            about_point=start.get_center(),
+        )
+        np.testing.assert_allclose(triangle.points, expected.points)
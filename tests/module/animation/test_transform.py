@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from manim import (
+    BLUE,
+    DOWN,
+    LEFT,
+    ORIGIN,
+    RED,
+    RIGHT,
+    UP,
+    Arrow,
+    Circle,
+    FadeIn,
+    FadeOut,
+    GrowArrow,
+    GrowFromCenter,
+    GrowFromEdge,
+    GrowFromPoint,
+    Mobject,
+    Square,
+    Transform,
+    VGroup,
+    linear,
+)
+
+
+def test_transform_interpolates_packed_families():
+    """Check that interpolating the packed families of a transform gives the
+    same result as interpolating each member of the family.
+    """
+    source = VGroup(Square(), Circle(color=RED), Square(fill_opacity=1))
+    target = VGroup(
+        Circle().shift(2 * np.array([1.0, 0.0, 0.0])),
+        Square(color=BLUE, stroke_width=8),
+        Circle(fill_opacity=0.5).scale(2),
+    )
+    expected = source.copy()
+    anim = Transform(source, target, path_arc=1, rate_func=linear)
+    anim.begin()
+    assert anim._get_packed_families() is not None
+
+    for alpha in (0.25, 1):
+        anim.interpolate(alpha)
+        zipped = zip(
+            expected.family_members_with_points(),
+            anim.starting_mobject.family_members_with_points(),
+            anim.target_copy.family_members_with_points(),
+        )
+        for mob, start, end in zipped:
+            mob.interpolate(start, end, alpha, anim.path_func)
+        for mob, result in zip(
+            expected.family_members_with_points(),
+            source.family_members_with_points(),
+        ):
+            np.testing.assert_allclose(mob.points, result.points)
+            np.testing.assert_allclose(mob.fill_rgbas, result.fill_rgbas)
+            np.testing.assert_allclose(mob.stroke_rgbas, result.stroke_rgbas)
+            assert mob.stroke_width == result.stroke_width
+
+
+def test_transform_with_lag_ratio_is_not_packed():
+    anim = Transform(
+        VGroup(Square(), Square()), VGroup(Circle(), Circle()), lag_ratio=0.5
+    )
+    anim.begin()
+    assert anim._get_packed_families() is None
+
+
+def test_fade_out_only_interpolates_style():
+    group = VGroup(*(Square(fill_opacity=1).shift(i * RIGHT) for i in range(3)))
+    points = [mob.points.copy() for mob in group]
+    for lag_ratio in (0, 0.5):
+        anim = FadeOut(group.copy(), lag_ratio=lag_ratio)
+        anim.begin()
+        family = anim.mobject.family_members_with_points()
+        assert anim._style_only_submobjects == {id(mob) for mob in family}
+        if lag_ratio == 0:
+            assert "_points" not in anim._get_packed_families().arrays
+
+        anim.interpolate(1)
+        for mob, expected in zip(family, points):
+            np.testing.assert_array_equal(mob.points, expected)
+            assert mob.get_fill_opacity() == 0
+
+
+@pytest.mark.parametrize(
+    ("animation_class", "kwargs", "width", "center"),
+    [
+        (GrowFromCenter, {}, 0.5, ORIGIN),
+        (GrowFromPoint, {"point": 2 * RIGHT}, 0.5, 1.5 * RIGHT),
+        (GrowFromEdge, {"edge": DOWN}, 0.5, 0.75 * DOWN),
+        (FadeIn, {"shift": UP}, 2, 0.75 * DOWN),
+        (FadeIn, {"target_position": 2 * RIGHT}, 2, 1.5 * RIGHT),
+        (FadeIn, {"scale": 0.5}, 1.25, ORIGIN),
+    ],
+)
+def test_transform_to_same_points_moves_from_start(
+    animation_class, kwargs, width, center
+):
+    """Test that animations whose mobject is its own target still move it from
+    the starting mobject.
+    """
+    anim = animation_class(Square(), rate_func=linear, **kwargs)
+    anim.begin()
+    anim.interpolate(0.25)
+    assert anim.mobject.width == pytest.approx(width)
+    np.testing.assert_allclose(anim.mobject.get_center(), center, atol=1e-12)
+
+
+def test_grow_arrow_moves_from_start():
+    arrow = Arrow(LEFT, RIGHT, buff=0)
+    width, center = arrow.width, arrow.get_center()
+    anim = GrowArrow(arrow, rate_func=linear)
+    anim.begin()
+    anim.interpolate(0.25)
+    assert arrow.width == pytest.approx(0.25 * width)
+    np.testing.assert_allclose(
+        arrow.get_center(), LEFT + 0.25 * (center - LEFT), atol=1e-12
+    )
+
+
+def test_fade_out_follows_updaters():
+    square = Square()
+    square.add_updater(lambda mob, dt: mob.shift(dt * RIGHT))
+    anim = FadeOut(square, rate_func=linear)
+    anim.begin()
+    anim.update_mobjects(1)
+    anim.interpolate(0.5)
+    np.testing.assert_allclose(square.get_center(), RIGHT, atol=1e-12)
+
+
+def test_transform_starts_from_family_state():
+    class CopyingTransform(Transform):
+        def create_starting_mobject(self):
+            return self.mobject.copy()
+
+    source = VGroup(Square(), Circle(fill_opacity=1), Square(color=RED))
+    target = VGroup(Circle(), Square(stroke_width=10), Circle(color=BLUE))
+    anim = Transform(source.copy(), target, path_arc=1)
+    copying_anim = CopyingTransform(source.copy(), target, path_arc=1)
+    for a in (anim, copying_anim):
+        a.begin()
+        a.interpolate(0.4)
+    assert not isinstance(anim.starting_mobject, Mobject)
+    assert isinstance(copying_anim.starting_mobject, VGroup)
+
+    for mob, expected in zip(
+        anim.mobject.family_members_with_points(),
+        copying_anim.mobject.family_members_with_points(),
+    ):
+        np.testing.assert_allclose(mob.points, expected.points)
+        np.testing.assert_allclose(mob.fill_rgbas, expected.fill_rgbas)
+        np.testing.assert_allclose(mob.stroke_rgbas, expected.stroke_rgbas)
+
+
+def test_transform_overriding_interpolation_starts_from_copy():
+    class ShiftingTransform(Transform):
+        def interpolate_mobject(self, alpha):
+            super().interpolate_mobject(alpha)
+            self.mobject.move_to(self.starting_mobject.get_center() + alpha * UP)
+
+    anim = ShiftingTransform(Square(), Circle())
+    anim.begin()
+    anim.interpolate(0.5)
+    assert isinstance(anim.starting_mobject, Square)
+    np.testing.assert_allclose(anim.mobject.get_center(), 0.5 * UP, atol=1e-12)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import RIGHT, Dot, ValueTracker, always_redraw
+
+
+def test_memoized_always_redraw():
+    tracker = ValueTracker(0)
+    calls = []
+
+    def draw():
+        calls.append(tracker.get_value())
+        return Dot(tracker.get_value() * RIGHT)
+
+    dot = always_redraw(draw, memoize=True)
+    dot.update()
+    assert calls == [0]
+
+    tracker.set_value(1)
+    dot.update()
+    dot.update()
+    assert calls == [0, 1]
+    np.testing.assert_allclose(dot.get_center(), RIGHT)
+
+    # Values which occurred before reuse the mobject drawn for them
+    tracker.set_value(0)
+    dot.update()
+    assert calls == [0, 1]
+    np.testing.assert_allclose(dot.get_center(), 0)
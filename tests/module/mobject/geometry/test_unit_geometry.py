@@ -4,7 +4,19 @@ import logging
 
 import numpy as np
 
-from manim import BackgroundRectangle, Circle, Sector, Square, SurroundingRectangle
+from manim import (
+    PI,
+    Arc,
+    BackgroundRectangle,
+    Circle,
+    ConvexHull,
+    Dot,
+    RegularPolygram,
+    Sector,
+    Square,
+    SurroundingRectangle,
+)
+from manim.utils.space_ops import regular_vertices
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +27,26 @@ def test_get_arc_center():
     )
 
 
+def test_Arc_points():
+    arc = Arc(radius=2, start_angle=PI / 3, angle=PI, arc_center=[1, 2, 0])
+    np.testing.assert_allclose(
+        np.linalg.norm(np.asarray(arc.get_anchors()) - [1, 2, 0], axis=1), 2
+    )
+    np.testing.assert_allclose(
+        arc.get_start(), [1 + 2 * np.cos(PI / 3), 2 + 2 * np.sin(PI / 3), 0]
+    )
+    # Modifying the points of a dot leaves the next dots unchanged.
+    Dot().points[:] = 0
+    assert np.any(Dot().points)
+
+
+def test_RegularPolygram_vertices():
+    vertices, _ = regular_vertices(5, radius=2)
+    np.testing.assert_allclose(
+        RegularPolygram(5, radius=2).get_vertices(), vertices[[0, 2, 4, 1, 3]]
+    )
+
+
 def test_SurroundingRectangle():
     circle = Circle()
     square = Square()
@@ -53,3 +85,9 @@ def test_changing_Square_side_length_updates_the_square_appropriately():
 def test_Square_side_length_consistent_after_scale_and_rotation():
     sq = Square(side_length=1).scale(3).rotate(np.pi / 4)
     assert np.isclose(sq.side_length, 3)
+
+
+def test_ConvexHull_of_collinear_points():
+    hull = ConvexHull([0, 0, 0], [2, 2, 0], [1, 1, 0], [-1, -1, 0])
+    vertices = sorted(map(tuple, hull.get_vertices()))
+    np.testing.assert_allclose(vertices, [[-1, -1, 0], [2, 2, 0]], atol=1e-12)
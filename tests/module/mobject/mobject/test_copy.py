@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from manim import BraceLabel, Mobject
+import numpy as np
+
+from manim import LEFT, RIGHT, BraceLabel, Mobject, Square
 
 
 def test_mobject_copy():
@@ -18,6 +20,48 @@ def test_mobject_copy():
         assert orig.submobjects[i] is not copy.submobjects[i]
 
 
+def test_copy_keeps_attribute_order():
+    """Test that a copy has its attributes in the same order, which the hashes
+    used for caching depend on, followed by the id of the original.
+    """
+    orig = Square()
+    orig.add(Square())
+    assert list(orig.copy().__dict__) == [*orig.__dict__, "original_id"]
+
+
+def test_copy_shares_points_until_modified():
+    """Test that a copy shares the points of the original until either changes."""
+    orig = Square()
+    copy = orig.copy()
+    assert np.shares_memory(copy.get_points(), orig.get_points())
+
+    copy.points[0] = RIGHT
+    np.testing.assert_allclose(copy.points[0], RIGHT)
+    assert not np.allclose(orig.points[0], RIGHT)
+
+    copy = orig.copy()
+    orig.points += RIGHT
+    np.testing.assert_allclose(orig.points, copy.points + RIGHT)
+
+    copy = orig.copy()
+    copy.shift(RIGHT)
+    np.testing.assert_allclose(orig.points, copy.points - RIGHT)
+
+
+def test_copy_keeps_original_points_writable():
+    """Test that copying does not make the points of the original read-only."""
+    orig = Square()
+    points = orig.points
+    orig.copy()
+    points[0] = RIGHT
+    np.testing.assert_allclose(orig.get_points()[0], RIGHT)
+
+    copy = orig.copy()
+    orig.points[0] = LEFT
+    np.testing.assert_allclose(orig.points[0], LEFT)
+    np.testing.assert_allclose(copy.points[0], RIGHT)
+
+
 def test_bracelabel_copy(tmp_path, config):
     """Test that a copy is a deepcopy."""
     # For this test to work, we need to tweak some folders temporarily
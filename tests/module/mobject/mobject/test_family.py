@@ -59,6 +59,60 @@ def test_overlapping_family():
     assert family.count(gchild_common) == 1
 
 
+def test_family_cache_invalidation():
+    """Check that the cached family follows changes of nested submobjects."""
+    mob, child, gchild, other = Mobject(), Mobject(), Mobject(), Mobject()
+    mob.add(child)
+    assert mob.get_family() == [mob, child]
+
+    child.add(gchild)
+    assert mob.get_family() == [mob, child, gchild]
+
+    child.submobjects = [other]
+    assert mob.get_family() == [mob, child, other]
+    assert child not in gchild.parents
+
+    child.submobjects.append(gchild)
+    assert mob.get_family() == [mob, child, other, gchild]
+
+    child.submobjects.reverse()
+    assert mob.get_family() == [mob, child, gchild, other]
+
+    child.submobjects.clear()
+    assert mob.get_family() == [mob, child]
+    assert gchild.parents == []
+    assert other.parents == []
+
+    mob.remove(child)
+    assert mob.get_family() == [mob]
+    assert child.parents == []
+
+
+def test_modifying_family_keeps_cache():
+    """Check that modifying the returned family leaves the cached one as is."""
+    mob, child, gchild = Mobject(), Mobject(), Mobject()
+    mob.add(child.add(gchild))
+    mob.get_family().append(Mobject())
+    assert mob.get_family() == [mob, child, gchild]
+
+
+def test_family_of_copy():
+    """Check that a copy gets its own family and no links to the original."""
+    parent, mob, child = Mobject(), Mobject(), Mobject()
+    parent.add(mob.add(child))
+    mob_copy = mob.copy()
+
+    assert mob_copy.parents == []
+    copied_child = mob_copy.submobjects[0]
+    assert copied_child is not child
+    assert copied_child.parents == [mob_copy]
+    assert mob_copy.get_family() == [mob_copy, copied_child]
+
+    mob_copy.add(Mobject())
+    assert len(mob.get_family()) == 2
+    assert len(parent.get_family()) == 3
+
+
 def test_shift_family():
     """Check that each member of the family is shifted along with the parent.
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from manim import DL, UR, Circle, Mobject, Rectangle, Square, VGroup
+from manim import DL, LEFT, RIGHT, UP, UR, Circle, Mobject, Rectangle, Square, VGroup
 
 
 def test_mobject_add():
@@ -168,3 +168,80 @@ def test_mobject_dimensions_has_points_and_children():
     assert inner_rect.width == 2
     assert inner_rect.height == 1
     assert inner_rect.depth == 0
+
+
+def test_mobject_bounding_box_follows_changes():
+    square = Square(side_length=2)
+    inner = VGroup(square)
+    outer = VGroup(inner, Circle().shift(3 * LEFT))
+    np.testing.assert_allclose(outer.get_corner(UR), [1, 1, 0])
+
+    # Changes of nested points and of the family reach the ancestors
+    square.shift(RIGHT)
+    np.testing.assert_allclose(outer.get_corner(UR), [2, 1, 0])
+    inner.add(Square().move_to(5 * UP))
+    np.testing.assert_allclose(outer.get_corner(UR), [2, 6, 0])
+    inner.submobjects.pop()
+    np.testing.assert_allclose(outer.get_corner(UR), [2, 1, 0])
+
+    # In-place modifications through Mobject.points are taken into account,
+    # those of arrays obtained earlier after a refresh
+    square.points[:, 0] += 1
+    np.testing.assert_allclose(outer.get_corner(UR), [3, 1, 0])
+    np.testing.assert_allclose(square.get_center(), [2, 0, 0])
+    points = square.points
+    np.testing.assert_allclose(outer.get_corner(UR), [3, 1, 0])
+    points[:, 0] += 1
+    square.refresh_bounding_box()
+    np.testing.assert_allclose(outer.get_corner(UR), [4, 1, 0])
+    np.testing.assert_allclose(outer.get_bounding_box()[2], [4, 1, 0])
+    assert square.width == 2
+
+
+def test_mobject_apply_function_to_family():
+    group = VGroup(Square(), VGroup(Circle().shift(2 * RIGHT), Square().shift(UP)))
+    expected = [2 * mob.points + RIGHT for mob in group.family_members_with_points()]
+
+    group.apply_function(lambda points: 2 * points, vectorized=True)
+    group.apply_function(lambda point: point + RIGHT)
+
+    for mob, points in zip(group.family_members_with_points(), expected):
+        np.testing.assert_allclose(mob.points, points)
+
+
+def test_mobject_updaters_follow_changes():
+    calls = []
+
+    def updater(mob):
+        calls.append((mob, None))
+
+    def time_based_updater(mob, dt):
+        calls.append((mob, dt))
+
+    child, leaf = Mobject(), Mobject()
+    group = Mobject().add(Mobject(), Mobject().add(child.add(leaf)))
+    assert not group.has_family_updaters()
+
+    leaf.add_updater(time_based_updater)
+    child.add_updater(updater, index=0)
+    assert group.has_family_updaters()
+    assert leaf.get_time_based_updaters() == [time_based_updater]
+    group.update(0.5)
+    assert calls == [(child, None), (leaf, 0.5)]
+
+    # In-place modifications of the updaters and of the family are tracked
+    leaf.updaters.clear()
+    assert group.has_family_updaters()
+    child.remove(leaf)
+    child.updaters.append(time_based_updater)
+    assert child.has_time_based_updater()
+    calls.clear()
+    group.update(0.25)
+    assert calls == [(child, None), (child, 0.25)]
+
+    group_copy = group.copy()
+    copied_child = group_copy.submobjects[1].submobjects[0]
+    assert copied_child.get_updaters() == [updater, time_based_updater]
+    group.clear_updaters()
+    assert not group.has_family_updaters()
+    assert group_copy.has_family_updaters()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from manim import Circle, Square
+from manim import RIGHT, Circle, Intersection, Square, Union
 from manim.mobject.geometry.boolean_ops import _BooleanOps
 
 
@@ -56,3 +56,15 @@ def test_vmobject_to_skia_path_and_inverse(test_input):
     new_vmobject = a._convert_skia_path_to_vmobject(path)
     # for some reason there is an extra 4 points in new vmobject than original
     np.testing.assert_allclose(new_vmobject.points[:-4], test_input.points)
+
+
+def test_union_and_intersection_of_many_mobjects():
+    squares = [Square(side_length=1).shift(i * RIGHT) for i in range(7)]
+    union = Union(*squares)
+    assert union.width == pytest.approx(7, abs=1e-5)
+    assert union.height == pytest.approx(1, abs=1e-5)
+
+    squares = [Square(side_length=2).shift(0.1 * i * RIGHT) for i in range(7)]
+    intersection = Intersection(*squares)
+    assert intersection.width == pytest.approx(1.4, abs=1e-5)
+    assert intersection.height == pytest.approx(2, abs=1e-5)
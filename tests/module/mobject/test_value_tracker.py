@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from manim.mobject.value_tracker import ComplexValueTracker, ValueTracker
+from manim.mobject.value_tracker import (
+    ComplexValueTracker,
+    ValueTracker,
+    record_value_trackers,
+)
 
 
 def test_value_tracker_set_value():
@@ -99,3 +103,21 @@ def test_complex_value_tracker_get_value():
     """Test ComplexValueTracker.get_value()"""
     tracker = ComplexValueTracker(2.0 - 3.0j)
     assert tracker.get_value() == 2.0 - 3.0j
+
+
+def test_record_value_trackers():
+    """Test that record_value_trackers() collects the trackers read."""
+    tracker1, tracker2, unused = (
+        ValueTracker(1),
+        ComplexValueTracker(1j),
+        ValueTracker(),
+    )
+    with record_value_trackers() as outer:
+        tracker1.get_value()
+        with record_value_trackers() as inner:
+            tracker2.get_value()
+            tracker1.get_value()
+    assert outer == [tracker1, tracker2]
+    assert inner == [tracker2, tracker1]
+    unused.get_value()
+    assert outer == [tracker1, tracker2]
@@ -2,12 +2,16 @@ from math import cos, sin
 
 import numpy as np
 import pytest
+from scipy.spatial import KDTree
 
 from manim import (
+    RED,
     Circle,
     CurvesAsSubmobjects,
+    DashedVMobject,
     Line,
     Mobject,
+    PackedVGroup,
     Polygon,
     RegularPolygon,
     Square,
@@ -15,7 +19,7 @@ from manim import (
     VGroup,
     VMobject,
 )
-from manim.constants import PI
+from manim.constants import LEFT, ORIGIN, PI, RIGHT, UP
 
 
 def test_vmobject_add():
@@ -120,6 +124,30 @@ def test_vmobject_point_from_proportion():
         obj.point_from_proportion(0)
 
 
+def test_vmobject_points_from_proportions():
+    circle = Circle()
+    alphas = np.linspace(0, 1, 17)
+    np.testing.assert_allclose(
+        circle.points_from_proportions(alphas),
+        [circle.point_from_proportion(alpha) for alpha in alphas],
+    )
+
+    # The cached lengths of the curves follow changes of the points.
+    length = circle.get_arc_length()
+    circle.scale(2)
+    assert circle.get_arc_length() == pytest.approx(2 * length)
+    np.testing.assert_allclose(
+        circle.points_from_proportions([0.5]), [[-2, 0, 0]], atol=1e-8
+    )
+    # Also when the points are modified in place.
+    circle.points[:, 0] *= 2
+    assert circle.get_arc_length() > 2.5 * length
+    np.testing.assert_allclose(circle.point_from_proportion(0.5), [-4, 0, 0], atol=1e-8)
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        circle.points_from_proportions([0.5, 2])
+
+
 def test_curves_as_submobjects_point_from_proportion():
     obj = CurvesAsSubmobjects(VGroup())
 
@@ -429,6 +457,40 @@ def test_vgroup_item_assignment_only_allows_vmobjects():
     )
 
 
+def test_packed_vgroup_matches_vgroup():
+    """Test that a PackedVGroup behaves like a VGroup with the same submobjects."""
+    squares = [Square().shift(i * RIGHT) for i in range(5)]
+    packed = PackedVGroup(*(square.copy() for square in squares))
+    group = VGroup(*squares)
+
+    for mob in packed, group:
+        mob.shift(UP).rotate(PI / 3).scale(0.5)
+        mob.set_fill(RED, opacity=0.5).set_stroke(width=2)
+        mob[2].shift(RIGHT)
+        mob.add(Circle())
+        mob.shift(UP)
+
+    for packed_square, square in zip(packed.get_family(), group.get_family()):
+        np.testing.assert_allclose(packed_square.points, square.points)
+        np.testing.assert_allclose(packed_square.fill_rgbas, square.fill_rgbas)
+        assert packed_square.stroke_width == square.stroke_width
+    np.testing.assert_allclose(packed.get_center(), group.get_center())
+
+
+def test_packed_vgroup_copy():
+    """Test that copies of a PackedVGroup and of its submobjects are independent."""
+    packed = PackedVGroup(Square(), Circle())
+    packed_copy = packed.copy()
+    square_copy = packed[0].copy()
+    packed.shift(RIGHT)
+
+    np.testing.assert_allclose(packed_copy[0].points, square_copy.points)
+    np.testing.assert_allclose(packed[0].points, square_copy.points + RIGHT)
+    np.testing.assert_allclose(
+        packed.get_packed_points(), np.concatenate([m.points for m in packed])
+    )
+
+
 def test_trim_dummy():
     o = VMobject()
     o.start_new_path(np.array([0, 0, 0]))
@@ -457,6 +519,21 @@ def test_trim_dummy():
     assert tuple(map(path_length, o2.get_subpaths())) == (2, 2)
 
 
+def test_align_points_again():
+    """Test that aligning the same points again gives the same result, and
+    that modifying aligned points does not change later alignments.
+    """
+    square, circle = Square(), Circle()
+    square.align_points(circle)
+    expected = square.points.copy(), circle.points.copy()
+    square.points[0] = [5, 5, 5]
+
+    square, circle = Square(), Circle()
+    square.align_points(circle)
+    np.testing.assert_array_equal(square.points, expected[0])
+    np.testing.assert_array_equal(circle.points, expected[1])
+
+
 def test_bounded_become():
     """Tests that align_points generates a bounded number of points.
     https://github.com/ManimCommunity/manim/issues/1959
@@ -526,3 +603,110 @@ def test_proportion_from_point():
     abc.scale(0.8)
     props = [abc.proportion_from_point(p) for p in abc.get_vertices()]
     np.testing.assert_allclose(props, [0, 1 / 3, 2 / 3])
+
+
+def test_append_points_keeps_copies_unchanged():
+    """Test that appending points to a mobject, which may write them to the
+    room left after its points, does not change the points of its copies.
+    """
+    line = VMobject().start_new_path(ORIGIN)
+    for x in range(1, 5):
+        line.add_line_to(x * RIGHT)
+    line_copy = line.copy()
+    expected = line_copy.points.copy()
+    for x in range(5, 10):
+        line.add_line_to(x * RIGHT)
+    line_copy.add_line_to(UP)
+
+    assert line.get_num_curves() == 9
+    np.testing.assert_array_equal(line.get_end(), [9, 0, 0])
+    np.testing.assert_array_equal(line_copy.points[: len(expected)], expected)
+    np.testing.assert_array_equal(line_copy.get_end(), UP)
+
+
+def test_subpaths_follow_points():
+    """Test that the subpaths of a mobject, which are cached, are found again
+    after its points change.
+    """
+    vmob = VMobject()
+    vmob.start_new_path(ORIGIN).add_line_to(RIGHT).add_line_to(UP)
+    vmob.start_new_path(2 * RIGHT).add_line_to(3 * RIGHT)
+    assert [len(subpath) for subpath in vmob.get_subpaths()] == [8, 4]
+    assert [
+        len(subpath) for subpath in vmob.gen_subpaths_from_points_2d(vmob.points)
+    ] == [8, 4]
+
+    vmob.add_line_to(3 * UP)
+    assert [len(subpath) for subpath in vmob.get_subpaths()] == [8, 8]
+    np.testing.assert_array_equal(vmob.get_cubic_bezier_tuples()[-1], vmob.points[-4:])
+
+    # Also when the points are modified in place.
+    vmob.points[4] += UP
+    assert [len(subpath) for subpath in vmob.get_subpaths()] == [4, 4, 8]
+
+
+@pytest.mark.parametrize("vmobject", [Circle(), Line(LEFT, RIGHT)])
+@pytest.mark.parametrize("dash_offset", [0, 0.3, 0.9])
+def test_dashes_as_subpaths(vmobject, dash_offset):
+    """Test that the dashes as subpaths of a single mobject are the same as the
+    dashes as submobjects, also after changing the dash offset.
+    """
+    dashes = DashedVMobject(vmobject, num_dashes=7, dash_offset=dash_offset)
+    subpaths = DashedVMobject(
+        vmobject, num_dashes=7, dashes_as_subpaths=True
+    ).set_dash_offset(dash_offset)
+    np.testing.assert_allclose(
+        subpaths.points,
+        np.concatenate([dash.points for dash in dashes]),
+        atol=1e-12,
+    )
+    assert not subpaths.submobjects
+
+    dashes.set_dash_offset(0.5)
+    expected = DashedVMobject(vmobject, num_dashes=7, dash_offset=0.5)
+    assert len(dashes) == len(expected)
+    for dash, expected_dash in zip(dashes, expected):
+        np.testing.assert_allclose(dash.points, expected_dash.points, atol=1e-12)
+
+
+@pytest.mark.parametrize("dashes_as_subpaths", [False, True])
+def test_set_dash_offset_after_transform(dashes_as_subpaths):
+    """Test that changing the dash offset keeps the transformations applied to
+    the dashes since they were created.
+    """
+    dashes = DashedVMobject(Circle(), dashes_as_subpaths=dashes_as_subpaths)
+    dashes.shift(3 * RIGHT).scale(2, about_point=ORIGIN).rotate(
+        PI / 3, about_point=ORIGIN
+    )
+    dashes.set_dash_offset(0.1)
+    circle = Circle().shift(3 * RIGHT).scale(2, about_point=ORIGIN)
+    expected = DashedVMobject(
+        circle.rotate(PI / 3, about_point=ORIGIN),
+        dash_offset=0.1,
+        dashes_as_subpaths=dashes_as_subpaths,
+    )
+    assert len(dashes.family_members_with_points()) == len(
+        expected.family_members_with_points()
+    )
+    for dash, expected_dash in zip(
+        dashes.family_members_with_points(), expected.family_members_with_points()
+    ):
+        np.testing.assert_allclose(dash.points, expected_dash.points, atol=1e-9)
+
+
+def test_set_dash_offset_after_apply_function():
+    """Test that changing the dash offset approximately keeps deformations
+    applied to the dashes which are not affine.
+    """
+
+    def function(point):
+        return point + 0.3 * point[0] ** 2 * UP
+
+    dashes = DashedVMobject(Circle(), dashes_as_subpaths=True)
+    dashes.apply_function(function)
+    dashes.set_dash_offset(0.1)
+    expected = DashedVMobject(
+        Circle().apply_function(function), dash_offset=0.1, dashes_as_subpaths=True
+    )
+    distances = KDTree(expected.points).query(dashes.points)[0]
+    assert distances.max() < 0.05
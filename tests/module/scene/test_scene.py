@@ -4,7 +4,7 @@ import datetime
 
 import pytest
 
-from manim import Circle, FadeIn, Group, Mobject, Scene, Square
+from manim import Circle, FadeIn, Group, Mobject, Scene, Square, ValueTracker
 from manim.animation.animation import Wait
 
 
@@ -101,3 +101,50 @@ def test_replace(dry_run):
     scene.replace(second, beta)
     assert_names(scene.mobjects, ["alpha", "group", "fourth"])
     assert_names(scene.mobjects[1], ["beta", "third"])
+
+
+def test_scene_dependent_updaters(dry_run):
+    scene = Scene()
+    tracker = ValueTracker(0)
+    driver, label = Mobject(), Mobject()
+    calls = []
+    label.add_updater(lambda mob: calls.append(label), depends_on=[tracker])
+    driver.add_updater(lambda mob: calls.append(driver))
+    tracker.add_updater(lambda mob: calls.append(tracker))
+    scene.add(label, driver, tracker)
+
+    # The label is updated after the tracker, and only if the tracker changed
+    scene.update_mobjects(0)
+    assert calls == [driver, tracker, label]
+    calls.clear()
+    scene.update_mobjects(0)
+    assert calls == [driver, tracker]
+    tracker.set_value(1)
+    calls.clear()
+    scene.update_mobjects(0)
+    assert calls == [driver, tracker, label]
+    assert scene.updater_statistics == [(3, 0), (2, 1), (3, 0)]
+
+    # Without such updaters, the mobjects are simply updated in turn
+    label.clear_updaters()
+    calls.clear()
+    scene.update_mobjects(0)
+    assert calls == [driver, tracker]
+    assert len(scene.updater_statistics) == 3
+
+
+def test_scene_dependent_updaters_respect_update_overrides(dry_run):
+    class CountingMobject(Mobject):
+        def update(self, dt=0, recursive=True):
+            calls.append(self)
+            return super().update(dt, recursive)
+
+    scene = Scene()
+    tracker = ValueTracker(0)
+    counter = CountingMobject()
+    calls = []
+    counter.add_updater(lambda mob: None, depends_on=[tracker])
+    scene.add(counter, tracker)
+
+    scene.update_mobjects(0)
+    assert calls == [counter]
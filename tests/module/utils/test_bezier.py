@@ -10,6 +10,7 @@ from manim.utils.bezier import (
     _get_subdivision_matrix,
     get_quadratic_approximation_of_cubic,
     get_smooth_cubic_bezier_handle_points,
+    get_smooth_cubic_bezier_handle_points_batched,
     interpolate,
     partial_bezier_points,
     split_bezier,
@@ -171,6 +172,29 @@ def test_get_smooth_cubic_bezier_handle_points() -> None:
     )
 
 
+def test_get_smooth_cubic_bezier_handle_points_batched() -> None:
+    """Test that :func:`.get_smooth_cubic_bezier_handle_points_batched` returns
+    the same handles as :func:`.get_smooth_cubic_bezier_handle_points` for each
+    of the splines, whatever their lengths.
+    """
+    rng = np.random.default_rng(0)
+    splines = [rng.random((n_anchors, 3)) for n_anchors in [1, 2, 3, 4, 9, 30, 5]]
+    # Close some of the splines.
+    for spline in splines[2::2]:
+        spline[-1] = spline[0]
+    offsets = np.cumsum([0] + [len(spline) for spline in splines])
+
+    h1, h2 = get_smooth_cubic_bezier_handle_points_batched(
+        np.concatenate(splines), offsets
+    )
+    assert h1.shape == h2.shape == (offsets[-1] - len(splines), 3)
+    for i, spline in enumerate(splines):
+        expected_h1, expected_h2 = get_smooth_cubic_bezier_handle_points(spline)
+        start, end = offsets[i] - i, offsets[i + 1] - i - 1
+        nt.assert_allclose(h1[start:end], np.reshape(expected_h1, (-1, 3)))
+        nt.assert_allclose(h2[start:end], np.reshape(expected_h2, (-1, 3)))
+
+
 def test_get_quadratic_approximation_of_cubic() -> None:
     C = np.array(
         [
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim.utils.polylabel import Polygon, polylabel
+
+
+def test_polylabel_square_with_hole():
+    outer = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+    hole = [[0.5, 0.5], [0.5, 3.5], [2, 3.5], [2, 0.5], [0.5, 0.5]]
+    cell = polylabel([outer], precision=0.001)
+    np.testing.assert_allclose(cell.c, [2, 2], atol=0.01)
+    np.testing.assert_allclose(cell.d, 2, atol=0.001)
+    cell = polylabel([outer, hole], precision=0.001)
+    np.testing.assert_allclose(cell.d, 1, atol=0.001)
+    np.testing.assert_allclose(cell.c[0], 3, atol=0.001)
+
+
+def test_polygon_distances():
+    polygon = Polygon([np.array([[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]])])
+    points = np.array([[1, 1], [0.5, 1], [3, 1], [-1, -1]])
+    distances = polygon.compute_distance(points)
+    np.testing.assert_allclose(distances, [1, 0.5, -1, -np.sqrt(2)])
+    for point, distance in zip(points, distances):
+        assert polygon.compute_distance(point) == distance
+    np.testing.assert_array_equal(polygon.inside(points), [True, True, False, False])
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+
+from manim.utils.profiler import FrameProfiler
+
+
+def test_profiler_aggregates_per_play(tmp_path):
+    profiler = FrameProfiler()
+    profiler.start_play("play 0: Create")
+    for _ in range(3):
+        with profiler.measure("updater", "construct.<locals>.<lambda>"):
+            pass
+    profiler.start_play("play 1: Wait")
+    with profiler.measure("interpolate", "Wait"):
+        pass
+
+    assert [name for name, _ in profiler.plays] == [
+        "setup",
+        "play 0: Create",
+        "play 1: Wait",
+    ]
+    assert profiler.plays[1][1]["updater", "construct.<locals>.<lambda>"][0] == 3
+    summary = profiler.get_summary()
+    assert "play 0: Create" in summary
+    assert "setup" not in summary
+
+    profiler.write_trace(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert len(events) == 4
+    assert {event["cat"] for event in events} == {"updater", "interpolate"}
+
+
+def test_profiler_credits_given_play():
+    profiler = FrameProfiler()
+    profiler.start_play("play 0: Create")
+    play = profiler.current_play
+    profiler.start_play("play 1: Wait")
+    with profiler.measure("encode", "encode_and_write_frame", play):
+        pass
+
+    assert ("encode", "encode_and_write_frame") in profiler.plays[1][1]
+    assert not profiler.plays[2][1]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from manim.utils.qhull import QuickHull
+
+
+def test_quickhull_2d():
+    rng = np.random.default_rng(0)
+    corners = np.array([[0, 0], [2, 0], [2, 1], [0, 1]])
+    points = np.vstack((rng.random((100, 2)) * [2, 1], corners))
+    hull = QuickHull()
+    hull.build(points)
+    facets = hull.simplices[~hull.is_removed]
+    assert len(facets) == 4
+    np.testing.assert_array_equal(np.unique(facets), np.arange(100, 104))
+
+    # The same hull with Facet objects
+    facets = set(hull.facets) - hull.removed
+    assert len(facets) == 4
+    neighbors = hull.neighbors
+    assert all(len(neighbors[sf]) == 2 for facet in facets for sf in facet.subfacets)
+    assert {tuple(point) for facet in facets for point in facet.coordinates} == {
+        tuple(corner) for corner in corners
+    }
+    assert all(eye is None for _, eye in hull.outside.values())
+    assert len(hull.unclaimed) == len(points)
+
+
+def test_quickhull_3d():
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(500, 3))
+    hull = QuickHull()
+    hull.build(points)
+    alive = ~hull.is_removed
+    # No point is outside of a facet of the hull, and every facet has a
+    # neighbor across each of its edges.
+    distances = points @ hull.normals[alive].T - hull.offsets[alive]
+    assert np.all(distances <= hull.tolerance)
+    assert not np.any(hull.is_removed[hull.adjacency[alive]])
+    num_vertices = len(np.unique(hull.simplices[alive]))
+    assert np.count_nonzero(alive) == 2 * num_vertices - 4
+
+
+def test_quickhull_not_enough_points():
+    with pytest.raises(ValueError):
+        QuickHull().build(np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        QuickHull().build(np.zeros((3, 1)))
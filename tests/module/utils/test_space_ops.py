@@ -121,3 +121,14 @@ def test_polar_coords():
     np.testing.assert_array_equal(
         np.round(spherical_to_cartesian(b), 4), np.array([0, 2, 0])
     )
+
+
+def test_earclip_triangulation_with_holes():
+    outer = [[0, 0, 0], [4, 0, 0], [4, 4, 0], [0, 4, 0]]
+    holes = [[[x, 1, 0], [x, 2, 0], [x + 1, 2, 0], [x + 1, 1, 0]] for x in (0.5, 2.5)]
+    verts = np.array(outer + holes[0] + holes[1], dtype=float)
+    triangles = verts[earclip_triangulation(verts, [4, 8, 12])].reshape(-1, 3, 3)
+    sides1 = triangles[:, 1] - triangles[:, 0]
+    sides2 = triangles[:, 2] - triangles[:, 0]
+    areas = np.abs(np.cross(sides1, sides2)[:, 2]) / 2
+    assert areas.sum() == pytest.approx(14)